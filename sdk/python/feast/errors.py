@@ -217,3 +217,19 @@ class ConflictingFeatureViewNames(Exception):
         super().__init__(
             f"The feature view name: {feature_view_name} refers to both an on-demand feature view and a feature view"
         )
+
+
+class ReservedFeatureNameError(Exception):
+    def __init__(self, feature_view_name: str, feature_names: List[str]):
+        super().__init__(
+            f"The features {feature_names} of the feature view {feature_view_name} collide with columns which the "
+            f"online store reserves for itself. Rename them, or use another table layout."
+        )
+
+
+class DynamoDBRetriesExhaustedError(Exception):
+    def __init__(self, operation: str, table_names: List[str], attempts: int):
+        super().__init__(
+            f"DynamoDB {operation} requests to the tables {table_names} did not complete after {attempts} attempts, "
+            f"because their throughput was exceeded."
+        )
@@ -39,8 +39,10 @@ def get_app(store: "feast.FeatureStore"):
                 for idx in range(num_entities)
             ]
 
-            response_proto = store.get_online_features(
-                features, entity_rows, full_feature_names=full_feature_names
+            response_proto = (
+                await store.get_online_features_async(
+                    features, entity_rows, full_feature_names=full_feature_names
+                )
             ).proto
 
             # Convert the Protobuf object to JSON and return it
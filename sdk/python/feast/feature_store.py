@@ -11,14 +11,31 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import os
+import threading
 import warnings
 from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
+import pyarrow
 from colorama import Fore, Style
 from tqdm import tqdm
 
@@ -36,22 +53,41 @@ from feast.inference import (
     update_data_sources_with_inferred_event_timestamp_col,
     update_entities_with_inferred_types_from_feature_views,
 )
+from feast.infra.caching_provider import CachingProvider, OnlineCacheStats
 from feast.infra.provider import Provider, RetrievalJob, get_provider
 from feast.on_demand_feature_view import OnDemandFeatureView
-from feast.online_response import OnlineResponse, _infer_online_entity_rows
+from feast.online_response import (
+    ColumnarOnlineResponse,
+    OnlineResponse,
+    _infer_online_entity_rows,
+)
 from feast.protos.feast.serving.ServingService_pb2 import (
     GetOnlineFeaturesRequestV2,
     GetOnlineFeaturesResponse,
 )
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.registry import Registry
 from feast.repo_config import RepoConfig, load_repo_config
-from feast.type_map import python_value_to_proto_value
+from feast.type_map import (
+    _proto_value_to_python_value,
+    _python_value_to_proto_value,
+    feast_value_type_to_pa,
+    python_type_to_feast_value_type,
+    python_value_to_proto_value,
+)
 from feast.usage import log_exceptions, log_exceptions_and_usage
+from feast.value_type import ValueType
 from feast.version import get_version
 
+if TYPE_CHECKING:
+    from feast.infra.online_stores.tiered import OnlineTierStats
+
 warnings.simplefilter("once", DeprecationWarning)
 
+# Maximum number of distinct feature lists (or feature services) whose online retrieval plan is kept in memory
+_MAX_CACHED_ONLINE_RETRIEVAL_PLANS = 256
+
 
 class FeatureStore:
     """
@@ -63,9 +99,10 @@ class FeatureStore:
         config (optional): Configuration object used to configure the feature store.
     """
 
-    config: RepoConfig
     repo_path: Path
+    _config: RepoConfig
     _registry: Registry
+    _provider: Optional[Provider]
 
     @log_exceptions
     def __init__(
@@ -79,6 +116,12 @@ class FeatureStore:
         """
         if repo_path is not None and config is not None:
             raise ValueError("You cannot specify both repo_path and config.")
+        self._provider = None
+        self._provider_lock = threading.Lock()
+        self._online_read_executor: Optional[ThreadPoolExecutor] = None
+        self._online_retrieval_plans = _OnlineRetrievalPlanCache(
+            _MAX_CACHED_ONLINE_RETRIEVAL_PLANS
+        )
         if config is not None:
             self.repo_path = Path(os.getcwd())
             self.config = config
@@ -100,6 +143,17 @@ class FeatureStore:
         """Returns the version of the current Feast SDK/CLI."""
         return get_version()
 
+    @property
+    def config(self) -> RepoConfig:
+        """Gets the configuration of this feature store."""
+        return self._config
+
+    @config.setter
+    def config(self, config: RepoConfig):
+        """Sets the configuration of this feature store, closing the provider built from the previous one."""
+        self._config = config
+        self._reset_provider()
+
     @property
     def registry(self) -> Registry:
         """Gets the registry of this feature store."""
@@ -111,8 +165,95 @@ class FeatureStore:
         return self.config.project
 
     def _get_provider(self) -> Provider:
-        # TODO: Bake self.repo_path into self.config so that we dont only have one interface to paths
-        return get_provider(self.config, self.repo_path)
+        """
+        Returns the provider of this feature store. The provider (and the online store it holds) is built once
+        and reused across calls, so that connections to the online store are not reopened for every request.
+        """
+        provider = self._provider
+        if provider is None:
+            with self._provider_lock:
+                provider = self._provider
+                if provider is None:
+                    # TODO: Bake self.repo_path into self.config so that we dont only have one interface to paths
+                    provider = get_provider(self.config, self.repo_path)
+                    self._provider = provider
+        return provider
+
+    def _get_online_read_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool used to read feature views concurrently. Like the provider, the pool is built once
+        and reused across calls.
+        """
+        executor = self._online_read_executor
+        if executor is None:
+            with self._provider_lock:
+                executor = self._online_read_executor
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self.config.online_serving.max_concurrent_reads,
+                        thread_name_prefix="feast_online_read",
+                    )
+                    self._online_read_executor = executor
+        return executor
+
+    def _reset_provider(self):
+        with self._provider_lock:
+            provider, self._provider = self._provider, None
+            executor, self._online_read_executor = self._online_read_executor, None
+        if executor is not None:
+            # Reads which are still in flight are allowed to complete
+            executor.shutdown(wait=False)
+        if provider is not None:
+            provider.close()
+
+    @log_exceptions
+    def close(self):
+        """
+        Closes the connections held by this feature store, e.g. to the online store. The feature store can
+        still be used afterwards, in which case new connections are opened lazily.
+        """
+        self._reset_provider()
+
+    def __enter__(self) -> "FeatureStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @log_exceptions
+    def get_online_cache_stats(self) -> Optional[OnlineCacheStats]:
+        """
+        Returns the hit, miss, eviction and rejection counters of the in-process cache of online features, or None if
+        there is none. The cache is set by online_serving.cache in the repo config, or is the hot tier of a tiered
+        online store. The counters are reset when the feature store is closed.
+        """
+        # Like the other online stores, the tiered online store is not imported with the feature store
+        from feast.infra.online_stores.tiered import TieredOnlineStore
+
+        provider = self._get_provider()
+        if isinstance(provider, CachingProvider):
+            return provider.cache_stats()
+        online_store = getattr(provider, "online_store", None)
+        if isinstance(online_store, TieredOnlineStore):
+            return online_store.cache_stats()
+        return None
+
+    @log_exceptions
+    def get_online_tier_stats(self) -> Optional[Dict[str, "OnlineTierStats"]]:
+        """
+        Returns the read counters and latencies of the "hot" and "remote" tiers of the online store, or None if
+        the online store is not a tiered online store. The hits of the hot tier are counted by
+        get_online_cache_stats. The counters are reset when the feature store is closed.
+        """
+        from feast.infra.online_stores.tiered import TieredOnlineStore
+
+        provider = self._get_provider()
+        if isinstance(provider, CachingProvider):
+            provider = provider.provider
+        online_store = getattr(provider, "online_store", None)
+        if isinstance(online_store, TieredOnlineStore):
+            return online_store.tier_stats()
+        return None
 
     @log_exceptions_and_usage
     def refresh_registry(self):
@@ -720,20 +861,85 @@ class FeatureStore:
             ... )
             >>> online_response_dict = online_response.to_dict()
         """
-        _feature_refs = self._get_features(features, feature_refs)
+        plan = self._get_online_retrieval_plan(
+            features, feature_refs, full_feature_names
+        )
+        entity_keys_per_view, result_rows = self._get_online_entity_keys(
+            plan, entity_rows
+        )
+        read_rows_per_view = self._read_feature_views(
+            self._get_provider(), plan.view_plans, entity_keys_per_view
+        )
+        return self._build_online_response(plan, result_rows, read_rows_per_view)
+
+    @log_exceptions_and_usage
+    async def get_online_features_async(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_rows: List[Dict[str, Any]],
+        feature_refs: Optional[List[str]] = None,
+        full_feature_names: bool = False,
+    ) -> OnlineResponse:
+        """
+        Retrieves the latest online feature data, without blocking the running event loop.
+
+        This is the asynchronous version of get_online_features, and takes the same arguments. The feature views
+        are read from the online store concurrently. Online stores with a native asyncio client use it, the
+        reads of other online stores are run in the default executor of the event loop.
 
+        Note that loading the registry (when it is first used, or when its cache has expired) is still blocking.
+
+        Returns:
+            OnlineResponse containing the feature data in records.
+
+        Raises:
+            Exception: No entity with the specified name exists.
+
+        Examples:
+            >>> from feast import FeatureStore
+            >>> fs = FeatureStore(repo_path="feature_repo")
+            >>> import asyncio
+            >>> online_response = asyncio.run(
+            ...     fs.get_online_features_async(
+            ...         features=["driver_hourly_stats:conv_rate"],
+            ...         entity_rows=[{"driver_id": 1001}, {"driver_id": 1002}],
+            ...     )
+            ... )
+            >>> online_response_dict = online_response.to_dict()
+        """
+        plan = self._get_online_retrieval_plan(
+            features, feature_refs, full_feature_names
+        )
+        entity_keys_per_view, result_rows = self._get_online_entity_keys(
+            plan, entity_rows
+        )
         provider = self._get_provider()
-        entities = self.list_entities(allow_cache=True)
-        entity_name_to_join_key_map = {}
-        for entity in entities:
-            entity_name_to_join_key_map[entity.name] = entity.join_key
+        read_rows_per_view = await asyncio.gather(
+            *[
+                provider.online_read_async(
+                    config=self.config,
+                    table=view_plan.table,
+                    entity_keys=entity_keys,
+                    requested_features=view_plan.requested_features,
+                )
+                for view_plan, entity_keys in zip(plan.view_plans, entity_keys_per_view)
+            ]
+        )
+        return self._build_online_response(plan, result_rows, read_rows_per_view)
 
+    def _get_online_entity_keys(
+        self, plan: "_OnlineRetrievalPlan", entity_rows: List[Dict[str, Any]]
+    ) -> Tuple[List[List[EntityKeyProto]], List[GetOnlineFeaturesResponse.FieldValues]]:
+        """
+        Builds the entity keys to read from each feature view of the plan, and the response rows holding the entity
+        values, from the entity rows passed to get_online_features.
+        """
         join_key_rows = []
         for row in entity_rows:
             join_key_row = {}
             for entity_name, entity_value in row.items():
                 try:
-                    join_key = entity_name_to_join_key_map[entity_name]
+                    join_key = plan.entity_name_to_join_key_map[entity_name]
                 except KeyError:
                     raise EntityNotFoundException(entity_name, self.project)
                 join_key_row[join_key] = entity_value
@@ -748,43 +954,35 @@ class FeatureStore:
             union_of_entity_keys.append(_entity_row_to_key(entity_row_proto))
             result_rows.append(_entity_row_to_field_values(entity_row_proto))
 
-        all_feature_views = self._registry.list_feature_views(
-            project=self.project, allow_cache=True
-        )
-        _validate_feature_refs(_feature_refs, full_feature_names)
-        grouped_refs = _group_feature_refs(_feature_refs, all_feature_views)
-        for table, requested_features in grouped_refs:
-            entity_keys = _get_table_entity_keys(
-                table, union_of_entity_keys, entity_name_to_join_key_map
-            )
-            read_rows = provider.online_read(
-                config=self.config,
-                table=table,
-                entity_keys=entity_keys,
-                requested_features=requested_features,
+        entity_keys_per_view = [
+            _get_table_entity_keys(
+                view_plan.table, union_of_entity_keys, view_plan.join_keys
             )
+            for view_plan in plan.view_plans
+        ]
+        return entity_keys_per_view, result_rows
+
+    def _build_online_response(
+        self,
+        plan: "_OnlineRetrievalPlan",
+        result_rows: List[GetOnlineFeaturesResponse.FieldValues],
+        read_rows_per_view: Sequence[
+            List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]
+        ],
+    ) -> OnlineResponse:
+        for view_plan, read_rows in zip(plan.view_plans, read_rows_per_view):
             for row_idx, read_row in enumerate(read_rows):
                 row_ts, feature_data = read_row
                 result_row = result_rows[row_idx]
 
                 if feature_data is None:
-                    for feature_name in requested_features:
-                        feature_ref = (
-                            f"{table.name}__{feature_name}"
-                            if full_feature_names
-                            else feature_name
-                        )
+                    for _, feature_ref in view_plan.output_names:
                         result_row.statuses[
                             feature_ref
                         ] = GetOnlineFeaturesResponse.FieldStatus.NOT_FOUND
                 else:
-                    for feature_name in feature_data:
-                        feature_ref = (
-                            f"{table.name}__{feature_name}"
-                            if full_feature_names
-                            else feature_name
-                        )
-                        if feature_name in requested_features:
+                    for feature_name, feature_ref in view_plan.output_names:
+                        if feature_name in feature_data:
                             result_row.fields[feature_ref].CopyFrom(
                                 feature_data[feature_name]
                             )
@@ -796,43 +994,303 @@ class FeatureStore:
             GetOnlineFeaturesResponse(field_values=result_rows)
         )
         return self._augment_response_with_on_demand_transforms(
-            _feature_refs, full_feature_names, initial_response, result_rows
+            plan, initial_response, result_rows
         )
 
-    def _augment_response_with_on_demand_transforms(
+    @log_exceptions_and_usage
+    def get_online_features_columnar(
+        self,
+        features: Union[List[str], FeatureService],
+        entities: Dict[str, Union[Sequence[Any], np.ndarray, pyarrow.Array]],
+        full_feature_names: bool = False,
+    ) -> ColumnarOnlineResponse:
+        """
+        Retrieves the latest online feature data for a batch of entities laid out in columns.
+
+        This returns the same data as get_online_features, but takes one array of values per entity instead
+        of one dictionary per entity row, and returns one array per feature instead of one proto message per
+        row. This avoids building per-row Python objects, which dominates the cost of retrieving features for
+        large batches of entities. Entity keys which appear several times in a batch are only read once.
+
+        Args:
+            features: List of feature references that will be returned for each entity, or a feature service.
+                Each feature reference should have the following format:
+                "feature_view:feature" where "feature_view" & "feature" refer to
+                the feature and feature view names respectively.
+            entities: A dictionary from entity name to the values of that entity, one value per entity row.
+                Values may be given as any sequence, a NumPy array or an Arrow array, and all of them
+                must have the same length.
+            full_feature_names: If True, feature names will be prefixed with the corresponding feature view
+                name, changing them from the format "feature" to "feature_view__feature".
+
+        Returns:
+            ColumnarOnlineResponse containing one array per entity join key and per feature, along with the
+            status of each feature value. It can be converted to an Arrow table or to NumPy arrays.
+
+        Raises:
+            EntityNotFoundException: No entity with the specified name exists.
+            ValueError: The entity arrays have different lengths, or an entity required by one of the
+                requested features is missing.
+
+        Examples:
+            >>> from feast import FeatureStore
+            >>> fs = FeatureStore(repo_path="feature_repo")
+            >>> online_response = fs.get_online_features_columnar(
+            ...     features=[
+            ...         "driver_hourly_stats:conv_rate",
+            ...         "driver_hourly_stats:acc_rate",
+            ...     ],
+            ...     entities={"driver_id": np.array([1001, 1002, 1003, 1004])},
+            ... )
+            >>> table = online_response.to_arrow()
+        """
+        plan = self._get_online_retrieval_plan(features, None, full_feature_names)
+        provider = self._get_provider()
+
+        entity_columns: Dict[str, pyarrow.Array] = {}
+        for entity_name, entity_values in entities.items():
+            try:
+                join_key = plan.entity_name_to_join_key_map[entity_name]
+            except KeyError:
+                raise EntityNotFoundException(entity_name, self.project)
+            entity_columns[join_key] = _to_arrow_array(entity_values)
+
+        num_rows = {len(column) for column in entity_columns.values()}
+        if len(num_rows) > 1:
+            raise ValueError(
+                f"All entities must have the same number of values, got {sorted(num_rows)}"
+            )
+
+        join_key_values = {
+            join_key: _ColumnarJoinKeyValues.from_arrow(join_key, column)
+            for join_key, column in entity_columns.items()
+        }
+
+        columns: Dict[str, pyarrow.Array] = dict(entity_columns)
+        statuses: Dict[str, np.ndarray] = {}
+        entity_keys_per_view, row_to_key_idx_per_view = [], []
+        for view_plan in plan.view_plans:
+            entity_keys, row_to_key_idx = _get_columnar_table_entity_keys(
+                view_plan.table, join_key_values, view_plan.join_keys
+            )
+            entity_keys_per_view.append(entity_keys)
+            row_to_key_idx_per_view.append(row_to_key_idx)
+        read_rows_per_view = self._read_feature_views(
+            provider, plan.view_plans, entity_keys_per_view
+        )
+
+        for view_plan, read_rows, row_to_key_idx in zip(
+            plan.view_plans, read_rows_per_view, row_to_key_idx_per_view
+        ):
+            row_to_read_row = pyarrow.array(row_to_key_idx)
+            feature_types = {
+                feature.name: feature.dtype for feature in view_plan.table.features
+            }
+            for feature_name, feature_ref in view_plan.output_names:
+                values, value_statuses = _read_rows_to_column(read_rows, feature_name)
+                value_type = feature_types.get(feature_name, ValueType.UNKNOWN)
+                # The arrow type of features without a known value type is inferred from their values
+                arrow_type = (
+                    feast_value_type_to_pa(value_type)
+                    if value_type != ValueType.UNKNOWN
+                    else None
+                )
+                column = pyarrow.array(values, type=arrow_type)
+                columns[feature_ref] = column.take(row_to_read_row)
+                statuses[feature_ref] = value_statuses[row_to_key_idx]
+
+        if plan.on_demand_feature_views:
+            initial_df = (
+                ColumnarOnlineResponse(columns, statuses).to_arrow().to_pandas()
+            )
+            for odfv in plan.on_demand_feature_views:
+                transformed_features_df = odfv.get_transformed_features_df(
+                    plan.full_feature_names, initial_df
+                )
+                # TODO(adchia): support multiple output features in an ODFV, which requires different naming
+                #  conventions
+                columns[odfv.name] = pyarrow.array(
+                    transformed_features_df[odfv.features[0].name].values
+                )
+                statuses[odfv.name] = np.full(
+                    len(initial_df),
+                    GetOnlineFeaturesResponse.FieldStatus.PRESENT,
+                    dtype=np.int8,
+                )
+
+        return ColumnarOnlineResponse(columns, statuses)
+
+    def _read_feature_views(
+        self,
+        provider: Provider,
+        view_plans: List["_FeatureViewReadPlan"],
+        entity_keys_per_view: List[List[EntityKeyProto]],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Reads the requested features of each feature view from the online store, for the entity keys of that view.
+        Feature views which have the same join keys are read together with a single online_read_many call, so that
+        online stores which co-locate them can read them in a single request. Depending on the online serving
+        configuration, the groups of feature views are read one after the other or concurrently.
+        """
+        view_groups = _group_views_by_join_keys(view_plans)
+
+        def read(
+            view_group: List[int],
+        ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+            # All the feature views of a group have the same entity keys
+            entity_keys = entity_keys_per_view[view_group[0]]
+            if len(view_group) == 1:
+                view_plan = view_plans[view_group[0]]
+                return [
+                    provider.online_read(
+                        config=self.config,
+                        table=view_plan.table,
+                        entity_keys=entity_keys,
+                        requested_features=view_plan.requested_features,
+                    )
+                ]
+            return provider.online_read_many(
+                config=self.config,
+                tables=[
+                    (view_plans[idx].table, view_plans[idx].requested_features)
+                    for idx in view_group
+                ],
+                entity_keys=entity_keys,
+            )
+
+        if self.config.online_serving.read_mode == "sequential" or len(view_groups) < 2:
+            read_rows_per_group = [read(view_group) for view_group in view_groups]
+        else:
+            executor = self._get_online_read_executor()
+            futures = [executor.submit(read, view_group) for view_group in view_groups]
+            read_rows_per_group = [future.result() for future in futures]
+
+        read_rows_per_view: List[
+            List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]
+        ] = [[] for _ in view_plans]
+        for view_group, group_read_rows in zip(view_groups, read_rows_per_group):
+            for idx, read_rows in zip(view_group, group_read_rows):
+                read_rows_per_view[idx] = read_rows
+        return read_rows_per_view
+
+    def _get_online_retrieval_plan(
         self,
-        feature_refs: List[str],
+        features: Optional[Union[List[str], FeatureService]],
+        feature_refs: Optional[List[str]],
         full_feature_names: bool,
+    ) -> "_OnlineRetrievalPlan":
+        """
+        Returns the plan used to retrieve the given features from the online store. Plans are cached per feature
+        list (or feature service) until the registry changes.
+        """
+        _features = features or feature_refs
+        if not _features:
+            raise ValueError("No features specified for retrieval")
+
+        cache_key: Hashable
+        if isinstance(_features, FeatureService):
+            cache_key = (FeatureService, _features.name, full_feature_names)
+        else:
+            cache_key = (tuple(_features), full_feature_names)
+
+        registry_objects = self._registry._get_object_cache()
+        plan = self._online_retrieval_plans.get(cache_key, registry_objects)
+        if plan is None:
+            plan = self._build_online_retrieval_plan(_features, full_feature_names)
+            self._online_retrieval_plans.put(cache_key, registry_objects, plan)
+        return plan
+
+    def _build_online_retrieval_plan(
+        self, features: Union[List[str], FeatureService], full_feature_names: bool,
+    ) -> "_OnlineRetrievalPlan":
+        _feature_refs: List[str]
+        if isinstance(features, FeatureService):
+            # Get the latest value of the feature service, in case the object passed in has been updated underneath us.
+            _feature_refs = _get_feature_refs_from_feature_services(
+                self._registry.get_feature_service(
+                    features.name, self.project, allow_cache=True
+                )
+            )
+        else:
+            _feature_refs = features
+
+        entities = self._registry.list_entities(self.project, allow_cache=True)
+        entity_name_to_join_key_map = {}
+        for entity in entities:
+            entity_name_to_join_key_map[entity.name] = entity.join_key
+
+        all_feature_views = self._registry.list_feature_views(
+            project=self.project, allow_cache=True
+        )
+        _validate_feature_refs(_feature_refs, full_feature_names)
+        grouped_refs = _group_feature_refs(_feature_refs, all_feature_views)
+
+        view_plans = []
+        for table, requested_features in grouped_refs:
+            output_names = [
+                (
+                    feature_name,
+                    f"{table.name}__{feature_name}"
+                    if full_feature_names
+                    else feature_name,
+                )
+                for feature_name in requested_features
+            ]
+            view_plans.append(
+                _FeatureViewReadPlan(
+                    table=table,
+                    requested_features=requested_features,
+                    output_names=output_names,
+                    join_keys=[
+                        entity_name_to_join_key_map[entity_name]
+                        for entity_name in table.entities
+                    ],
+                )
+            )
+
+        on_demand_feature_views = [
+            odfv
+            for odfv in self._registry.list_on_demand_feature_views(
+                project=self.project, allow_cache=True
+            )
+            if odfv.name in _feature_refs
+        ]
+
+        return _OnlineRetrievalPlan(
+            feature_refs=_feature_refs,
+            full_feature_names=full_feature_names,
+            entity_name_to_join_key_map=entity_name_to_join_key_map,
+            view_plans=view_plans,
+            on_demand_feature_views=on_demand_feature_views,
+        )
+
+    def _augment_response_with_on_demand_transforms(
+        self,
+        plan: "_OnlineRetrievalPlan",
         initial_response: OnlineResponse,
         result_rows: List[GetOnlineFeaturesResponse.FieldValues],
     ) -> OnlineResponse:
-        all_on_demand_feature_views = self._registry.list_on_demand_feature_views(
-            project=self.project, allow_cache=True
-        )
-        if len(all_on_demand_feature_views) == 0:
+        if len(plan.on_demand_feature_views) == 0:
             return initial_response
         initial_response_df = initial_response.to_df()
         # Apply on demand transformations
-        for odfv in all_on_demand_feature_views:
+        for odfv in plan.on_demand_feature_views:
             feature_ref = odfv.name
-            if feature_ref in feature_refs:
-                transformed_features_df = odfv.get_transformed_features_df(
-                    full_feature_names, initial_response_df
-                )
-                for row_idx in range(len(result_rows)):
-                    result_row = result_rows[row_idx]
-                    # TODO(adchia): support multiple output features in an ODFV, which requires different naming
-                    #  conventions
-                    result_row.fields[odfv.name].CopyFrom(
-                        python_value_to_proto_value(
-                            transformed_features_df[odfv.features[0].name].values[
-                                row_idx
-                            ]
-                        )
+            transformed_features_df = odfv.get_transformed_features_df(
+                plan.full_feature_names, initial_response_df
+            )
+            for row_idx in range(len(result_rows)):
+                result_row = result_rows[row_idx]
+                # TODO(adchia): support multiple output features in an ODFV, which requires different naming
+                #  conventions
+                result_row.fields[odfv.name].CopyFrom(
+                    python_value_to_proto_value(
+                        transformed_features_df[odfv.features[0].name].values[row_idx]
                     )
-                    result_row.statuses[
-                        feature_ref
-                    ] = GetOnlineFeaturesResponse.FieldStatus.PRESENT
+                )
+                result_row.statuses[
+                    feature_ref
+                ] = GetOnlineFeaturesResponse.FieldStatus.PRESENT
         return OnlineResponse(GetOnlineFeaturesResponse(field_values=result_rows))
 
     @log_exceptions_and_usage
@@ -928,9 +1386,8 @@ def _get_feature_refs_from_feature_services(
 
 
 def _get_table_entity_keys(
-    table: FeatureView, entity_keys: List[EntityKeyProto], join_key_map: Dict[str, str],
+    table: FeatureView, entity_keys: List[EntityKeyProto], table_join_keys: List[str],
 ) -> List[EntityKeyProto]:
-    table_join_keys = [join_key_map[entity_name] for entity_name in table.entities]
     required_entities = OrderedDict.fromkeys(sorted(table_join_keys))
     entity_key_protos = []
     for entity_key in entity_keys:
@@ -963,6 +1420,170 @@ def _get_table_entity_keys(
     return entity_key_protos
 
 
+def _group_views_by_join_keys(
+    view_plans: List["_FeatureViewReadPlan"],
+) -> List[List[int]]:
+    """Groups the indexes of the feature views which have the same join keys, in order of first appearance"""
+    view_groups: Dict[Tuple[str, ...], List[int]] = {}
+    for idx, view_plan in enumerate(view_plans):
+        view_groups.setdefault(tuple(sorted(view_plan.join_keys)), []).append(idx)
+    return list(view_groups.values())
+
+
+def _to_arrow_array(
+    values: Union[Sequence[Any], np.ndarray, pyarrow.Array, pyarrow.ChunkedArray]
+) -> pyarrow.Array:
+    if isinstance(values, pyarrow.ChunkedArray):
+        return values.combine_chunks()
+    if isinstance(values, pyarrow.Array):
+        return values
+    return pyarrow.array(values)
+
+
+@dataclass(frozen=True)
+class _ColumnarJoinKeyValues:
+    """The values of a join key passed to get_online_features_columnar, along with their Feast value type"""
+
+    values: List[Any]
+    value_type: Optional[ValueType]
+
+    @classmethod
+    def from_arrow(cls, join_key: str, column: pyarrow.Array):
+        # Convert to native Python values first, so that the value type is inferred in the same way as for the
+        # entity rows passed to get_online_features (e.g. NumPy int32 values are looked up as INT64 keys).
+        values = column.to_pylist()
+        value_type = next(
+            (
+                python_type_to_feast_value_type(join_key, value)
+                for value in values
+                if value is not None
+            ),
+            None,
+        )
+        return cls(values=values, value_type=value_type)
+
+
+def _get_columnar_table_entity_keys(
+    table: FeatureView,
+    join_key_values: Dict[str, _ColumnarJoinKeyValues],
+    table_join_keys: List[str],
+) -> Tuple[List[EntityKeyProto], np.ndarray]:
+    """
+    Builds the distinct entity keys of a table from the columns of entity values. Also returns the index of the
+    entity key of each row.
+    """
+    sorted_join_keys = sorted(table_join_keys)
+    for join_key in sorted_join_keys:
+        if join_key not in join_key_values:
+            raise ValueError(
+                f"Table {table.name} expects entity field {table_join_keys}. No entity value was found for "
+                f"{join_key}"
+            )
+    key_columns = [join_key_values[join_key] for join_key in sorted_join_keys]
+
+    entity_keys: List[EntityKeyProto] = []
+    key_indexes: Dict[Tuple[Any, ...], int] = {}
+    row_to_key_idx = []
+    for key in zip(*[key_column.values for key_column in key_columns]):
+        key_idx = key_indexes.get(key)
+        if key_idx is None:
+            key_idx = key_indexes[key] = len(entity_keys)
+            entity_keys.append(
+                EntityKeyProto(
+                    join_keys=sorted_join_keys,
+                    entity_values=[
+                        _python_value_to_proto_value(key_column.value_type, value)
+                        for key_column, value in zip(key_columns, key)
+                    ],
+                )
+            )
+        row_to_key_idx.append(key_idx)
+    return entity_keys, np.array(row_to_key_idx, dtype=np.int64)
+
+
+def _read_rows_to_column(
+    read_rows: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]],
+    feature_name: str,
+) -> Tuple[List[Any], np.ndarray]:
+    """Extracts the values of a single feature from the rows read from the online store, along with their status"""
+    values = []
+    statuses = np.full(
+        len(read_rows), GetOnlineFeaturesResponse.FieldStatus.NOT_FOUND, dtype=np.int8
+    )
+    for row_idx, (_, feature_data) in enumerate(read_rows):
+        value = None
+        if feature_data is not None and feature_name in feature_data:
+            value = _proto_value_to_python_value(feature_data[feature_name])
+            statuses[row_idx] = (
+                GetOnlineFeaturesResponse.FieldStatus.PRESENT
+                if value is not None
+                else GetOnlineFeaturesResponse.FieldStatus.NULL_VALUE
+            )
+        values.append(value)
+    return values, statuses
+
+
+@dataclass(frozen=True)
+class _FeatureViewReadPlan:
+    """The features to read from a single feature view, and the names under which they are returned"""
+
+    table: FeatureView
+    requested_features: List[str]
+    output_names: List[Tuple[str, str]]  # (feature name, name in the response)
+    join_keys: List[str]
+
+
+@dataclass(frozen=True)
+class _OnlineRetrievalPlan:
+    """
+    Everything get_online_features derives from the registry for a given list of features. A plan is built once
+    per distinct feature list (or feature service) and reused until the registry changes, so that serving a
+    request only requires building entity keys and reading from the online store.
+    """
+
+    feature_refs: List[str]
+    full_feature_names: bool
+    entity_name_to_join_key_map: Dict[str, str]
+    view_plans: List[_FeatureViewReadPlan]
+    on_demand_feature_views: List[OnDemandFeatureView]
+
+
+class _OnlineRetrievalPlanCache:
+    """
+    LRU cache of online retrieval plans. Plans reference objects from the registry cache, so all of them are
+    dropped as soon as the registry cache they were built from is replaced.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._plans: "OrderedDict[Hashable, _OnlineRetrievalPlan]" = OrderedDict()
+        self._registry_objects: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Hashable, registry_objects: Any
+    ) -> Optional[_OnlineRetrievalPlan]:
+        with self._lock:
+            if registry_objects is not self._registry_objects:
+                self._plans.clear()
+                self._registry_objects = registry_objects
+                return None
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+            return plan
+
+    def put(self, key: Hashable, registry_objects: Any, plan: _OnlineRetrievalPlan):
+        with self._lock:
+            if registry_objects is not self._registry_objects:
+                # The registry changed while the plan was being built
+                return
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            if len(self._plans) > self._max_size:
+                self._plans.popitem(last=False)
+
+
 def _print_materialization_log(
     start_date, end_date, num_feature_views: int, online_store: str
 ):
@@ -0,0 +1,466 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import mmh3
+import pandas
+from tqdm import tqdm
+
+from feast.entity import Entity
+from feast.feature_table import FeatureTable
+from feast.feature_view import FeatureView
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.offline_stores.offline_store import RetrievalJob
+from feast.infra.provider import Provider
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.registry import Registry
+from feast.repo_config import OnlineCacheConfig, RepoConfig
+
+Row = Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]
+
+# Cache key of a feature row: the name of its feature view, the features read (None for all of them) and the
+# serialized entity key
+CacheKey = Tuple[str, Optional[Tuple[str, ...]], bytes]
+
+
+@dataclass(frozen=True)
+class OnlineCacheStats:
+    """
+    Counters of an online feature cache.
+
+    Attributes:
+        hits: Number of feature rows served from the cache.
+        misses: Number of feature rows which were not cached, or whose cache entry had expired.
+        evictions: Number of cached feature rows evicted to make room for others.
+        size: Number of feature rows currently cached.
+        rejections: Number of feature rows which the admission policy kept out of the full cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    rejections: int = 0
+
+
+class _TinyLfu:
+    """
+    TinyLFU admission policy: estimates how often keys are requested with a count-min sketch of 4 bit counters,
+    which are halved whenever the number of recorded requests reaches ten times the size of the cache, so that the
+    estimates favour recent requests.
+    """
+
+    _DEPTH = 4
+    _MAX_COUNT = 15
+    _HALVE = bytes(count >> 1 for count in range(256))
+
+    def __init__(self, max_entries: int):
+        width = 16
+        while width < max_entries:
+            width *= 2
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(self._DEPTH)]
+        self._sample_size = 10 * max_entries
+        self._additions = 0
+
+    def _indexes(self, key: bytes) -> List[int]:
+        h1, h2 = mmh3.hash64(key, signed=False)
+        return [(h1 + i * h2) & self._mask for i in range(self._DEPTH)]
+
+    def record(self, key: bytes):
+        idxs = self._indexes(key)
+        count = min(row[idx] for row, idx in zip(self._rows, idxs))
+        if count >= self._MAX_COUNT:
+            return
+        # Only the smallest counters are incremented, which keeps the estimates of other keys more accurate
+        for row, idx in zip(self._rows, idxs):
+            if row[idx] == count:
+                row[idx] = count + 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._rows = [bytearray(row.translate(self._HALVE)) for row in self._rows]
+            self._additions //= 2
+
+    def estimate(self, key: bytes) -> int:
+        return min(row[idx] for row, idx in zip(self._rows, self._indexes(key)))
+
+
+class _OnlineFeatureCache:
+    """
+    Thread safe LRU cache of feature rows, whose entries expire after a per entry TTL. With the "tinylfu" admission
+    policy, a full cache only admits a row if it is requested more often than the least recently used row.
+
+    Each feature view has a generation, which is incremented whenever its features are written. Entries are only
+    served for the current generation of their feature view, so that writes invalidate all the cached rows of the
+    view. Rows read before a write are not cached once it has completed, even if the read finishes after the write.
+
+    Rows holding all the features of their feature view also serve requests of some of these features.
+    """
+
+    def __init__(self, max_entries: int, admission: str = "always"):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int, Row]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._admission = _TinyLfu(max_entries) if admission == "tinylfu" else None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+
+    def generation(self, table_name: str) -> int:
+        with self._lock:
+            return self._generations.get(table_name, 0)
+
+    def get(self, key: CacheKey, generation: int) -> Optional[Row]:
+        with self._lock:
+            if self._admission is not None:
+                self._admission.record(_sketch_key(key))
+            row = self._get(key, generation)
+            if row is None and key[1] is not None:
+                row = self._get((key[0], None, key[2]), generation)
+                if row is not None and row[1] is not None:
+                    values = {
+                        feature_name: row[1][feature_name]
+                        for feature_name in key[1]
+                        if feature_name in row[1]
+                    }
+                    row = (row[0], values) if values else (None, None)
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return row
+
+    def _get(self, key: CacheKey, generation: int) -> Optional[Row]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, entry_generation, row = entry
+        if entry_generation != generation or expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return row
+
+    def put(self, key: CacheKey, row: Row, ttl_seconds: float, generation: int):
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                return
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                if not self._evict(key):
+                    self.rejections += 1
+                    return
+            self._entries[key] = (time.monotonic() + ttl_seconds, generation, row)
+            self._entries.move_to_end(key)
+
+    def _evict(self, key: CacheKey) -> bool:
+        """
+        Evicts the least recently used row to make room for the row of key, unless the admission policy prefers it.
+        """
+        victim, (expires_at, generation, _) = next(iter(self._entries.items()))
+        stale = expires_at <= time.monotonic() or generation != self._generations.get(
+            victim[0], 0
+        )
+        if (
+            not stale
+            and self._admission is not None
+            and self._admission.estimate(_sketch_key(key))
+            <= self._admission.estimate(_sketch_key(victim))
+        ):
+            return False
+        del self._entries[victim]
+        if not stale:
+            self.evictions += 1
+        return True
+
+    def invalidate(self, table_name: str):
+        # Stale entries are not served anymore, and are dropped when they are next looked up or evicted
+        with self._lock:
+            self._generations[table_name] = self._generations.get(table_name, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for table_name in self._generations:
+                self._generations[table_name] += 1
+
+    def stats(self) -> OnlineCacheStats:
+        with self._lock:
+            return OnlineCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._entries),
+                rejections=self.rejections,
+            )
+
+
+def _sketch_key(key: CacheKey) -> bytes:
+    # Requests of any features of a row count towards how often it is requested
+    return key[0].encode("utf-8") + b"\x00" + key[2]
+
+
+def _cache_ttl_seconds(
+    cache_config: OnlineCacheConfig, table: Union[FeatureTable, FeatureView]
+) -> float:
+    """
+    Returns how long the feature rows of a feature view are cached, which its ttl caps.
+    """
+    ttl_seconds: float = cache_config.feature_view_ttl_seconds.get(
+        table.name, cache_config.ttl_seconds
+    )
+    if isinstance(table, FeatureView) and table.ttl:
+        ttl_seconds = min(ttl_seconds, table.ttl.total_seconds())
+    return ttl_seconds
+
+
+class CachingProvider(Provider):
+    """
+    Provider which caches the feature rows read by another provider in memory. It is used by get_provider when
+    online_serving.cache is set in the repo config.
+
+    The rows of a feature view are invalidated whenever its features are written or materialized through this
+    provider. Writes made by other processes are only seen once the cached rows expire.
+    """
+
+    def __init__(self, config: RepoConfig, provider: Provider):
+        assert config.online_serving.cache is not None
+        self.config = config
+        self.provider = provider
+        self.cache_config: OnlineCacheConfig = config.online_serving.cache
+        self._cache = _OnlineFeatureCache(
+            self.cache_config.max_entries, self.cache_config.admission
+        )
+
+    def cache_stats(self) -> OnlineCacheStats:
+        """
+        Returns the hit, miss, eviction and rejection counters of the cache, and its current size.
+        """
+        return self._cache.stats()
+
+    def update_infra(
+        self,
+        project: str,
+        tables_to_delete: Sequence[Union[FeatureTable, FeatureView]],
+        tables_to_keep: Sequence[Union[FeatureTable, FeatureView]],
+        entities_to_delete: Sequence[Entity],
+        entities_to_keep: Sequence[Entity],
+        partial: bool,
+    ):
+        self.provider.update_infra(
+            project,
+            tables_to_delete,
+            tables_to_keep,
+            entities_to_delete,
+            entities_to_keep,
+            partial,
+        )
+        for table in tables_to_delete:
+            self._cache.invalidate(table.name)
+
+    def teardown_infra(
+        self,
+        project: str,
+        tables: Sequence[Union[FeatureTable, FeatureView]],
+        entities: Sequence[Entity],
+    ):
+        self.provider.teardown_infra(project, tables, entities)
+        self._cache.clear()
+
+    def online_write_batch(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        try:
+            self.provider.online_write_batch(config, table, data, progress)
+        finally:
+            self._cache.invalidate(table.name)
+
+    def materialize_single_feature_view(
+        self,
+        config: RepoConfig,
+        feature_view: FeatureView,
+        start_date: datetime,
+        end_date: datetime,
+        registry: Registry,
+        project: str,
+        tqdm_builder: Callable[[int], tqdm],
+    ) -> None:
+        try:
+            self.provider.materialize_single_feature_view(
+                config,
+                feature_view,
+                start_date,
+                end_date,
+                registry,
+                project,
+                tqdm_builder,
+            )
+        finally:
+            self._cache.invalidate(feature_view.name)
+
+    def get_historical_features(
+        self,
+        config: RepoConfig,
+        feature_views: List[FeatureView],
+        feature_refs: List[str],
+        entity_df: Union[pandas.DataFrame, str],
+        registry: Registry,
+        project: str,
+        full_feature_names: bool,
+    ) -> RetrievalJob:
+        return self.provider.get_historical_features(
+            config,
+            feature_views,
+            feature_refs,
+            entity_df,
+            registry,
+            project,
+            full_feature_names,
+        )
+
+    def online_read(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: List[str] = None,
+    ) -> List[Row]:
+        return self.online_read_many(
+            config, [(table, requested_features)], entity_keys
+        )[0]
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Row]]:
+        lookups = [
+            self._lookup(table, entity_keys, requested_features)
+            for table, requested_features in tables
+        ]
+        # The tables with cache misses are read together, for the entities missing from any of them
+        missing_idxs = sorted(
+            {idx for lookup in lookups for idx in lookup.missing_idxs}
+        )
+        tables_to_read = [
+            (table, lookup)
+            for (table, _), lookup in zip(tables, lookups)
+            if lookup.missing_idxs
+        ]
+        if tables_to_read:
+            read_rows = self.provider.online_read_many(
+                config,
+                [
+                    (table, lookup.requested_features)
+                    for table, lookup in tables_to_read
+                ],
+                [entity_keys[idx] for idx in missing_idxs],
+            )
+            for (table, lookup), rows in zip(tables_to_read, read_rows):
+                lookup.fill(dict(zip(missing_idxs, rows)))
+        return [lookup.rows for lookup in lookups]
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: List[str] = None,
+    ) -> List[Row]:
+        lookup = self._lookup(table, entity_keys, requested_features)
+        if lookup.missing_idxs:
+            read_rows = await self.provider.online_read_async(
+                config,
+                table,
+                [entity_keys[idx] for idx in lookup.missing_idxs],
+                requested_features,
+            )
+            lookup.fill(dict(zip(lookup.missing_idxs, read_rows)))
+        return lookup.rows
+
+    def close(self) -> None:
+        self.provider.close()
+
+    def _lookup(
+        self,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]],
+    ) -> "_CacheLookup":
+        lookup = _CacheLookup(
+            self._cache,
+            table.name,
+            requested_features,
+            _cache_ttl_seconds(self.cache_config, table),
+            self.cache_config.negative_ttl_seconds,
+        )
+        lookup.get(entity_keys)
+        return lookup
+
+
+class _CacheLookup:
+    """
+    Rows of a feature view looked up in the cache for a list of entities, with the indexes of the entities which
+    have to be read from the online store.
+    """
+
+    def __init__(
+        self,
+        cache: _OnlineFeatureCache,
+        table_name: str,
+        requested_features: Optional[List[str]],
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+    ):
+        self.cache = cache
+        self.table_name = table_name
+        self.requested_features = requested_features
+        self.features_key = (
+            tuple(sorted(requested_features))
+            if requested_features is not None
+            else None
+        )
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        # The generation is read before the lookup, so that rows read from the online store are not cached if the
+        # feature view is written in the meantime
+        self.generation = cache.generation(table_name)
+        self.keys: List[CacheKey] = []
+        self.rows: List[Row] = []
+        self.missing_idxs: List[int] = []
+
+    def get(self, entity_keys: List[EntityKeyProto]):
+        for idx, entity_key in enumerate(entity_keys):
+            key = (self.table_name, self.features_key, serialize_entity_key(entity_key))
+            row = self.cache.get(key, self.generation)
+            self.keys.append(key)
+            if row is None:
+                self.missing_idxs.append(idx)
+                self.rows.append((None, None))
+            else:
+                self.rows.append(row)
+
+    def fill(self, read_rows: Dict[int, Row]):
+        for idx in self.missing_idxs:
+            row = read_rows[idx]
+            self.rows[idx] = row
+            ttl_seconds = (
+                self.ttl_seconds
+                if row[1] is not None
+                else min(self.negative_ttl_seconds, self.ttl_seconds)
+            )
+            self.cache.put(self.keys[idx], row, ttl_seconds, self.generation)
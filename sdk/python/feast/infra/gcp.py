@@ -75,10 +75,38 @@ class GcpProvider(Provider):
         entity_keys: List[EntityKeyProto],
         requested_features: List[str] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        result = self.online_store.online_read(config, table, entity_keys)
+        result = self.online_store.online_read(
+            config, table, entity_keys, requested_features
+        )
+
+        return result
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        result = self.online_store.online_read_many(config, tables, entity_keys)
+
+        return result
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: List[str] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        result = await self.online_store.online_read_async(
+            config, table, entity_keys, requested_features
+        )
 
         return result
 
+    def close(self) -> None:
+        self.online_store.close()
+
     def materialize_single_feature_view(
         self,
         config: RepoConfig,
@@ -2,7 +2,6 @@ from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
-import pytz
 from tqdm import tqdm
 
 from feast import FeatureTable
@@ -74,10 +73,38 @@ class LocalProvider(Provider):
         entity_keys: List[EntityKeyProto],
         requested_features: List[str] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        result = self.online_store.online_read(config, table, entity_keys)
+        result = self.online_store.online_read(
+            config, table, entity_keys, requested_features
+        )
+
+        return result
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        result = self.online_store.online_read_many(config, tables, entity_keys)
+
+        return result
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: List[str] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        result = await self.online_store.online_read_async(
+            config, table, entity_keys, requested_features
+        )
 
         return result
 
+    def close(self) -> None:
+        self.online_store.close()
+
     def materialize_single_feature_view(
         self,
         config: RepoConfig,
@@ -145,10 +172,3 @@ class LocalProvider(Provider):
 
 def _table_id(project: str, table: Union[FeatureTable, FeatureView]) -> str:
     return f"{project}_{table.name}"
-
-
-def _to_naive_utc(ts: datetime):
-    if ts.tzinfo is None:
-        return ts
-    else:
-        return ts.astimezone(pytz.utc).replace(tzinfo=None)
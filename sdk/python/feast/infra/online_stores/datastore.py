@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from multiprocessing.pool import ThreadPool
 from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from pydantic import PositiveInt, StrictStr
+from pydantic import PositiveInt, StrictBool, StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureTable, utils
@@ -37,6 +38,9 @@ except ImportError as e:
     raise FeastExtrasDependencyImportError("gcp", str(e))
 
 
+# Maximum number of keys looked up by a single get_multi call
+DATASTORE_GET_MULTI_SIZE = 1000
+
 ProtoBatch = Sequence[
     Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
 ]
@@ -60,6 +64,10 @@ class DatastoreOnlineStoreConfig(FeastConfigBaseModel):
     write_batch_size: Optional[PositiveInt] = 50
     """ (optional) Amount of feature rows per batch being written into Datastore"""
 
+    transactional_writes: StrictBool = True
+    """ (optional) Write each batch of feature rows in a transaction. Writes without transactions are faster, but a
+     batch which fails may be partially written."""
+
 
 class DatastoreOnlineStore(OnlineStore):
     """
@@ -68,6 +76,11 @@ class DatastoreOnlineStore(OnlineStore):
     """
 
     _client: Optional[datastore.Client] = None
+    _write_executor: Optional[ThreadPoolExecutor] = None
+    _read_executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self):
+        self._executor_lock = threading.Lock()
 
     def update(
         self,
@@ -140,6 +153,38 @@ class DatastoreOnlineStore(OnlineStore):
                 )
         return self._client
 
+    def _get_write_executor(
+        self, online_config: DatastoreOnlineStoreConfig
+    ) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if not self._write_executor:
+                self._write_executor = ThreadPoolExecutor(
+                    max_workers=online_config.write_concurrency,
+                    thread_name_prefix="feast_datastore_write",
+                )
+            return self._write_executor
+
+    def _get_read_executor(self, config: RepoConfig) -> ThreadPoolExecutor:
+        # Lookups have their own threads, so that serving isn't queued behind a materialization in the same process
+        with self._executor_lock:
+            if not self._read_executor:
+                self._read_executor = ThreadPoolExecutor(
+                    max_workers=config.online_serving.max_concurrent_reads,
+                    thread_name_prefix="feast_datastore_read",
+                )
+            return self._read_executor
+
+    def close(self) -> None:
+        with self._executor_lock:
+            executors = [self._write_executor, self._read_executor]
+            self._write_executor = None
+            self._read_executor = None
+        for executor in executors:
+            if executor:
+                executor.shutdown(wait=True)
+        # The gRPC channel of the Datastore client is released once the client is garbage collected.
+        self._client = None
+
     def online_write_batch(
         self,
         config: RepoConfig,
@@ -154,14 +199,23 @@ class DatastoreOnlineStore(OnlineStore):
         assert isinstance(online_config, DatastoreOnlineStoreConfig)
         client = self._get_client(online_config)
 
-        write_concurrency = online_config.write_concurrency
         write_batch_size = online_config.write_batch_size
         feast_project = config.project
 
-        pool = ThreadPool(processes=write_concurrency)
-        pool.map(
-            lambda b: self._write_minibatch(client, feast_project, table, b, progress),
-            self._to_minibatches(data, batch_size=write_batch_size),
+        executor = self._get_write_executor(online_config)
+        # The results are consumed so that errors are raised
+        list(
+            executor.map(
+                lambda b: self._write_minibatch(
+                    client,
+                    feast_project,
+                    table,
+                    b,
+                    progress,
+                    online_config.transactional_writes,
+                ),
+                self._to_minibatches(data, batch_size=write_batch_size),
+            )
         )
 
     @staticmethod
@@ -188,6 +242,7 @@ class DatastoreOnlineStore(OnlineStore):
             Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
         ],
         progress: Optional[Callable[[int], Any]],
+        transactional: bool = True,
     ):
         entities = []
         for entity_key, features, timestamp, created_ts in data:
@@ -214,7 +269,10 @@ class DatastoreOnlineStore(OnlineStore):
                 )
             )
             entities.append(entity)
-        with client.transaction():
+        if transactional:
+            with client.transaction():
+                client.put_multi(entities)
+        else:
             client.put_multi(entities)
 
         if progress:
@@ -227,6 +285,16 @@ class DatastoreOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        return self.online_read_many(
+            config, [(table, requested_features)], entity_keys
+        )[0]
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
 
         online_config = config.online_store
         assert isinstance(online_config, DatastoreOnlineStoreConfig)
@@ -234,30 +302,56 @@ class DatastoreOnlineStore(OnlineStore):
 
         feast_project = config.project
 
-        keys: List[Key] = []
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
-        for entity_key in entity_keys:
-            document_id = compute_entity_id(entity_key)
-            key = client.key(
-                "Project", feast_project, "Table", table.name, "Row", document_id
-            )
-            keys.append(key)
+        document_ids = [compute_entity_id(entity_key) for entity_key in entity_keys]
+        keys_per_table: List[List[Key]] = [
+            [
+                client.key(
+                    "Project", feast_project, "Table", table.name, "Row", document_id
+                )
+                for document_id in document_ids
+            ]
+            for table, _ in tables
+        ]
 
+        # The rows of all the tables are read together, with concurrent lookups of at most 1000 keys each.
         # NOTE: get_multi doesn't return values in the same order as the keys in the request.
         # Also, len(values) can be less than len(keys) in the case of missing values.
-        values = client.get_multi(keys)
-        values_dict = {v.key: v for v in values} if values is not None else {}
-        for key in keys:
-            if key in values_dict:
-                value = values_dict[key]
-                res = {}
-                for feature_name, value_bin in value["values"].items():
-                    val = ValueProto()
-                    val.ParseFromString(value_bin)
-                    res[feature_name] = val
-                result.append((value["event_ts"], res))
-            else:
-                result.append((None, None))
+        keys = list(dict.fromkeys(itertools.chain(*keys_per_table)))
+        chunks = [
+            keys[chunk_start : chunk_start + DATASTORE_GET_MULTI_SIZE]
+            for chunk_start in range(0, len(keys), DATASTORE_GET_MULTI_SIZE)
+        ]
+        if len(chunks) > 1:
+            chunk_values = self._get_read_executor(config).map(client.get_multi, chunks)
+        else:
+            chunk_values = map(client.get_multi, chunks)
+        values_dict = {
+            v.key: v for values in chunk_values if values is not None for v in values
+        }
+
+        result: List[
+            List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]
+        ] = []
+        for (_, requested_features), keys in zip(tables, keys_per_table):
+            table_result: List[
+                Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]
+            ] = []
+            for key in keys:
+                if key in values_dict:
+                    value = values_dict[key]
+                    res = {}
+                    # Only the requested values are deserialized
+                    for feature_name in requested_features or value["values"]:
+                        value_bin = value["values"].get(feature_name)
+                        if value_bin is None:
+                            continue
+                        val = ValueProto()
+                        val.ParseFromString(value_bin)
+                        res[feature_name] = val
+                    table_result.append((value["event_ts"], res))
+                else:
+                    table_result.append((None, None))
+            result.append(table_result)
 
         return result
 
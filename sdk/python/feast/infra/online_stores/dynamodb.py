@@ -11,13 +11,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from pydantic import StrictStr
+from pydantic import PositiveInt, StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureTable, FeatureView, utils
+from feast.errors import DynamoDBRetriesExhaustedError
 from feast.infra.online_stores.helpers import compute_entity_id
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
@@ -33,6 +39,31 @@ except ImportError as e:
     raise FeastExtrasDependencyImportError("aws", str(e))
 
 
+# Maximum number of items read by a single BatchGetItem request
+DYNAMODB_BATCH_GET_SIZE = 100
+
+# Attributes of an item which are not features, when features are stored as top level attributes
+ITEM_KEY_ATTRIBUTES = ("entity_id", "event_ts")
+
+# Maximum number of items written by a single BatchWriteItem request
+DYNAMODB_BATCH_WRITE_SIZE = 25
+
+# Error codes of requests rejected because the throughput of a table or account was exceeded
+DYNAMODB_THROTTLING_ERROR_CODES = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+}
+
+# Delay before the first retry of the keys or items which a batch request did not process, and maximum delay
+# between retries. The delay doubles with every retry of the same request.
+DYNAMODB_RETRY_BASE_DELAY_SECONDS = 0.05
+DYNAMODB_RETRY_MAX_DELAY_SECONDS = 2.0
+
+# Maximum number of attempts of a batch request, after which the keys or items it did not process are given up on
+DYNAMODB_MAX_ATTEMPTS = 10
+
+
 class DynamoDBOnlineStoreConfig(FeastConfigBaseModel):
     """Online store config for DynamoDB store"""
 
@@ -42,12 +73,43 @@ class DynamoDBOnlineStoreConfig(FeastConfigBaseModel):
     region: StrictStr
     """ AWS Region Name """
 
+    item_layout: Literal["values_map", "attributes"] = "values_map"
+    """ (optional) "values_map" stores the features of an entity in a single map attribute of its item, "attributes"
+     stores each feature in its own top level attribute. Features must then not be named "entity_id" or
+     "event_ts". The online store has to be materialized again after switching layouts. """
+
+    max_write_concurrency: PositiveInt = 8
+    """ (optional) Maximum number of BatchWriteItem requests sent concurrently during materialization. Fewer
+     requests are sent while DynamoDB throttles writes. """
+
 
 class DynamoDBOnlineStore(OnlineStore):
     """
     Online feature store for AWS DynamoDB.
     """
 
+    _session: Optional[boto3.session.Session] = None
+    _client = None
+    _resource = None
+    _read_executor: Optional[ThreadPoolExecutor] = None
+    _write_executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self):
+        # Guards the session, clients and executors, which are created when they are first used
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            executors = [self._read_executor, self._write_executor]
+            self._read_executor = None
+            self._write_executor = None
+            self._session = None
+            self._client = None
+            self._resource = None
+        for executor in executors:
+            if executor:
+                executor.shutdown(wait=True)
+
     def update(
         self,
         config: RepoConfig,
@@ -61,6 +123,15 @@ class DynamoDBOnlineStore(OnlineStore):
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
         dynamodb_client, dynamodb_resource = self._initialize_dynamodb(online_config)
 
+        if online_config.item_layout == "attributes":
+            for table_instance in tables_to_keep:
+                for feature in table_instance.features:
+                    if feature.name in ITEM_KEY_ATTRIBUTES:
+                        raise ValueError(
+                            f"Feature {feature.name} of {table_instance.name} cannot be stored as a DynamoDB "
+                            f"attribute, since {', '.join(ITEM_KEY_ATTRIBUTES)} are reserved for the item keys."
+                        )
+
         for table_instance in tables_to_keep:
             try:
                 dynamodb_resource.create_table(
@@ -108,24 +179,53 @@ class DynamoDBOnlineStore(OnlineStore):
     ) -> None:
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        _, dynamodb_resource = self._initialize_dynamodb(online_config)
+        dynamodb_client, _ = self._initialize_dynamodb(online_config)
 
-        table_instance = dynamodb_resource.Table(f"{config.project}.{table.name}")
-        with table_instance.batch_writer() as batch:
-            for entity_key, features, timestamp, created_ts in data:
-                entity_id = compute_entity_id(entity_key)
-                batch.put_item(
-                    Item={
-                        "entity_id": entity_id,  # PartitionKey
-                        "event_ts": str(utils.make_tzaware(timestamp)),
-                        "values": {
-                            k: v.SerializeToString()
-                            for k, v in features.items()  # Serialized Features
-                        },
-                    }
-                )
+        # BatchWriteItem rejects duplicate keys, and requests may complete in any order, so only the last row of
+        # each entity is written
+        items: Dict[str, Dict[str, Any]] = {}
+        for entity_key, features, timestamp, created_ts in data:
+            entity_id = compute_entity_id(entity_key)
+            values = {
+                k: {"B": v.SerializeToString()}
+                for k, v in features.items()  # Serialized Features
+            }
+            item: Dict[str, Any] = {
+                "entity_id": {"S": entity_id},  # PartitionKey
+                "event_ts": {"S": str(utils.make_tzaware(timestamp))},
+            }
+            if online_config.item_layout == "attributes":
+                item.update(values)
+            else:
+                item["values"] = {"M": values}
+            items[entity_id] = {"PutRequest": {"Item": item}}
+        if progress and len(data) > len(items):
+            progress(len(data) - len(items))
+
+        table_name = f"{config.project}.{table.name}"
+        write_requests = list(items.values())
+        batches = [
+            write_requests[batch_start : batch_start + DYNAMODB_BATCH_WRITE_SIZE]
+            for batch_start in range(0, len(write_requests), DYNAMODB_BATCH_WRITE_SIZE)
+        ]
+        limiter = _AimdConcurrencyLimiter(online_config.max_write_concurrency)
+        executor = self._get_write_executor(online_config)
+        futures = {
+            executor.submit(
+                _batch_write_item, dynamodb_client, limiter, table_name, batch
+            ): len(batch)
+            for batch in batches
+        }
+        try:
+            # Progress is reported as batches complete, so that it reflects the current write rate
+            for future in as_completed(futures):
+                future.result()
                 if progress:
-                    progress(1)
+                    progress(futures[future])
+        finally:
+            # The remaining batches of a failed write are not sent
+            for future in futures:
+                future.cancel()
 
     def online_read(
         self,
@@ -134,33 +234,104 @@ class DynamoDBOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        return self.online_read_many(
+            config, [(table, requested_features)], entity_keys
+        )[0]
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        _, dynamodb_resource = self._initialize_dynamodb(online_config)
+        dynamodb_client, _ = self._initialize_dynamodb(online_config)
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
-        for entity_key in entity_keys:
-            table_instance = dynamodb_resource.Table(f"{config.project}.{table.name}")
-            entity_id = compute_entity_id(entity_key)
-            response = table_instance.get_item(Key={"entity_id": entity_id})
-            value = response.get("Item")
-
-            if value is not None:
-                res = {}
-                for feature_name, value_bin in value["values"].items():
-                    val = ValueProto()
-                    val.ParseFromString(value_bin.value)
-                    res[feature_name] = val
-                result.append((value["event_ts"], res))
-            else:
-                result.append((None, None))
-        return result
+        entity_ids = [compute_entity_id(entity_key) for entity_key in entity_keys]
+        table_names = [f"{config.project}.{table.name}" for table, _ in tables]
+        projections = {
+            table_name: _get_projection(requested_features, online_config.item_layout)
+            for table_name, (_, requested_features) in zip(table_names, tables)
+        }
+
+        # The items of all the tables are read with BatchGetItem requests, each of which can span several tables.
+        # BatchGetItem rejects duplicate keys, and reads at most 100 items per request.
+        keys_to_read = [
+            (table_name, entity_id)
+            for table_name in table_names
+            for entity_id in dict.fromkeys(entity_ids)
+        ]
+        batches = []
+        for batch_start in range(0, len(keys_to_read), DYNAMODB_BATCH_GET_SIZE):
+            request_items: Dict[str, Any] = {}
+            for table_name, entity_id in keys_to_read[
+                batch_start : batch_start + DYNAMODB_BATCH_GET_SIZE
+            ]:
+                request_items.setdefault(
+                    table_name, {"Keys": [], **projections[table_name]}
+                )["Keys"].append({"entity_id": {"S": entity_id}})
+            batches.append(request_items)
+
+        # The low level client is used, since unlike boto3 resources it can be shared by threads
+        batch_get_item = partial(_batch_get_item, dynamodb_client)
+        if len(batches) > 1:
+            batch_responses = self._get_read_executor(config).map(
+                batch_get_item, batches
+            )
+        else:
+            batch_responses = map(batch_get_item, batches)
+
+        items: Dict[str, Dict[str, Any]] = {
+            table_name: {} for table_name in table_names
+        }
+        for batch_response in batch_responses:
+            for table_name, table_items in batch_response:
+                for item in table_items:
+                    items[table_name][item["entity_id"]["S"]] = item
+
+        return [
+            [
+                _get_features_for_item(
+                    items[table_name].get(entity_id), online_config.item_layout
+                )
+                for entity_id in entity_ids
+            ]
+            for table_name in table_names
+        ]
+
+    def _get_read_executor(self, config: RepoConfig) -> ThreadPoolExecutor:
+        # Concurrent first reads must not create several pools, which would never be shut down
+        with self._lock:
+            if not self._read_executor:
+                self._read_executor = ThreadPoolExecutor(
+                    max_workers=config.online_serving.max_concurrent_reads,
+                    thread_name_prefix="feast_dynamodb_read",
+                )
+            return self._read_executor
+
+    def _get_write_executor(
+        self, online_config: DynamoDBOnlineStoreConfig
+    ) -> ThreadPoolExecutor:
+        with self._lock:
+            if not self._write_executor:
+                self._write_executor = ThreadPoolExecutor(
+                    max_workers=online_config.max_write_concurrency,
+                    thread_name_prefix="feast_dynamodb_write",
+                )
+            return self._write_executor
 
     def _initialize_dynamodb(self, online_config: DynamoDBOnlineStoreConfig):
-        return (
-            boto3.client("dynamodb", region_name=online_config.region),
-            boto3.resource("dynamodb", region_name=online_config.region),
-        )
+        # The session, client and resource are created once and reused, since creating them is expensive. boto3
+        # sessions are not thread safe, so they are only used under the lock.
+        with self._lock:
+            if not self._session:
+                self._session = boto3.session.Session(region_name=online_config.region)
+            if not self._client:
+                self._client = self._session.client("dynamodb")
+            if not self._resource:
+                self._resource = self._session.resource("dynamodb")
+            return self._client, self._resource
 
     def _delete_tables_idempotent(
         self,
@@ -180,3 +351,138 @@ class DynamoDBOnlineStore(OnlineStore):
                 # Otherwise, re-raise the exception
                 if ce.response["Error"]["Code"] != "ResourceNotFoundException":
                     raise
+
+
+def _batch_get_item(
+    dynamodb_client, request_items: Dict[str, Any]
+) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Reads the given items with BatchGetItem, retrying the keys which were not processed (e.g. because the tables'
+    throughput was exceeded) with exponential backoff, up to DYNAMODB_MAX_ATTEMPTS requests in total.
+    """
+    responses: List[Tuple[str, List[Dict[str, Any]]]] = []
+    delay = DYNAMODB_RETRY_BASE_DELAY_SECONDS
+    for attempt in range(DYNAMODB_MAX_ATTEMPTS):
+        if attempt:
+            time.sleep(random.uniform(0, delay))
+            delay = min(delay * 2, DYNAMODB_RETRY_MAX_DELAY_SECONDS)
+        response = dynamodb_client.batch_get_item(RequestItems=request_items)
+        responses.extend(response["Responses"].items())
+        request_items = response.get("UnprocessedKeys")
+        if not request_items:
+            return responses
+    raise DynamoDBRetriesExhaustedError(
+        "BatchGetItem", list(request_items), DYNAMODB_MAX_ATTEMPTS
+    )
+
+
+class _AimdConcurrencyLimiter:
+    """
+    Limits the number of concurrent requests, with additive increase / multiplicative decrease: the limit is halved
+    whenever a request is throttled, and grows back by one request after a full limit's worth of requests succeeds.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool):
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+def _batch_write_item(
+    dynamodb_client,
+    limiter: _AimdConcurrencyLimiter,
+    table_name: str,
+    write_requests: List[Dict[str, Any]],
+):
+    """
+    Writes the given items with BatchWriteItem, retrying the items which were not processed or throttled with
+    exponential backoff, up to DYNAMODB_MAX_ATTEMPTS requests in total.
+    """
+    delay = DYNAMODB_RETRY_BASE_DELAY_SECONDS
+    for attempt in range(DYNAMODB_MAX_ATTEMPTS):
+        if attempt:
+            time.sleep(random.uniform(0, delay))
+            delay = min(delay * 2, DYNAMODB_RETRY_MAX_DELAY_SECONDS)
+        limiter.acquire()
+        try:
+            response = dynamodb_client.batch_write_item(
+                RequestItems={table_name: write_requests}
+            )
+        except ClientError as ce:
+            throttled = ce.response["Error"]["Code"] in DYNAMODB_THROTTLING_ERROR_CODES
+            limiter.release(throttled=throttled)
+            if not throttled:
+                raise
+        else:
+            write_requests = response.get("UnprocessedItems", {}).get(table_name, [])
+            limiter.release(throttled=bool(write_requests))
+            if not write_requests:
+                return
+    raise DynamoDBRetriesExhaustedError(
+        "BatchWriteItem", [table_name], DYNAMODB_MAX_ATTEMPTS
+    )
+
+
+def _get_projection(
+    requested_features: Optional[List[str]], item_layout: str = "values_map"
+) -> Dict[str, Any]:
+    """
+    Returns the arguments of a read request which restrict the attributes read from an item to its entity id, event
+    timestamp and the requested features.
+    """
+    if not requested_features:
+        return {}
+    # Placeholders are used for all attribute names, since "values" is a reserved word and feature names may be too
+    attribute_names = {"#id": "entity_id", "#ts": "event_ts"}
+    attributes = ["#id", "#ts"]
+    if item_layout == "attributes":
+        feature_path = "#f{}"
+    else:
+        attribute_names["#values"] = "values"
+        feature_path = "#values.#f{}"
+    for idx, feature_name in enumerate(requested_features):
+        attribute_names[f"#f{idx}"] = feature_name
+        attributes.append(feature_path.format(idx))
+    return {
+        "ProjectionExpression": ", ".join(attributes),
+        "ExpressionAttributeNames": attribute_names,
+    }
+
+
+def _get_features_for_item(
+    item: Optional[Dict[str, Any]], item_layout: str = "values_map"
+) -> Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]:
+    if item is None:
+        return None, None
+    # Items are read with the low level client, so attribute values are wrapped in their DynamoDB types. The values
+    # attribute is not returned at all when none of the requested features is set on the item.
+    if item_layout == "attributes":
+        values = {
+            name: value
+            for name, value in item.items()
+            if name not in ITEM_KEY_ATTRIBUTES
+        }
+    else:
+        values = item.get("values", {}).get("M", {})
+    res = {}
+    for feature_name, value_bin in values.items():
+        val = ValueProto()
+        val.ParseFromString(value_bin["B"])
+        res[feature_name] = val
+    return item["event_ts"]["S"], res
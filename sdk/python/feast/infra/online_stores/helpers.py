@@ -1,8 +1,11 @@
 import importlib
+import mmap
 import struct
-from typing import Any
+from datetime import datetime, timedelta
+from typing import Any, Tuple, Union
 
 import mmh3
+import pytz
 
 from feast import errors
 from feast.infra.key_encoding_utils import serialize_entity_key
@@ -10,6 +13,13 @@ from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.storage.Redis_pb2 import RedisKeyV2 as RedisKeyProto
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 
+# Rows packed into a single value by the local stores start with their event timestamp and number of features. Each
+# feature then has a header, holding a store specific tag (e.g. the length of the feature name) and the length of its
+# serialized ValueProto.
+_ROW_HEADER = struct.Struct("<qH")
+_FEATURE_HEADER = struct.Struct("<HI")
+_EPOCH = datetime(1970, 1, 1)
+
 
 def get_online_store_from_config(online_store_config: Any,) -> OnlineStore:
     """Get the offline store from offline store config"""
@@ -63,3 +73,23 @@ def compute_entity_id(entity_key: EntityKeyProto) -> str:
     It has nothing to do with the Entity concept we have in Feast.
     """
     return mmh3.hash_bytes(serialize_entity_key(entity_key)).hex()
+
+
+def _pack_row_header(event_ts: datetime, num_features: int) -> bytes:
+    return _ROW_HEADER.pack(
+        (event_ts - _EPOCH) // timedelta(microseconds=1), num_features
+    )
+
+
+def _unpack_row_header(
+    row: Union[bytes, memoryview, mmap.mmap], offset: int
+) -> Tuple[datetime, int]:
+    event_ts_micros, num_features = _ROW_HEADER.unpack_from(row, offset)
+    return _EPOCH + timedelta(microseconds=event_ts_micros), num_features
+
+
+def _to_naive_utc(ts: datetime):
+    if ts.tzinfo is None:
+        return ts
+    else:
+        return ts.astimezone(pytz.utc).replace(tzinfo=None)
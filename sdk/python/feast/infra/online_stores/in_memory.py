@@ -0,0 +1,376 @@
+# Copyright 2021 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import atexit
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from pydantic import PositiveInt, StrictStr
+from pydantic.schema import Literal
+
+from feast import Entity, FeatureTable
+from feast.feature_view import FeatureView
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.helpers import _to_naive_utc
+from feast.infra.online_stores.online_store import OnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import FeastConfigBaseModel, RepoConfig
+
+# Feature rows of a table, by serialized entity key: the event timestamp of the row and its feature values
+Rows = Dict[bytes, Tuple[datetime, Dict[str, ValueProto]]]
+
+
+class InMemoryOnlineStoreConfig(FeastConfigBaseModel):
+    """ Online store config for the in-memory store """
+
+    type: Literal[
+        "in_memory", "feast.infra.online_stores.in_memory.InMemoryOnlineStore"
+    ] = "in_memory"
+    """ Online store type selector"""
+
+    snapshot_path: Optional[StrictStr] = None
+    """ (optional) Path of a snapshot of the features. The features are restored from the snapshot when the store is
+     first used, and saved to it when the store is closed or the process exits. """
+
+    snapshot_interval_seconds: Optional[PositiveInt] = None
+    """ (optional) Interval at which the features are also saved to the snapshot while they change """
+
+
+class InMemoryOnlineStore(OnlineStore):
+    """
+    Online store which keeps the features in the memory of the serving process, so that they are read without any
+    network round trip. Features are shared by all the in-memory stores of a process which have the same snapshot
+    path (or no snapshot path), and are lost when the process exits unless a snapshot path is set.
+
+    Features can be loaded by materializing them in the serving process at startup, or restored from a snapshot
+    saved by another process, e.g. by `feast materialize`.
+    """
+
+    _database: Optional["_InMemoryDatabase"] = None
+
+    def _get_database(self, config: RepoConfig) -> "_InMemoryDatabase":
+        if not self._database:
+            self._database = _get_database(config)
+        return self._database
+
+    def online_write_batch(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        database = self._get_database(config)
+        database.write(_table_id(config.project, table), data)
+        if progress:
+            progress(len(data))
+
+    def online_read(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        rows = self._get_database(config).tables.get(
+            _table_id(config.project, table), {}
+        )
+
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        for entity_key in entity_keys:
+            row = rows.get(serialize_entity_key(entity_key))
+            if row is None:
+                result.append((None, None))
+                continue
+            event_ts, values = row
+            if requested_features is None:
+                res = dict(values)
+            else:
+                res = {
+                    feature_name: values[feature_name]
+                    for feature_name in requested_features
+                    if feature_name in values
+                }
+            result.append((event_ts, res) if res else (None, None))
+        return result
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        # Reads never block, so they are run directly on the event loop
+        return self.online_read(config, table, entity_keys, requested_features)
+
+    def update(
+        self,
+        config: RepoConfig,
+        tables_to_delete: Sequence[Union[FeatureTable, FeatureView]],
+        tables_to_keep: Sequence[Union[FeatureTable, FeatureView]],
+        entities_to_delete: Sequence[Entity],
+        entities_to_keep: Sequence[Entity],
+        partial: bool,
+    ):
+        database = self._get_database(config)
+        database.update(
+            [_table_id(config.project, table) for table in tables_to_delete],
+            [_table_id(config.project, table) for table in tables_to_keep],
+        )
+
+    def teardown(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Union[FeatureTable, FeatureView]],
+        entities: Sequence[Entity],
+    ):
+        database = self._get_database(config)
+        database.update([_table_id(config.project, table) for table in tables], [])
+        _release_database(database)
+        self._database = None
+
+    def close(self) -> None:
+        # The features outlive the store, so that they are still served after its provider is rebuilt
+        if self._database:
+            self._database.save_snapshot()
+            self._database = None
+
+
+class _InMemoryDatabase:
+    """
+    Tables of features kept in memory, optionally restored from and saved to a snapshot file.
+
+    Rows are replaced as a whole when they are written, so that reads don't need to be synchronized with writes.
+    """
+
+    def __init__(
+        self, snapshot_path: Optional[str], snapshot_interval_seconds: Optional[int]
+    ):
+        self.tables: Dict[str, Rows] = {}
+        self.snapshot_path = snapshot_path
+        self._lock = threading.Lock()
+        # Snapshots saved by the periodic thread, by close and at exit are written to the same temporary file
+        self._save_lock = threading.Lock()
+        self._changed = False
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if snapshot_path:
+            self.restore_snapshot()
+            atexit.register(self.close)
+            if snapshot_interval_seconds:
+                self._thread = threading.Thread(
+                    target=self._save_snapshots,
+                    args=(snapshot_interval_seconds,),
+                    name="feast_in_memory_snapshot",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def write(
+        self,
+        table_id: str,
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+    ):
+        with self._lock:
+            rows = self.tables.setdefault(table_id, {})
+            for entity_key, values, timestamp, _ in data:
+                entity_key_bin = serialize_entity_key(entity_key)
+                row = rows.get(entity_key_bin)
+                # Features which are not written keep their current values
+                values = {**row[1], **values} if row is not None else dict(values)
+                rows[entity_key_bin] = (_to_naive_utc(timestamp), values)
+            self._changed = True
+
+    def update(self, table_ids_to_delete: List[str], table_ids_to_keep: List[str]):
+        with self._lock:
+            for table_id in table_ids_to_keep:
+                self.tables.setdefault(table_id, {})
+            for table_id in table_ids_to_delete:
+                self.tables.pop(table_id, None)
+            self._changed = True
+
+    def save_snapshot(self):
+        """
+        Saves the features to the snapshot file, if they changed since they were last saved or restored.
+        """
+        if not self.snapshot_path:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._changed:
+                    return
+                tables = {
+                    table_id: list(rows.items())
+                    for table_id, rows in self.tables.items()
+                }
+                self._changed = False
+            _write_snapshot(self.snapshot_path, tables)
+
+    def restore_snapshot(self):
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return
+        tables: Dict[str, Rows] = {}
+        conn = sqlite3.connect(self.snapshot_path, detect_types=sqlite3.PARSE_DECLTYPES)
+        try:
+            for (table_id,) in conn.execute("SELECT table_id FROM tables"):
+                tables[table_id] = {}
+            for (
+                table_id,
+                entity_key_bin,
+                event_ts,
+                feature_name,
+                value_bin,
+            ) in conn.execute(
+                "SELECT table_id, entity_key, event_ts, feature_name, value FROM features"
+            ):
+                val = ValueProto()
+                val.ParseFromString(value_bin)
+                rows = tables[table_id]
+                if entity_key_bin not in rows:
+                    rows[entity_key_bin] = (event_ts, {})
+                rows[entity_key_bin][1][feature_name] = val
+        finally:
+            conn.close()
+        with self._lock:
+            self.tables = tables
+            self._changed = False
+
+    def close(self):
+        """
+        Stops saving the features periodically, and saves them a last time.
+        """
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if self.snapshot_path:
+            atexit.unregister(self.close)
+        self.save_snapshot()
+
+    def _save_snapshots(self, interval_seconds: int):
+        while not self._stopped.wait(interval_seconds):
+            self.save_snapshot()
+
+
+_databases: Dict[Optional[str], _InMemoryDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+def _get_database(config: RepoConfig) -> _InMemoryDatabase:
+    """
+    Returns the database of the in-memory stores configured with the same snapshot path, restoring it from its
+    snapshot when it is first used.
+    """
+    online_config = config.online_store
+    assert isinstance(online_config, InMemoryOnlineStoreConfig)
+
+    snapshot_path = online_config.snapshot_path
+    if snapshot_path and config.repo_path and not Path(snapshot_path).is_absolute():
+        snapshot_path = str(config.repo_path / snapshot_path)
+
+    database = _databases.get(snapshot_path)
+    if database is None:
+        with _databases_lock:
+            database = _databases.get(snapshot_path)
+            if database is None:
+                database = _InMemoryDatabase(
+                    snapshot_path, online_config.snapshot_interval_seconds
+                )
+                _databases[snapshot_path] = database
+    return database
+
+
+def _release_database(database: _InMemoryDatabase):
+    """
+    Closes a database once all its tables are torn down, so that it is not kept by the process any more.
+    """
+    with _databases_lock:
+        if database.tables or _databases.get(database.snapshot_path) is not database:
+            database.save_snapshot()
+            return
+        del _databases[database.snapshot_path]
+    database.close()
+
+
+def _write_snapshot(
+    snapshot_path: str,
+    tables: Dict[str, List[Tuple[bytes, Tuple[datetime, Dict[str, ValueProto]]]]],
+):
+    """
+    Writes the rows of the tables to a temporary file, which then replaces the previous snapshot.
+    """
+    Path(snapshot_path).parent.mkdir(parents=True, exist_ok=True)
+    # The temporary file is unique, so that processes which share the snapshot don't write to the same file
+    fd, tmp_path = tempfile.mkstemp(dir=Path(snapshot_path).parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        # SQLite syncs the file to disk when the transaction is committed
+        conn = sqlite3.connect(tmp_path)
+        try:
+            with conn:
+                conn.execute("CREATE TABLE tables (table_id TEXT PRIMARY KEY)")
+                conn.execute(
+                    "CREATE TABLE features (table_id TEXT, entity_key BLOB, event_ts timestamp, feature_name TEXT, "
+                    "value BLOB)"
+                )
+                conn.executemany(
+                    "INSERT INTO tables (table_id) VALUES (?)",
+                    [(table_id,) for table_id in tables],
+                )
+                conn.executemany(
+                    "INSERT INTO features (table_id, entity_key, event_ts, feature_name, value) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (
+                            table_id,
+                            entity_key_bin,
+                            event_ts,
+                            feature_name,
+                            value.SerializeToString(),
+                        )
+                        for table_id, rows in tables.items()
+                        for entity_key_bin, (event_ts, values) in rows
+                        for feature_name, value in values.items()
+                    ),
+                )
+        finally:
+            conn.close()
+        # mkstemp creates files which only their owner can read
+        os.chmod(tmp_path, _snapshot_mode(snapshot_path))
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _snapshot_mode(snapshot_path: str) -> int:
+    try:
+        return stat.S_IMODE(os.stat(snapshot_path).st_mode)
+    except FileNotFoundError:
+        return 0o644
+
+
+def _table_id(project: str, table: Union[FeatureTable, FeatureView]) -> str:
+    return f"{project}_{table.name}"
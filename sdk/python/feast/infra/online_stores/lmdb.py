@@ -0,0 +1,280 @@
+# Copyright 2021 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from pydantic import PositiveInt, StrictBool, StrictStr
+from pydantic.schema import Literal
+
+from feast import Entity, FeatureTable
+from feast.feature_view import FeatureView
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.helpers import (
+    _FEATURE_HEADER,
+    _ROW_HEADER,
+    _pack_row_header,
+    _to_naive_utc,
+    _unpack_row_header,
+)
+from feast.infra.online_stores.online_store import OnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import FeastConfigBaseModel, RepoConfig
+
+try:
+    import lmdb
+except ImportError as e:
+    from feast.errors import FeastExtrasDependencyImportError
+
+    raise FeastExtrasDependencyImportError("lmdb", str(e))
+
+T = TypeVar("T")
+
+
+class LmdbOnlineStoreConfig(FeastConfigBaseModel):
+    """ Online store config for the LMDB store """
+
+    type: Literal["lmdb", "feast.infra.online_stores.lmdb.LmdbOnlineStore"] = "lmdb"
+    """ Online store type selector"""
+
+    path: StrictStr = "data/online_store.lmdb"
+    """ (optional) Path of the directory holding the LMDB environment """
+
+    map_size: PositiveInt = 1024 ** 3
+    """ (optional) Initial size in bytes of the memory map of the environment. It is doubled whenever a write needs
+     more space. """
+
+    max_readers: PositiveInt = 126
+    """ (optional) Maximum number of threads, across all processes, which read the environment at the same time """
+
+    sync: StrictBool = True
+    """ (optional) Whether writes are flushed to disk when they are committed. Without it, a system crash can lose
+     the last writes, but materialization is faster. """
+
+
+class LmdbOnlineStore(OnlineStore):
+    """
+    Online store which keeps the features in a local LMDB environment, a memory-mapped B+tree.
+
+    Each entity of a feature view is stored as a single key, made of the project and name of the feature view and of
+    the serialized entity key, whose value packs all the features of the entity. Any number of threads and processes
+    read the environment concurrently without locking, while one writer at a time materializes features into it.
+    """
+
+    _env: Optional["lmdb.Environment"] = None
+    _env_pid: Optional[int] = None
+
+    def _get_env(self, config: RepoConfig) -> "lmdb.Environment":
+        # Forked processes can't use the environment of their parent, so each process opens its own
+        if not self._env or self._env_pid != os.getpid():
+            self._env = _get_env(config)
+            self._env_pid = os.getpid()
+        return self._env
+
+    def online_write_batch(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        prefix = _key_prefix(config.project, table)
+        rows: Dict[bytes, Tuple[datetime, Dict[str, ValueProto]]] = {}
+        for entity_key, values, timestamp, _ in data:
+            key = prefix + serialize_entity_key(entity_key)
+            row = rows.get(key)
+            values = {**row[1], **values} if row is not None else dict(values)
+            rows[key] = (_to_naive_utc(timestamp), values)
+        # Sorted keys are looked up and inserted with fewer page traversals
+        keys = sorted(rows)
+
+        def write(txn: "lmdb.Transaction"):
+            cursor = txn.cursor()
+            # Features which are not written keep their current values
+            for key, value in cursor.getmulti(keys):
+                event_ts, values = rows[key]
+                rows[key] = (event_ts, {**_unpack_row(value, None)[1], **values})
+            cursor.putmulti((key, _pack_row(*rows[key])) for key in keys)
+
+        _write(self._get_env(config), write)
+        if progress:
+            progress(len(data))
+
+    def online_read(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        prefix = _key_prefix(config.project, table)
+        keys = [prefix + serialize_entity_key(entity_key) for entity_key in entity_keys]
+
+        def read(txn: "lmdb.Transaction"):
+            return {
+                bytes(key): _unpack_row(value, requested_features)
+                for key, value in txn.cursor().getmulti(sorted(set(keys)))
+            }
+
+        values = _read(self._get_env(config), read)
+
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        for key in keys:
+            row = values.get(key)
+            if row is None or not row[1]:
+                result.append((None, None))
+            else:
+                result.append(row)
+        return result
+
+    def update(
+        self,
+        config: RepoConfig,
+        tables_to_delete: Sequence[Union[FeatureTable, FeatureView]],
+        tables_to_keep: Sequence[Union[FeatureTable, FeatureView]],
+        entities_to_delete: Sequence[Entity],
+        entities_to_keep: Sequence[Entity],
+        partial: bool,
+    ):
+        env = self._get_env(config)
+        for table in tables_to_delete:
+            _delete_prefix(env, _key_prefix(config.project, table))
+
+    def teardown(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Union[FeatureTable, FeatureView]],
+        entities: Sequence[Entity],
+    ):
+        env = self._get_env(config)
+        for table in tables:
+            _delete_prefix(env, _key_prefix(config.project, table))
+
+    def close(self) -> None:
+        # The environment is shared by the stores of the process, and is closed when the process exits
+        self._env = None
+
+
+_envs: Dict[Tuple[int, str], "lmdb.Environment"] = {}
+_envs_lock = threading.Lock()
+
+
+def _get_env(config: RepoConfig) -> "lmdb.Environment":
+    """
+    Returns the LMDB environment of the process for the configured path. LMDB environments must not be opened more
+    than once per process, so all the stores of a process configured with the same path share one.
+    """
+    online_config = config.online_store
+    assert isinstance(online_config, LmdbOnlineStoreConfig)
+
+    path = Path(online_config.path)
+    if config.repo_path and not path.is_absolute():
+        path = config.repo_path / path
+    env_key = (os.getpid(), str(path.resolve()))
+
+    with _envs_lock:
+        env = _envs.get(env_key)
+        if env is None:
+            path.mkdir(parents=True, exist_ok=True)
+            env = lmdb.open(
+                str(path),
+                map_size=online_config.map_size,
+                max_readers=online_config.max_readers,
+                sync=online_config.sync,
+                metasync=online_config.sync,
+            )
+            _envs[env_key] = env
+    return env
+
+
+def _read(env: "lmdb.Environment", read: Callable[["lmdb.Transaction"], T]) -> T:
+    """
+    Runs read in a read transaction, adopting the size of the memory map if another process grew it.
+    """
+    while True:
+        try:
+            with env.begin(buffers=True) as txn:
+                return read(txn)
+        except lmdb.MapResizedError:
+            # A size of 0 adopts the size of the map set by the process which grew it
+            env.set_mapsize(0)
+
+
+def _write(env: "lmdb.Environment", write: Callable[["lmdb.Transaction"], None]):
+    """
+    Runs write in a write transaction, growing the memory map of the environment until the transaction fits in it.
+    """
+    while True:
+        try:
+            with env.begin(write=True) as txn:
+                write(txn)
+            return
+        except lmdb.MapResizedError:
+            env.set_mapsize(0)
+        except lmdb.MapFullError:
+            env.set_mapsize(env.info()["map_size"] * 2)
+
+
+def _delete_prefix(env: "lmdb.Environment", prefix: bytes):
+    def delete(txn: "lmdb.Transaction"):
+        cursor = txn.cursor()
+        if not cursor.set_range(prefix):
+            return
+        # Deleting the current key moves the cursor to the next one
+        while bytes(cursor.key()).startswith(prefix):
+            if not cursor.delete():
+                break
+
+    _write(env, delete)
+
+
+def _key_prefix(project: str, table: Union[FeatureTable, FeatureView]) -> bytes:
+    # Names can't contain a NUL byte, so that the prefix of one feature view is never a prefix of another's
+    return f"{project}_{table.name}".encode("utf-8") + b"\x00"
+
+
+def _pack_row(event_ts: datetime, values: Dict[str, ValueProto]) -> bytes:
+    # Features are tagged with the length of their name, which precedes their serialized ValueProto
+    parts = [_pack_row_header(event_ts, len(values))]
+    for feature_name, val in values.items():
+        feature_name_bin = feature_name.encode("utf-8")
+        val_bin = val.SerializeToString()
+        parts.append(_FEATURE_HEADER.pack(len(feature_name_bin), len(val_bin)))
+        parts.append(feature_name_bin)
+        parts.append(val_bin)
+    return b"".join(parts)
+
+
+def _unpack_row(
+    row: Union[bytes, memoryview], requested_features: Optional[List[str]]
+) -> Tuple[datetime, Dict[str, ValueProto]]:
+    event_ts, num_features = _unpack_row_header(row, 0)
+    offset = _ROW_HEADER.size
+    res = {}
+    for _ in range(num_features):
+        name_len, value_len = _FEATURE_HEADER.unpack_from(row, offset)
+        offset += _FEATURE_HEADER.size
+        feature_name = bytes(row[offset : offset + name_len]).decode("utf-8")
+        offset += name_len
+        if requested_features is None or feature_name in requested_features:
+            val = ValueProto()
+            val.ParseFromString(bytes(row[offset : offset + value_len]))
+            res[feature_name] = val
+        offset += value_len
+    return event_ts, res
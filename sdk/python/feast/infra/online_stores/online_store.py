@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from feast import Entity, FeatureTable
+from feast.entity import Entity
+from feast.feature_table import FeatureTable
 from feast.feature_view import FeatureView
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -80,6 +83,56 @@ class OnlineStore(ABC):
         """
         ...
 
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Read feature values of several tables which share the same entities, given an Entity Key. Online stores
+        which keep the features of all tables of an entity together, or which can read from several tables in
+        a single request, should override this method. By default, each table is read with online_read.
+
+        Args:
+            config: The RepoConfig for the current FeatureStore.
+            tables: A list of pairs of Feast FeatureTable or FeatureView, and the (optional) subset of its
+                features that should be read. All tables must have the same join keys.
+            entity_keys: a list of entity keys that should be read from the FeatureStore.
+        Returns:
+            One list per table, holding the same data as online_read would return for that table.
+        """
+        return [
+            self.online_read(config, table, entity_keys, requested_features)
+            for table, requested_features in tables
+        ]
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Asynchronous version of online_read, used to retrieve features from asyncio applications. Online stores
+        with an asyncio client should override this method. By default, online_read is run in the default
+        executor of the running event loop, so that it doesn't block the loop.
+
+        Args:
+            config: The RepoConfig for the current FeatureStore.
+            table: Feast FeatureTable or FeatureView
+            entity_keys: a list of entity keys that should be read from the FeatureStore.
+            requested_features: (Optional) A subset of the features that should be read from the FeatureStore.
+        Returns:
+            The same data as online_read.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(self.online_read, config, table, entity_keys, requested_features),
+        )
+
     @abstractmethod
     def update(
         self,
@@ -100,3 +153,11 @@ class OnlineStore(ABC):
         entities: Sequence[Entity],
     ):
         ...
+
+    def close(self) -> None:
+        """
+        Releases any connections or clients held by this online store. Online stores are long lived and
+        reuse their connections across calls, so this should be called once the store is no longer needed.
+        The store may be used again after it has been closed, in which case connections are reopened lazily.
+        """
+        pass
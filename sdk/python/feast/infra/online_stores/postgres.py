@@ -0,0 +1,321 @@
+# Copyright 2021 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pydantic import PositiveInt, StrictStr
+from pydantic.schema import Literal
+
+from feast import Entity, FeatureTable
+from feast.feature_view import FeatureView
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.helpers import _to_naive_utc
+from feast.infra.online_stores.online_store import OnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import FeastConfigBaseModel, RepoConfig
+
+try:
+    import psycopg2
+    from psycopg2 import sql
+    from psycopg2.pool import ThreadedConnectionPool
+except ImportError as e:
+    from feast.errors import FeastExtrasDependencyImportError
+
+    raise FeastExtrasDependencyImportError("postgres", str(e))
+
+
+class PostgresOnlineStoreConfig(FeastConfigBaseModel):
+    """ Online store config for the PostgreSQL store """
+
+    type: Literal[
+        "postgres", "feast.infra.online_stores.postgres.PostgresOnlineStore"
+    ] = "postgres"
+    """ Online store type selector"""
+
+    host: StrictStr = "localhost"
+    """ (optional) Host name of the PostgreSQL server """
+
+    port: PositiveInt = 5432
+    """ (optional) Port of the PostgreSQL server """
+
+    database: StrictStr = "postgres"
+    """ (optional) Name of the database holding the feature tables """
+
+    db_schema: StrictStr = "public"
+    """ (optional) Schema holding the feature tables """
+
+    user: Optional[StrictStr] = None
+    """ (optional) User name used to connect to the server """
+
+    password: Optional[StrictStr] = None
+    """ (optional) Password used to connect to the server """
+
+    sslmode: Optional[StrictStr] = None
+    """ (optional) SSL mode of the connections, e.g. "require" """
+
+    min_connections: PositiveInt = 1
+    """ (optional) Number of connections the pool keeps open """
+
+    max_connections: PositiveInt = 10
+    """ (optional) Maximum number of connections of the pool, i.e. of threads reading or writing features at the
+     same time. Other threads wait for a connection to be available. """
+
+
+class PostgresOnlineStore(OnlineStore):
+    """
+    Online store which keeps the features in PostgreSQL tables, one per feature view, with one row per entity and
+    feature.
+
+    Features are materialized by copying them into a temporary staging table, which is then merged into the table of
+    the feature view with a single upsert. Online reads look all the entities of a feature view up with a single
+    query.
+    """
+
+    def __init__(self):
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_pid: Optional[int] = None
+        self._pool_lock = threading.Lock()
+        self._pool_slots: Optional[threading.BoundedSemaphore] = None
+
+    def _get_pool(
+        self, config: RepoConfig
+    ) -> Tuple["ThreadedConnectionPool", threading.BoundedSemaphore]:
+        online_config = config.online_store
+        assert isinstance(online_config, PostgresOnlineStoreConfig)
+
+        # Connections can't be shared with forked processes, so each process opens its own pool
+        with self._pool_lock:
+            if not self._pool or self._pool_pid != os.getpid():
+                # The pool raises PoolError instead of waiting when all its connections are borrowed, so threads
+                # acquire a slot before borrowing one
+                self._pool_slots = threading.BoundedSemaphore(
+                    online_config.max_connections
+                )
+                self._pool = ThreadedConnectionPool(
+                    online_config.min_connections,
+                    online_config.max_connections,
+                    host=online_config.host,
+                    port=online_config.port,
+                    dbname=online_config.database,
+                    user=online_config.user,
+                    password=online_config.password,
+                    sslmode=online_config.sslmode,
+                )
+                self._pool_pid = os.getpid()
+            assert self._pool_slots is not None
+            return self._pool, self._pool_slots
+
+    @contextmanager
+    def _get_conn(
+        self, config: RepoConfig
+    ) -> Iterator["psycopg2.extensions.connection"]:
+        """
+        Borrows a connection from the pool for a transaction, which is committed if the block succeeds and rolled
+        back otherwise. Threads wait for a connection to be returned when all of them are borrowed.
+        """
+        pool, pool_slots = self._get_pool(config)
+        with pool_slots:
+            conn = pool.getconn()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                pool.putconn(conn)
+
+    def online_write_batch(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        # A row can only be merged once per upsert, so the last write of each entity and feature wins
+        rows: Dict[Tuple[bytes, str], Tuple[bytes, datetime, Optional[datetime]]] = {}
+        for entity_key, values, timestamp, created_ts in data:
+            entity_key_bin = serialize_entity_key(entity_key)
+            timestamp = _to_naive_utc(timestamp)
+            if created_ts is not None:
+                created_ts = _to_naive_utc(created_ts)
+            for feature_name, val in values.items():
+                rows[(entity_key_bin, feature_name)] = (
+                    val.SerializeToString(),
+                    timestamp,
+                    created_ts,
+                )
+
+        buffer = io.StringIO()
+        for (
+            (entity_key_bin, feature_name),
+            (value, timestamp, created_ts),
+        ) in rows.items():
+            buffer.write(
+                "\t".join(
+                    [
+                        _copy_bytea(entity_key_bin),
+                        _copy_text(feature_name),
+                        _copy_bytea(value),
+                        timestamp.isoformat(),
+                        created_ts.isoformat() if created_ts is not None else "\\N",
+                    ]
+                )
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+
+        table_id = _table_id(config, table)
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            cur.execute(
+                sql.SQL(
+                    "CREATE TEMPORARY TABLE feast_staging (LIKE {}) ON COMMIT DROP"
+                ).format(table_id)
+            )
+            cur.copy_expert(
+                "COPY feast_staging (entity_key, feature_name, value, event_ts, created_ts) FROM STDIN",
+                buffer,
+            )
+            cur.execute(
+                sql.SQL(
+                    """
+                    INSERT INTO {} (entity_key, feature_name, value, event_ts, created_ts)
+                    SELECT entity_key, feature_name, value, event_ts, created_ts FROM feast_staging
+                    ON CONFLICT (entity_key, feature_name) DO UPDATE SET
+                        value = EXCLUDED.value,
+                        event_ts = EXCLUDED.event_ts,
+                        created_ts = EXCLUDED.created_ts
+                    """
+                ).format(table_id)
+            )
+        if progress:
+            progress(len(data))
+
+    def online_read(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        entity_key_bins = [
+            serialize_entity_key(entity_key) for entity_key in entity_keys
+        ]
+        if not entity_key_bins:
+            return []
+
+        query = sql.SQL(
+            "SELECT entity_key, feature_name, value, event_ts FROM {} WHERE entity_key = ANY(%s)"
+        ).format(_table_id(config, table))
+        params: List[Any] = [
+            [psycopg2.Binary(entity_key_bin) for entity_key_bin in set(entity_key_bins)]
+        ]
+        if requested_features is not None:
+            query += sql.SQL(" AND feature_name = ANY(%s)")
+            params.append(list(requested_features))
+
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall()
+
+        values: Dict[bytes, Tuple[datetime, Dict[str, ValueProto]]] = {}
+        for entity_key_bin, feature_name, value_bin, event_ts in rows:
+            val = ValueProto()
+            val.ParseFromString(bytes(value_bin))
+            values.setdefault(bytes(entity_key_bin), (event_ts, {}))[1][
+                feature_name
+            ] = val
+
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        for entity_key_bin in entity_key_bins:
+            row = values.get(entity_key_bin)
+            result.append((row[0], dict(row[1])) if row is not None else (None, None))
+        return result
+
+    def update(
+        self,
+        config: RepoConfig,
+        tables_to_delete: Sequence[Union[FeatureTable, FeatureView]],
+        tables_to_keep: Sequence[Union[FeatureTable, FeatureView]],
+        entities_to_delete: Sequence[Entity],
+        entities_to_keep: Sequence[Entity],
+        partial: bool,
+    ):
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            for table in tables_to_keep:
+                cur.execute(
+                    sql.SQL(
+                        """
+                        CREATE TABLE IF NOT EXISTS {} (
+                            entity_key BYTEA,
+                            feature_name TEXT,
+                            value BYTEA,
+                            event_ts TIMESTAMP,
+                            created_ts TIMESTAMP,
+                            PRIMARY KEY (entity_key, feature_name)
+                        )
+                        """
+                    ).format(_table_id(config, table))
+                )
+            for table in tables_to_delete:
+                cur.execute(
+                    sql.SQL("DROP TABLE IF EXISTS {}").format(_table_id(config, table))
+                )
+
+    def teardown(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Union[FeatureTable, FeatureView]],
+        entities: Sequence[Entity],
+    ):
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            for table in tables:
+                cur.execute(
+                    sql.SQL("DROP TABLE IF EXISTS {}").format(_table_id(config, table))
+                )
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._pool and self._pool_pid == os.getpid():
+                self._pool.closeall()
+            self._pool = None
+            self._pool_pid = None
+            self._pool_slots = None
+
+
+def _table_id(
+    config: RepoConfig, table: Union[FeatureTable, FeatureView]
+) -> "sql.Identifier":
+    assert isinstance(config.online_store, PostgresOnlineStoreConfig)
+    return sql.Identifier(
+        config.online_store.db_schema, f"{config.project}_{table.name}"
+    )
+
+
+def _copy_bytea(value: bytes) -> str:
+    # The hex escape of bytea literals starts with a backslash, which has to be escaped in COPY's text format
+    return "\\\\x" + value.hex()
+
+
+def _copy_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import time
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from google.protobuf.timestamp_pb2 import Timestamp
-from pydantic import StrictStr
+from pydantic import StrictBool, StrictInt, StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureTable, FeatureView, RepoConfig, utils
@@ -37,6 +38,21 @@ except ImportError as e:
 
 EX_SECONDS = 253402300799
 
+# Sets the features of an entity key, then extends its expiry to ARGV[1] milliseconds from now, or removes it if
+# ARGV[1] is negative. Feature views with the same entities share their keys, so an expiry is never shortened, keys
+# without expiry keep none, and rows which already expired (ARGV[1] is 0) don't set one, which would delete the
+# features of the other feature views along with the row.
+HSET_AND_EXTEND_EXPIRY_SCRIPT = """
+local ttl = redis.call('PTTL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+local expire_in = tonumber(ARGV[1])
+if expire_in < 0 then
+    redis.call('PERSIST', KEYS[1])
+elseif expire_in > 0 and ttl ~= -1 and expire_in > ttl then
+    redis.call('PEXPIRE', KEYS[1], expire_in)
+end
+"""
+
 
 class RedisType(str, Enum):
     redis = "redis"
@@ -56,6 +72,16 @@ class RedisOnlineStoreConfig(FeastConfigBaseModel):
     """Connection string containing the host, port, and configuration parameters for Redis
      format: host:port,parameter1,parameter2 eg. redis:6379,db=0 """
 
+    write_batch_size: StrictInt = 1000
+    """(optional) Number of rows sent to Redis in a single pipeline during materialization"""
+
+    key_expiry: StrictBool = False
+    """(optional) If true, entity keys are set to expire once the rows written to them are older than the ttl of
+     their feature view, so that stale entities are evicted by Redis. Feature views sharing the same entities are
+     stored under the same keys, whose expiry is only ever extended: keys expire once the rows of all their feature
+     views are stale, and never if one of them has no ttl. Rows which are already stale when they are written don't
+     set an expiry. Requires Redis 4.0 or later."""
+
 
 class RedisOnlineStore(OnlineStore):
     _client: Optional[Union[Redis, RedisCluster]] = None
@@ -121,7 +147,7 @@ class RedisOnlineStore(OnlineStore):
             startup_nodes, kwargs = self._parse_connection_string(
                 online_store_config.connection_string
             )
-            if online_store_config.type == RedisType.redis_cluster:
+            if online_store_config.redis_type == RedisType.redis_cluster:
                 kwargs["startup_nodes"] = startup_nodes
                 self._client = RedisCluster(**kwargs)
             else:
@@ -130,6 +156,11 @@ class RedisOnlineStore(OnlineStore):
                 self._client = Redis(**kwargs)
         return self._client
 
+    def close(self) -> None:
+        if self._client:
+            self._client.connection_pool.disconnect()
+            self._client = None
+
     def online_write_batch(
         self,
         config: RepoConfig,
@@ -145,27 +176,71 @@ class RedisOnlineStore(OnlineStore):
         client = self._get_client(online_store_config)
         project = config.project
 
-        entity_hset = {}
         feature_view = table.name
+        ts_key = f"_ts:{feature_view}"
+        ex_key = f"_ex:{feature_view}"
+        feature_keys: Dict[str, bytes] = {}
+
+        key_expiry = online_store_config.key_expiry and isinstance(table, FeatureView)
+        ttl = table.ttl if isinstance(table, FeatureView) and key_expiry else None
 
         ex = Timestamp()
         ex.seconds = EX_SECONDS
         ex_str = ex.SerializeToString()
 
-        for entity_key, values, timestamp, created_ts in data:
-            redis_key_bin = _redis_key(project, entity_key)
-            ts = Timestamp()
-            ts.seconds = int(utils.make_tzaware(timestamp).timestamp())
-            entity_hset[f"_ts:{feature_view}"] = ts.SerializeToString()
-            entity_hset[f"_ex:{feature_view}"] = ex_str
-
-            for feature_name, val in values.items():
-                f_key = _mmh3(f"{feature_view}:{feature_name}")
-                entity_hset[f_key] = val.SerializeToString()
-
-            client.hset(redis_key_bin, mapping=entity_hset)
-            if progress:
-                progress(1)
+        with client.pipeline(transaction=False) as pipe:
+            rows_in_batch = 0
+            for entity_key, values, timestamp, created_ts in data:
+                redis_key_bin = _redis_key(project, entity_key)
+                timestamp = utils.make_tzaware(timestamp)
+                ts = Timestamp()
+                ts.seconds = int(timestamp.timestamp())
+                entity_hset: Dict[Union[str, bytes], bytes] = {
+                    ts_key: ts.SerializeToString()
+                }
+
+                if ttl:
+                    expires_at = timestamp + ttl
+                    ex = Timestamp()
+                    ex.seconds = int(expires_at.timestamp())
+                    entity_hset[ex_key] = ex.SerializeToString()
+                    expire_in_ms = max(
+                        int((expires_at.timestamp() - time.time()) * 1000), 0
+                    )
+                else:
+                    entity_hset[ex_key] = ex_str
+                    expire_in_ms = -1
+
+                for feature_name, val in values.items():
+                    f_key = feature_keys.get(feature_name)
+                    if f_key is None:
+                        f_key = feature_keys[feature_name] = _mmh3(
+                            f"{feature_view}:{feature_name}"
+                        )
+                    entity_hset[f_key] = val.SerializeToString()
+
+                if key_expiry:
+                    pipe.eval(
+                        HSET_AND_EXTEND_EXPIRY_SCRIPT,
+                        1,
+                        redis_key_bin,
+                        expire_in_ms,
+                        *(item for field in entity_hset.items() for item in field),
+                    )
+                else:
+                    pipe.hset(redis_key_bin, mapping=entity_hset)
+
+                rows_in_batch += 1
+                if rows_in_batch == online_store_config.write_batch_size:
+                    pipe.execute()
+                    if progress:
+                        progress(rows_in_batch)
+                    rows_in_batch = 0
+
+            if rows_in_batch:
+                pipe.execute()
+                if progress:
+                    progress(rows_in_batch)
 
     def online_read(
         self,
@@ -174,42 +249,88 @@ class RedisOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        return self.online_read_many(
+            config, [(table, requested_features)], entity_keys
+        )[0]
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
         online_store_config = config.online_store
         assert isinstance(online_store_config, RedisOnlineStoreConfig)
 
         client = self._get_client(online_store_config)
-        feature_view = table.name
         project = config.project
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
-
-        if not requested_features:
-            requested_features = [f.name for f in table.features]
-
-        for entity_key in entity_keys:
-            redis_key_bin = _redis_key(project, entity_key)
-            hset_keys = [_mmh3(f"{feature_view}:{k}") for k in requested_features]
-            ts_key = f"_ts:{feature_view}"
-            hset_keys.append(ts_key)
-            values = client.hmget(redis_key_bin, hset_keys)
-            requested_features.append(ts_key)
-            res_val = dict(zip(requested_features, values))
-
-            res_ts = Timestamp()
-            ts_val = res_val.pop(ts_key)
-            if ts_val:
-                res_ts.ParseFromString(ts_val)
-
-            res = {}
-            for feature_name, val_bin in res_val.items():
-                val = ValueProto()
-                if val_bin:
-                    val.ParseFromString(val_bin)
-                res[feature_name] = val
-
-            if not res:
-                result.append((None, None))
-            else:
-                timestamp = datetime.fromtimestamp(res_ts.seconds)
-                result.append((timestamp, res))
-        return result
+        # The features of all the tables are stored in the same hash for a given entity key, so they are all read
+        # with a single HMGET per entity key. Each table gets a slice of the values it returns.
+        hset_keys: List[Union[str, bytes]] = []
+        table_slices = []
+        for table, requested_features in tables:
+            if not requested_features:
+                requested_features = [f.name for f in table.features]
+            table_hset_keys = _get_hset_keys(table.name, requested_features)
+            table_slices.append(
+                (
+                    requested_features,
+                    slice(len(hset_keys), len(hset_keys) + len(table_hset_keys)),
+                )
+            )
+            hset_keys.extend(table_hset_keys)
+
+        # All the entity keys are read in a single round trip. In cluster mode, the pipeline groups the commands
+        # by node and sends them to all the nodes before reading any reply.
+        with client.pipeline(transaction=False) as pipe:
+            for entity_key in entity_keys:
+                pipe.hmget(_redis_key(project, entity_key), hset_keys)
+            values_per_entity_key = pipe.execute()
+
+        return [
+            [
+                _get_features_for_entity(values[table_slice], requested_features)
+                for values in values_per_entity_key
+            ]
+            for requested_features, table_slice in table_slices
+        ]
+
+
+def _get_hset_keys(
+    feature_view: str, requested_features: List[str]
+) -> List[Union[str, bytes]]:
+    """
+    Returns the keys of the requested features in the hash of an entity, followed by the key of the timestamp of
+    the feature view.
+    """
+    hset_keys: List[Union[str, bytes]] = [
+        _mmh3(f"{feature_view}:{k}") for k in requested_features
+    ]
+    hset_keys.append(f"_ts:{feature_view}")
+    return hset_keys
+
+
+def _get_features_for_entity(
+    values: List[Optional[bytes]], requested_features: List[str],
+) -> Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]:
+    """
+    Parses the values returned by HMGET for the hset keys of the requested features, followed by the timestamp key.
+    """
+    res_ts = Timestamp()
+    ts_val = values[-1]
+    if ts_val:
+        res_ts.ParseFromString(ts_val)
+
+    res = {}
+    for feature_name, val_bin in zip(requested_features, values):
+        val = ValueProto()
+        if val_bin:
+            val.ParseFromString(val_bin)
+        res[feature_name] = val
+
+    if not res:
+        return None, None
+    else:
+        timestamp = datetime.fromtimestamp(res_ts.seconds)
+        return timestamp, res
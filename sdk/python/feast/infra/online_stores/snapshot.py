@@ -0,0 +1,383 @@
+# Copyright 2021 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from stat import S_IMODE
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import mmh3
+import numpy as np
+from pydantic import StrictStr
+from pydantic.schema import Literal
+
+from feast import Entity, FeatureTable
+from feast.feature_view import FeatureView
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.helpers import (
+    _FEATURE_HEADER,
+    _ROW_HEADER,
+    _pack_row_header,
+    _to_naive_utc,
+    _unpack_row_header,
+)
+from feast.infra.online_stores.online_store import OnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import FeastConfigBaseModel, RepoConfig
+
+# A snapshot file holds the feature rows of a feature view:
+# - A header with the magic bytes, the format version, the number of rows and the size of the feature names
+# - The names of the features, separated by newlines
+# - The 64 bit hashes of the serialized entity keys of the rows, in ascending order
+# - One index entry per row, in the same order as the hashes, locating its entity key and value in the data region
+# - The data region, holding the serialized entity keys and values of the rows
+# The value of a row is its event timestamp, followed by the serialized ValueProto of each of its features, tagged
+# with the position of its name.
+SNAPSHOT_MAGIC = b"FEASTSNP"
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct("<8sIQQ")
+_INDEX_ENTRY = np.dtype(
+    [
+        ("key_offset", "<u8"),
+        ("key_len", "<u4"),
+        ("value_offset", "<u8"),
+        ("value_len", "<u4"),
+    ]
+)
+
+# Feature values of a row, by feature name
+RowValues = Dict[str, ValueProto]
+
+# Serialized feature values of a row, by feature name
+RowValueBins = Dict[str, bytes]
+
+
+class SnapshotOnlineStoreConfig(FeastConfigBaseModel):
+    """ Online store config for the memory-mapped snapshot store """
+
+    type: Literal[
+        "snapshot", "feast.infra.online_stores.snapshot.SnapshotOnlineStore"
+    ] = "snapshot"
+    """ Online store type selector"""
+
+    path: StrictStr = "data/online_snapshots"
+    """ (optional) Path of the directory holding the snapshot file of each feature view """
+
+
+class SnapshotOnlineStore(OnlineStore):
+    """
+    Online store which writes each feature view into an immutable snapshot file, read through memory mapping.
+
+    Materializing a feature view writes a new snapshot, merging the new feature rows with those of the current
+    snapshot, and atomically replaces the current snapshot with it. Readers, which can be many serving processes,
+    map the files read-only and share them through the page cache. They switch to the new snapshot of a feature view
+    the first time they read it after it has been replaced.
+
+    Each online_write_batch call rewrites the whole snapshot of the feature view, so its cost grows with the number
+    of rows in the snapshot, not only with the number of rows written. The values of the rows which are not written
+    are copied without being parsed. Rows are meant to be written in few large batches, e.g. materialization writes
+    all the rows of a feature view in a single call.
+
+    Snapshots are meant to be written by a single process at a time, e.g. `feast materialize`.
+    """
+
+    def __init__(self):
+        self._readers: Dict[str, _SnapshotReader] = {}
+
+    @staticmethod
+    def _get_snapshot_dir(config: RepoConfig) -> Path:
+        assert isinstance(config.online_store, SnapshotOnlineStoreConfig)
+
+        path = Path(config.online_store.path)
+        if config.repo_path and not path.is_absolute():
+            path = config.repo_path / path
+        return path
+
+    def _get_snapshot_path(
+        self, config: RepoConfig, table: Union[FeatureTable, FeatureView]
+    ) -> Path:
+        return (
+            self._get_snapshot_dir(config) / f"{config.project}_{table.name}.snapshot"
+        )
+
+    def _get_reader(self, path: Path) -> Optional["_SnapshotReader"]:
+        key = str(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._readers.pop(key, None)
+            return None
+        reader = self._readers.get(key)
+        # The snapshot is replaced as a whole, so a new file means a new snapshot
+        if reader is None or reader.file_id != (stat.st_dev, stat.st_ino):
+            reader = _SnapshotReader(path)
+            self._readers[key] = reader
+        return reader
+
+    def online_write_batch(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        path = self._get_snapshot_path(config, table)
+
+        rows: Dict[bytes, Tuple[datetime, RowValueBins]] = {}
+        reader = self._get_reader(path)
+        if reader is not None:
+            rows.update(reader.read_all())
+        for entity_key, values, timestamp, _ in data:
+            entity_key_bin = serialize_entity_key(entity_key)
+            value_bins = {
+                feature_name: val.SerializeToString()
+                for feature_name, val in values.items()
+            }
+            row = rows.get(entity_key_bin)
+            # Features which are not written keep their current values
+            if row is not None:
+                value_bins = {**row[1], **value_bins}
+            rows[entity_key_bin] = (_to_naive_utc(timestamp), value_bins)
+
+        _write_snapshot(path, rows)
+        if progress:
+            progress(len(data))
+
+    def online_read(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        reader = self._get_reader(self._get_snapshot_path(config, table))
+        if reader is None:
+            return [(None, None)] * len(entity_keys)
+        return reader.read(
+            [serialize_entity_key(entity_key) for entity_key in entity_keys],
+            requested_features,
+        )
+
+    def update(
+        self,
+        config: RepoConfig,
+        tables_to_delete: Sequence[Union[FeatureTable, FeatureView]],
+        tables_to_keep: Sequence[Union[FeatureTable, FeatureView]],
+        entities_to_delete: Sequence[Entity],
+        entities_to_keep: Sequence[Entity],
+        partial: bool,
+    ):
+        self._get_snapshot_dir(config).mkdir(parents=True, exist_ok=True)
+        for table in tables_to_delete:
+            self._delete_snapshot(config, table)
+
+    def teardown(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Union[FeatureTable, FeatureView]],
+        entities: Sequence[Entity],
+    ):
+        for table in tables:
+            self._delete_snapshot(config, table)
+
+    def close(self) -> None:
+        # The mappings are closed once they are garbage collected, since reads in flight may still use them
+        self._readers = {}
+
+    def _delete_snapshot(
+        self, config: RepoConfig, table: Union[FeatureTable, FeatureView]
+    ):
+        path = self._get_snapshot_path(config, table)
+        self._readers.pop(str(path), None)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+class _SnapshotReader:
+    """
+    Memory mapping of a snapshot file, looking entity keys up by binary search of their hashes.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self.file_id = (stat.st_dev, stat.st_ino)
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, num_rows, names_len = _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} snapshot")
+        offset = _HEADER.size
+        names = bytes(self._mmap[offset : offset + names_len]).decode("utf-8")
+        self.feature_names = names.split("\n") if names else []
+        offset += names_len
+        self.hashes = np.frombuffer(
+            self._mmap, dtype="<u8", count=num_rows, offset=offset
+        )
+        offset += self.hashes.nbytes
+        self.index = np.frombuffer(
+            self._mmap, dtype=_INDEX_ENTRY, count=num_rows, offset=offset
+        )
+
+    def _find(self, entity_key_bin: bytes, key_hash: int, position: int) -> int:
+        # Rows with the same hash are next to each other, their entity keys tell them apart
+        while position < len(self.hashes) and self.hashes[position] == key_hash:
+            entry = self.index[position]
+            key_offset = int(entry["key_offset"])
+            key_end = key_offset + int(entry["key_len"])
+            if self._mmap[key_offset:key_end] == entity_key_bin:
+                return position
+            position += 1
+        return -1
+
+    def read(
+        self, entity_key_bins: List[bytes], requested_features: Optional[List[str]]
+    ) -> List[Tuple[Optional[datetime], Optional[RowValues]]]:
+        key_hashes = np.array(
+            [_hash(entity_key_bin) for entity_key_bin in entity_key_bins], dtype="<u8",
+        )
+        positions = np.searchsorted(self.hashes, key_hashes)
+        requested_idxs = (
+            {
+                idx
+                for idx, feature_name in enumerate(self.feature_names)
+                if feature_name in requested_features
+            }
+            if requested_features is not None
+            else None
+        )
+
+        result: List[Tuple[Optional[datetime], Optional[RowValues]]] = []
+        for entity_key_bin, key_hash, position in zip(
+            entity_key_bins, key_hashes, positions
+        ):
+            position = self._find(entity_key_bin, key_hash, int(position))
+            if position < 0:
+                result.append((None, None))
+                continue
+            event_ts, res = self._read_value(position, requested_idxs)
+            result.append((event_ts, res) if res else (None, None))
+        return result
+
+    def read_all(self) -> Dict[bytes, Tuple[datetime, RowValueBins]]:
+        """
+        Returns all the rows of the snapshot, with their serialized feature values.
+        """
+        rows = {}
+        for position, entry in enumerate(self.index):
+            key_offset = int(entry["key_offset"])
+            key_end = key_offset + int(entry["key_len"])
+            entity_key_bin = self._mmap[key_offset:key_end]
+            rows[entity_key_bin] = self._read_value_bins(position, None)
+        return rows
+
+    def _read_value(
+        self, position: int, requested_idxs: Optional[set]
+    ) -> Tuple[datetime, RowValues]:
+        event_ts, value_bins = self._read_value_bins(position, requested_idxs)
+        res = {}
+        for feature_name, value_bin in value_bins.items():
+            val = ValueProto()
+            val.ParseFromString(value_bin)
+            res[feature_name] = val
+        return event_ts, res
+
+    def _read_value_bins(
+        self, position: int, requested_idxs: Optional[set]
+    ) -> Tuple[datetime, RowValueBins]:
+        value_offset = int(self.index[position]["value_offset"])
+        event_ts, num_features = _unpack_row_header(self._mmap, value_offset)
+        offset = value_offset + _ROW_HEADER.size
+        res = {}
+        for _ in range(num_features):
+            idx, value_len = _FEATURE_HEADER.unpack_from(self._mmap, offset)
+            offset += _FEATURE_HEADER.size
+            if requested_idxs is None or idx in requested_idxs:
+                res[self.feature_names[idx]] = self._mmap[offset : offset + value_len]
+            offset += value_len
+        return event_ts, res
+
+
+def _write_snapshot(path: Path, rows: Dict[bytes, Tuple[datetime, RowValueBins]]):
+    """
+    Writes a snapshot of the given rows to a temporary file, which then atomically replaces the snapshot at path.
+    """
+    feature_names = sorted(
+        {feature_name for _, values in rows.values() for feature_name in values}
+    )
+    feature_idxs = {feature_name: idx for idx, feature_name in enumerate(feature_names)}
+    names = "\n".join(feature_names).encode("utf-8")
+
+    entity_key_bins = sorted(rows, key=_hash)
+    hashes = np.array([_hash(key) for key in entity_key_bins], dtype="<u8")
+    index = np.zeros(len(entity_key_bins), dtype=_INDEX_ENTRY)
+
+    data = bytearray()
+    data_offset = (
+        _HEADER.size + len(names) + hashes.nbytes + index.itemsize * len(index)
+    )
+    for position, entity_key_bin in enumerate(entity_key_bins):
+        event_ts, values = rows[entity_key_bin]
+        key_offset = data_offset + len(data)
+        data += entity_key_bin
+        value_offset = data_offset + len(data)
+        data += _pack_row_header(event_ts, len(values))
+        for feature_name, val_bin in values.items():
+            data += _FEATURE_HEADER.pack(feature_idxs[feature_name], len(val_bin))
+            data += val_bin
+        index[position] = (
+            key_offset,
+            len(entity_key_bin),
+            value_offset,
+            data_offset + len(data) - value_offset,
+        )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(rows), len(names))
+            )
+            f.write(names)
+            f.write(hashes.tobytes())
+            f.write(index.tobytes())
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates files which only their owner can read, while snapshots are read by serving processes
+        os.chmod(tmp_path, _snapshot_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _snapshot_mode(path: Path) -> int:
+    try:
+        return S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o644
+
+
+def _hash(entity_key_bin: bytes) -> int:
+    return mmh3.hash64(entity_key_bin, signed=False)[0]
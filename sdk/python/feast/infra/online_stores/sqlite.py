@@ -12,24 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
 import sqlite3
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-import pytz
-from pydantic import StrictStr
+from pydantic import PositiveInt, StrictInt, StrictStr
 from pydantic.schema import Literal
 
 from feast import Entity, FeatureTable
+from feast.errors import ReservedFeatureNameError
 from feast.feature_view import FeatureView
 from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.helpers import _to_naive_utc
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import FeastConfigBaseModel, RepoConfig
 
+# Number of host parameters a single statement can bind, with SQLite versions older than 3.32.0. Online reads
+# look up entity keys in chunks of at most this size.
+SQLITE_MAX_VARIABLES = 999
+
 
 class SqliteOnlineStoreConfig(FeastConfigBaseModel):
     """ Online store config for local (SQLite-based) store """
@@ -42,6 +52,53 @@ class SqliteOnlineStoreConfig(FeastConfigBaseModel):
     path: StrictStr = "data/online.db"
     """ (optional) Path to sqlite db """
 
+    journal_mode: Optional[
+        Literal["delete", "truncate", "persist", "memory", "wal", "off"]
+    ] = None
+    """ (optional) SQLite journal mode. "wal" lets features be read while they are being written. The journal mode
+     is persisted in the database file. """
+
+    synchronous: Optional[Literal["off", "normal", "full", "extra"]] = None
+    """ (optional) SQLite synchronous flag. "normal" is safe in "wal" journal mode and makes writes faster. """
+
+    page_size: Optional[PositiveInt] = None
+    """ (optional) SQLite page size in bytes. Only applies to databases created after it is set. """
+
+    cache_size: Optional[StrictInt] = None
+    """ (optional) SQLite page cache size, in pages if positive or in KiB if negative """
+
+    mmap_size: Optional[StrictInt] = None
+    """ (optional) Maximum number of bytes of the database file which SQLite reads through memory mapping """
+
+    table_layout: Literal["narrow", "wide"] = "narrow"
+    """ (optional) Table layout. "narrow" stores one row per entity and feature, "wide" stores one row per entity
+     with one column per feature, which makes reads and writes of many features cheaper. "wide" tables are separate
+     from "narrow" ones, so the online store has to be materialized again after switching layouts. """
+
+    connection_mode: Literal["read_write", "read_only", "immutable"] = "read_write"
+    """ (optional) "read_only" opens the database file read-only, e.g. for feature servers which read features
+     that another process materializes in "wal" journal mode. "immutable" also skips locking and change detection,
+     and must only be used for database files which are not written to while they are served. It ignores any
+     write-ahead log which has not been checkpointed. """
+
+
+class _ThreadConnection:
+    """ Holds the connection of a thread, which is released when the thread exits """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _release_conn(
+    conns: List[sqlite3.Connection], lock: threading.Lock, conn: sqlite3.Connection
+) -> None:
+    with lock:
+        if conn not in conns:
+            # Already closed by close()
+            return
+        conns.remove(conn)
+    conn.close()
+
 
 class SqliteOnlineStore(OnlineStore):
     """
@@ -49,7 +106,16 @@ class SqliteOnlineStore(OnlineStore):
     features.
     """
 
-    _conn: Optional[sqlite3.Connection] = None
+    _async_read_executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self):
+        # Connections are per thread, since a SQLite connection can only be used by one thread at a time. All of
+        # them are tracked so that close() can release them, and the connection of a thread is closed when the
+        # thread exits.
+        self._local = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._async_read_executor_lock = threading.Lock()
 
     @staticmethod
     def _get_db_path(config: RepoConfig) -> str:
@@ -64,14 +130,64 @@ class SqliteOnlineStore(OnlineStore):
             db_path = config.online_store.path
         return db_path
 
-    def _get_conn(self, config: RepoConfig):
-        if not self._conn:
-            db_path = self._get_db_path(config)
+    def _connect(self, config: RepoConfig) -> sqlite3.Connection:
+        db_path = self._get_db_path(config)
+        online_config = config.online_store
+        if online_config.connection_mode == "read_write":
             Path(db_path).parent.mkdir(exist_ok=True)
-            self._conn = sqlite3.connect(
-                db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            database, uri = db_path, False
+        else:
+            mode = (
+                "ro"
+                if online_config.connection_mode == "read_only"
+                else "ro&immutable=1"
             )
-        return self._conn
+            database, uri = f"{Path(db_path).absolute().as_uri()}?mode={mode}", True
+        conn = sqlite3.connect(
+            database,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            uri=uri,
+            # Connections are used by a single thread, but closed by whichever thread calls close()
+            check_same_thread=False,
+        )
+        # page_size has to be set before the journal mode, which creates the database file in "wal" mode. Both
+        # change the database file, so they are left to the writers of read-only connections.
+        pragmas = ["synchronous", "cache_size", "mmap_size"]
+        if online_config.connection_mode == "read_write":
+            pragmas = ["page_size", "journal_mode"] + pragmas
+        for pragma in pragmas:
+            value = getattr(online_config, pragma, None)
+            if value is not None:
+                conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    def _get_conn(self, config: RepoConfig) -> sqlite3.Connection:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = self._connect(config)
+            with self._conns_lock:
+                self._conns.append(conn)
+            holder = _ThreadConnection(conn)
+            # Thread local data is dropped when its thread exits
+            weakref.finalize(holder, _release_conn, self._conns, self._conns_lock, conn)
+            self._local.holder = holder
+        return holder.conn
+
+    def close(self) -> None:
+        with self._async_read_executor_lock:
+            executor, self._async_read_executor = self._async_read_executor, None
+        if executor:
+            # Wait for in flight reads, which use the connections below
+            executor.shutdown(wait=True)
+        with self._conns_lock:
+            conns = list(self._conns)
+            self._conns.clear()
+            # Threads which used the connections get new ones the next time they use the store. The previous
+            # thread local data is dropped outside of the lock, which its finalizers acquire.
+            local, self._local = self._local, threading.local()
+        del local
+        for conn in conns:
+            conn.close()
 
     def online_write_batch(
         self,
@@ -87,45 +203,12 @@ class SqliteOnlineStore(OnlineStore):
 
         project = config.project
 
-        with conn:
-            for entity_key, values, timestamp, created_ts in data:
-                entity_key_bin = serialize_entity_key(entity_key)
-                timestamp = _to_naive_utc(timestamp)
-                if created_ts is not None:
-                    created_ts = _to_naive_utc(created_ts)
-
-                for feature_name, val in values.items():
-                    conn.execute(
-                        f"""
-                            UPDATE {_table_id(project, table)}
-                            SET value = ?, event_ts = ?, created_ts = ?
-                            WHERE (entity_key = ? AND feature_name = ?)
-                        """,
-                        (
-                            # SET
-                            val.SerializeToString(),
-                            timestamp,
-                            created_ts,
-                            # WHERE
-                            entity_key_bin,
-                            feature_name,
-                        ),
-                    )
-
-                    conn.execute(
-                        f"""INSERT OR IGNORE INTO {_table_id(project, table)}
-                            (entity_key, feature_name, value, event_ts, created_ts)
-                            VALUES (?, ?, ?, ?, ?)""",
-                        (
-                            entity_key_bin,
-                            feature_name,
-                            val.SerializeToString(),
-                            timestamp,
-                            created_ts,
-                        ),
-                    )
-                if progress:
-                    progress(1)
+        if config.online_store.table_layout == "wide":
+            _write_wide_rows(conn, _wide_table_id(project, table), data)
+        else:
+            _write_narrow_rows(conn, _table_id(project, table), data)
+        if progress:
+            progress(len(data))
 
     def online_read(
         self,
@@ -134,34 +217,33 @@ class SqliteOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        pass
-        conn = self._get_conn(config)
-        cur = conn.cursor()
-
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
-
-        project = config.project
-        for entity_key in entity_keys:
-            entity_key_bin = serialize_entity_key(entity_key)
+        return _read_entity_keys(
+            self._get_conn(config), config, table, entity_keys, requested_features
+        )
 
-            cur.execute(
-                f"SELECT feature_name, value, event_ts FROM {_table_id(project, table)} WHERE entity_key = ?",
-                (entity_key_bin,),
-            )
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        # Asynchronous reads are run on dedicated threads, each with its own connection, so that they don't
+        # block the event loop.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_async_read_executor(config),
+            partial(self.online_read, config, table, entity_keys, requested_features),
+        )
 
-            res = {}
-            res_ts = None
-            for feature_name, val_bin, ts in cur.fetchall():
-                val = ValueProto()
-                val.ParseFromString(val_bin)
-                res[feature_name] = val
-                res_ts = ts
-
-            if not res:
-                result.append((None, None))
-            else:
-                result.append((res_ts, res))
-        return result
+    def _get_async_read_executor(self, config: RepoConfig) -> ThreadPoolExecutor:
+        with self._async_read_executor_lock:
+            if not self._async_read_executor:
+                self._async_read_executor = ThreadPoolExecutor(
+                    max_workers=config.online_serving.max_concurrent_reads,
+                    thread_name_prefix="feast_sqlite_read",
+                )
+            return self._async_read_executor
 
     def update(
         self,
@@ -175,7 +257,15 @@ class SqliteOnlineStore(OnlineStore):
         conn = self._get_conn(config)
         project = config.project
 
+        wide = config.online_store.table_layout == "wide"
+        if wide:
+            for table in tables_to_keep:
+                _validate_wide_feature_names(table)
+
         for table in tables_to_keep:
+            if wide:
+                _create_wide_table(conn, _wide_table_id(project, table), table)
+                continue
             conn.execute(
                 f"CREATE TABLE IF NOT EXISTS {_table_id(project, table)} (entity_key BLOB, feature_name TEXT, value BLOB, event_ts timestamp, created_ts timestamp,  PRIMARY KEY(entity_key, feature_name))"
             )
@@ -184,7 +274,10 @@ class SqliteOnlineStore(OnlineStore):
             )
 
         for table in tables_to_delete:
-            conn.execute(f"DROP TABLE IF EXISTS {_table_id(project, table)}")
+            if wide:
+                conn.execute(f"DROP TABLE IF EXISTS {_wide_table_id(project, table)}")
+            else:
+                conn.execute(f"DROP TABLE IF EXISTS {_table_id(project, table)}")
 
     def teardown(
         self,
@@ -192,18 +285,236 @@ class SqliteOnlineStore(OnlineStore):
         tables: Sequence[Union[FeatureTable, FeatureView]],
         entities: Sequence[Entity],
     ):
+        self.close()
         try:
             os.unlink(self._get_db_path(config))
         except FileNotFoundError:
             pass
 
 
+def _read_entity_keys(
+    conn: sqlite3.Connection,
+    config: RepoConfig,
+    table: Union[FeatureTable, FeatureView],
+    entity_keys: List[EntityKeyProto],
+    requested_features: Optional[List[str]] = None,
+) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+    if config.online_store.table_layout == "wide":
+        return _read_wide_rows(conn, config, table, entity_keys, requested_features)
+
+    cur = conn.cursor()
+
+    table_id = _table_id(config.project, table)
+    entity_key_bins = [serialize_entity_key(entity_key) for entity_key in entity_keys]
+
+    # Requested features are filtered in the query, unless they would leave too little room for entity keys
+    features = list(requested_features or ())
+    filter_features_in_query = len(features) <= SQLITE_MAX_VARIABLES // 2
+    query_features = features if filter_features_in_query else []
+    chunk_size = SQLITE_MAX_VARIABLES - len(query_features)
+
+    rows: Dict[bytes, Tuple[Optional[datetime], Dict[str, ValueProto]]] = {}
+    unique_entity_key_bins = list(dict.fromkeys(entity_key_bins))
+    for i in range(0, len(unique_entity_key_bins), chunk_size):
+        chunk = unique_entity_key_bins[i : i + chunk_size]
+        cur.execute(
+            _get_read_query(table_id, len(chunk), len(query_features)),
+            (*chunk, *query_features),
+        )
+        for entity_key_bin, feature_name, val_bin, ts in cur.fetchall():
+            if not filter_features_in_query and feature_name not in features:
+                continue
+            val = ValueProto()
+            val.ParseFromString(val_bin)
+            row = rows.get(entity_key_bin)
+            res = row[1] if row is not None else {}
+            res[feature_name] = val
+            rows[entity_key_bin] = (ts, res)
+
+    return [
+        rows.get(entity_key_bin, (None, None)) for entity_key_bin in entity_key_bins
+    ]
+
+
+@lru_cache(maxsize=128)
+def _get_read_query(table_id: str, num_entity_keys: int, num_features: int) -> str:
+    # The statement text is kept stable per table and chunk size, so that sqlite3 can reuse prepared statements
+    query = (
+        f"SELECT entity_key, feature_name, value, event_ts FROM {table_id} "
+        f"WHERE entity_key IN ({', '.join('?' * num_entity_keys)})"
+    )
+    if num_features:
+        query += f" AND feature_name IN ({', '.join('?' * num_features)})"
+    return query
+
+
+def _write_narrow_rows(
+    conn: sqlite3.Connection,
+    table_id: str,
+    data: List[
+        Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+    ],
+):
+    rows = []
+    for entity_key, values, timestamp, created_ts in data:
+        entity_key_bin = serialize_entity_key(entity_key)
+        timestamp = _to_naive_utc(timestamp)
+        if created_ts is not None:
+            created_ts = _to_naive_utc(created_ts)
+
+        for feature_name, val in values.items():
+            rows.append(
+                (
+                    entity_key_bin,
+                    feature_name,
+                    val.SerializeToString(),
+                    timestamp,
+                    created_ts,
+                )
+            )
+
+    with conn:
+        conn.executemany(
+            f"""INSERT INTO {table_id}
+                (entity_key, feature_name, value, event_ts, created_ts)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (entity_key, feature_name) DO UPDATE SET
+                value = excluded.value, event_ts = excluded.event_ts, created_ts = excluded.created_ts""",
+            rows,
+        )
+
+
+# Columns of wide tables which are not features. SQLite column names are case insensitive.
+_WIDE_TABLE_COLUMNS = {"entity_key", "event_ts", "created_ts"}
+
+
+def _validate_wide_feature_names(table: Union[FeatureTable, FeatureView]):
+    reserved = [
+        feature.name
+        for feature in table.features
+        if feature.name.lower() in _WIDE_TABLE_COLUMNS
+    ]
+    if reserved:
+        raise ReservedFeatureNameError(table.name, reserved)
+
+
+def _create_wide_table(
+    conn: sqlite3.Connection, table_id: str, table: Union[FeatureTable, FeatureView]
+):
+    # Each feature column holds a serialized ValueProto, so that every value type (including lists) round trips
+    feature_columns = "".join(
+        f", {_quote_identifier(feature.name)} BLOB" for feature in table.features
+    )
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {table_id} (entity_key BLOB PRIMARY KEY, event_ts timestamp, created_ts timestamp{feature_columns})"
+    )
+    # Add the columns of features which were added to the feature view since the table was created
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table_id})")}
+    for feature in table.features:
+        if feature.name not in columns:
+            conn.execute(
+                f"ALTER TABLE {table_id} ADD COLUMN {_quote_identifier(feature.name)} BLOB"
+            )
+
+
+def _write_wide_rows(
+    conn: sqlite3.Connection,
+    table_id: str,
+    data: List[
+        Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+    ],
+):
+    # Rows are grouped by the features they set, since features absent from a row keep their stored value
+    rows_by_features: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = {}
+    for entity_key, values, timestamp, created_ts in data:
+        timestamp = _to_naive_utc(timestamp)
+        if created_ts is not None:
+            created_ts = _to_naive_utc(created_ts)
+        rows_by_features.setdefault(tuple(values.keys()), []).append(
+            (
+                serialize_entity_key(entity_key),
+                timestamp,
+                created_ts,
+                *(val.SerializeToString() for val in values.values()),
+            )
+        )
+
+    with conn:
+        for feature_names, rows in rows_by_features.items():
+            conn.executemany(_get_wide_write_query(table_id, feature_names), rows)
+
+
+@lru_cache(maxsize=128)
+def _get_wide_write_query(table_id: str, feature_names: Tuple[str, ...]) -> str:
+    columns = ["event_ts", "created_ts"] + [
+        _quote_identifier(feature_name) for feature_name in feature_names
+    ]
+    return (
+        f"INSERT INTO {table_id} (entity_key, {', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * (len(columns) + 1))}) "
+        f"ON CONFLICT (entity_key) DO UPDATE SET "
+        + ", ".join(f"{column} = excluded.{column}" for column in columns)
+    )
+
+
+def _read_wide_rows(
+    conn: sqlite3.Connection,
+    config: RepoConfig,
+    table: Union[FeatureTable, FeatureView],
+    entity_keys: List[EntityKeyProto],
+    requested_features: Optional[List[str]] = None,
+) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+    cur = conn.cursor()
+
+    table_id = _wide_table_id(config.project, table)
+    entity_key_bins = [serialize_entity_key(entity_key) for entity_key in entity_keys]
+
+    feature_names = tuple(
+        feature.name
+        for feature in table.features
+        if requested_features is None or feature.name in requested_features
+    )
+
+    rows: Dict[bytes, Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = {}
+    unique_entity_key_bins = list(dict.fromkeys(entity_key_bins))
+    for i in range(0, len(unique_entity_key_bins), SQLITE_MAX_VARIABLES):
+        chunk = unique_entity_key_bins[i : i + SQLITE_MAX_VARIABLES]
+        cur.execute(_get_wide_read_query(table_id, len(chunk), feature_names), chunk)
+        for entity_key_bin, ts, *val_bins in cur.fetchall():
+            res = {}
+            for feature_name, val_bin in zip(feature_names, val_bins):
+                if val_bin is not None:
+                    val = ValueProto()
+                    val.ParseFromString(val_bin)
+                    res[feature_name] = val
+            if res:
+                rows[entity_key_bin] = (ts, res)
+
+    return [
+        rows.get(entity_key_bin, (None, None)) for entity_key_bin in entity_key_bins
+    ]
+
+
+@lru_cache(maxsize=128)
+def _get_wide_read_query(
+    table_id: str, num_entity_keys: int, feature_names: Tuple[str, ...]
+) -> str:
+    columns = "".join(
+        f", {_quote_identifier(feature_name)}" for feature_name in feature_names
+    )
+    return (
+        f"SELECT entity_key, event_ts{columns} FROM {table_id} "
+        f"WHERE entity_key IN ({', '.join('?' * num_entity_keys)})"
+    )
+
+
 def _table_id(project: str, table: Union[FeatureTable, FeatureView]) -> str:
     return f"{project}_{table.name}"
 
 
-def _to_naive_utc(ts: datetime):
-    if ts.tzinfo is None:
-        return ts
-    else:
-        return ts.astimezone(pytz.utc).replace(tzinfo=None)
+def _wide_table_id(project: str, table: Union[FeatureTable, FeatureView]) -> str:
+    return f"{project}_{table.name}_wide"
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
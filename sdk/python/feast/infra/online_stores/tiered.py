@@ -0,0 +1,370 @@
+# Copyright 2021 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from pydantic import validator
+from pydantic.schema import Literal
+
+from feast.entity import Entity
+from feast.feature_table import FeatureTable
+from feast.feature_view import FeatureView
+from feast.infra.caching_provider import (
+    OnlineCacheStats,
+    Row,
+    _cache_ttl_seconds,
+    _CacheLookup,
+    _OnlineFeatureCache,
+)
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.helpers import (
+    _to_naive_utc,
+    get_online_store_from_config,
+)
+from feast.infra.online_stores.online_store import OnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import (
+    FeastConfigBaseModel,
+    OnlineCacheConfig,
+    RepoConfig,
+    get_online_config_from_type,
+)
+
+HOT_TIER = "hot"
+REMOTE_TIER = "remote"
+
+
+class HotTierConfig(OnlineCacheConfig):
+    """ Configuration of the in-process hot tier of a tiered online store. It has the same options as the online
+     feature cache of online_serving, but admits feature rows with the TinyLFU policy by default. """
+
+    admission: Literal["always", "tinylfu"] = "tinylfu"
+    """ str: Admission policy of the hot tier once it is full. "tinylfu" only admits a feature row if it is
+     requested more often than the least recently used row, which it then evicts. "always" evicts the least
+     recently used row. """
+
+
+class TieredOnlineStoreConfig(FeastConfigBaseModel):
+    """ Online store config for the tiered store """
+
+    type: Literal[
+        "tiered", "feast.infra.online_stores.tiered.TieredOnlineStore"
+    ] = "tiered"
+    """ Online store type selector"""
+
+    remote: Any
+    """ Online store config of the remote tier, which holds all the features. It has the same format as the online
+     store config of feature_store.yaml. """
+
+    hot_tier: HotTierConfig = HotTierConfig()
+    """ (optional) Configuration of the in-process hot tier """
+
+    @validator("remote", pre=True)
+    def _validate_remote(cls, v):
+        if isinstance(v, str):
+            return get_online_config_from_type(v)()
+        if isinstance(v, dict):
+            if "type" not in v:
+                raise ValueError("The type of the remote online store must be set")
+            return get_online_config_from_type(v["type"])(**v)
+        return v
+
+
+@dataclass(frozen=True)
+class OnlineTierStats:
+    """
+    Read latency of a tier of a tiered online store. The hits, evictions and rejections of the hot tier are
+    counted by its OnlineCacheStats.
+
+    Attributes:
+        reads: Number of reads served by the tier.
+        rows: Number of feature rows looked up in the tier.
+        total_latency_seconds: Total time spent reading from the tier.
+        max_latency_seconds: Longest time spent in a single read from the tier.
+    """
+
+    reads: int
+    rows: int
+    total_latency_seconds: float
+    max_latency_seconds: float
+
+
+class _TierCounters:
+    def __init__(self):
+        self.reads = 0
+        self.rows = 0
+        self.total_latency_seconds = 0.0
+        self.max_latency_seconds = 0.0
+
+    def record(self, rows: int, latency_seconds: float):
+        self.reads += 1
+        self.rows += rows
+        self.total_latency_seconds += latency_seconds
+        self.max_latency_seconds = max(self.max_latency_seconds, latency_seconds)
+
+
+class TieredOnlineStore(OnlineStore):
+    """
+    Online store which serves the frequently requested feature rows of another online store, the remote tier, from
+    a bounded in-process hot tier.
+
+    The remote tier holds all the features and remains the source of truth: features are written to it before the
+    hot tier, and rows missing from the hot tier are read from it. Rows enter the hot tier when they are read, or
+    when all the features of their feature view are written and the hot tier admits them. Writes invalidate the
+    other rows of their feature view. Writes made by other processes are only seen once the rows of the hot tier
+    expire.
+    """
+
+    def __init__(self):
+        self._remote: Optional[OnlineStore] = None
+        self._remote_config: Optional[RepoConfig] = None
+        self._config: Optional[RepoConfig] = None
+        self._hot_tier: Optional[_OnlineFeatureCache] = None
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._counters = {HOT_TIER: _TierCounters(), REMOTE_TIER: _TierCounters()}
+
+    def _get_remote(self, config: RepoConfig) -> Tuple[OnlineStore, RepoConfig]:
+        """
+        Returns the remote online store, and the repo config it is used with.
+        """
+        online_config = config.online_store
+        assert isinstance(online_config, TieredOnlineStoreConfig)
+
+        # Serving threads share the store, which must not create several remote stores and leak their clients
+        with self._lock:
+            if self._remote is None:
+                self._remote = get_online_store_from_config(online_config.remote)
+            if self._config is not config or self._remote_config is None:
+                self._remote_config = config.copy(
+                    update={"online_store": online_config.remote}
+                )
+                self._config = config
+            remote_config = self._remote_config
+            assert remote_config is not None
+            return self._remote, remote_config
+
+    def _get_hot_tier(self, config: RepoConfig) -> _OnlineFeatureCache:
+        online_config = config.online_store
+        assert isinstance(online_config, TieredOnlineStoreConfig)
+
+        with self._lock:
+            if self._hot_tier is None:
+                self._hot_tier = _OnlineFeatureCache(
+                    online_config.hot_tier.max_entries,
+                    online_config.hot_tier.admission,
+                )
+            return self._hot_tier
+
+    def cache_stats(self) -> OnlineCacheStats:
+        """
+        Returns the hit, miss, eviction and rejection counters of the hot tier, and its current size. The counters
+        are reset when the store is closed.
+        """
+        hot_tier = self._hot_tier
+        if hot_tier is None:
+            return OnlineCacheStats(hits=0, misses=0, evictions=0, size=0)
+        return hot_tier.stats()
+
+    def tier_stats(self) -> Dict[str, OnlineTierStats]:
+        """
+        Returns the read counters and latencies of the "hot" and "remote" tiers. The counters are reset when the
+        store is closed.
+        """
+        with self._stats_lock:
+            return {
+                tier: OnlineTierStats(
+                    reads=counters.reads,
+                    rows=counters.rows,
+                    total_latency_seconds=counters.total_latency_seconds,
+                    max_latency_seconds=counters.max_latency_seconds,
+                )
+                for tier, counters in self._counters.items()
+            }
+
+    def _record(self, tier: str, rows: int, started_at: float):
+        latency_seconds = time.perf_counter() - started_at
+        with self._stats_lock:
+            self._counters[tier].record(rows, latency_seconds)
+
+    def online_write_batch(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        remote, remote_config = self._get_remote(config)
+        hot_tier = self._get_hot_tier(config)
+        try:
+            remote.online_write_batch(remote_config, table, data, progress)
+        finally:
+            hot_tier.invalidate(table.name)
+
+        # Rows are only written through when all their features are written, since the remote tier merges the
+        # features which are written with the ones it holds
+        if not isinstance(table, FeatureView):
+            return
+        online_config = config.online_store
+        assert isinstance(online_config, TieredOnlineStoreConfig)
+        ttl_seconds = _cache_ttl_seconds(online_config.hot_tier, table)
+        generation = hot_tier.generation(table.name)
+        table_features = {feature.name for feature in table.features}
+        for entity_key, values, timestamp, _ in data:
+            if table_features.issubset(values):
+                hot_tier.put(
+                    (table.name, None, serialize_entity_key(entity_key)),
+                    (_to_naive_utc(timestamp), dict(values)),
+                    ttl_seconds,
+                    generation,
+                )
+
+    def online_read(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Row]:
+        return self.online_read_many(
+            config, [(table, requested_features)], entity_keys
+        )[0]
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Row]]:
+        remote, remote_config = self._get_remote(config)
+        lookups = [
+            self._lookup(config, table, entity_keys, requested_features)
+            for table, requested_features in tables
+        ]
+        # The tables with rows missing from the hot tier are read together, for the entities missing from any of
+        # them
+        missing_idxs = sorted(
+            {idx for lookup in lookups for idx in lookup.missing_idxs}
+        )
+        tables_to_read = [
+            (table, lookup)
+            for (table, _), lookup in zip(tables, lookups)
+            if lookup.missing_idxs
+        ]
+        if tables_to_read:
+            started_at = time.perf_counter()
+            read_rows = remote.online_read_many(
+                remote_config,
+                [
+                    (table, lookup.requested_features)
+                    for table, lookup in tables_to_read
+                ],
+                [entity_keys[idx] for idx in missing_idxs],
+            )
+            self._record(REMOTE_TIER, sum(len(rows) for rows in read_rows), started_at)
+            for (table, lookup), rows in zip(tables_to_read, read_rows):
+                lookup.fill(dict(zip(missing_idxs, rows)))
+        return [lookup.rows for lookup in lookups]
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Row]:
+        remote, remote_config = self._get_remote(config)
+        lookup = self._lookup(config, table, entity_keys, requested_features)
+        if lookup.missing_idxs:
+            started_at = time.perf_counter()
+            read_rows = await remote.online_read_async(
+                remote_config,
+                table,
+                [entity_keys[idx] for idx in lookup.missing_idxs],
+                requested_features,
+            )
+            self._record(REMOTE_TIER, len(read_rows), started_at)
+            lookup.fill(dict(zip(lookup.missing_idxs, read_rows)))
+        return lookup.rows
+
+    def _lookup(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]],
+    ) -> _CacheLookup:
+        online_config = config.online_store
+        assert isinstance(online_config, TieredOnlineStoreConfig)
+        started_at = time.perf_counter()
+        lookup = _CacheLookup(
+            self._get_hot_tier(config),
+            table.name,
+            requested_features,
+            _cache_ttl_seconds(online_config.hot_tier, table),
+            online_config.hot_tier.negative_ttl_seconds,
+        )
+        lookup.get(entity_keys)
+        self._record(HOT_TIER, len(entity_keys), started_at)
+        return lookup
+
+    def update(
+        self,
+        config: RepoConfig,
+        tables_to_delete: Sequence[Union[FeatureTable, FeatureView]],
+        tables_to_keep: Sequence[Union[FeatureTable, FeatureView]],
+        entities_to_delete: Sequence[Entity],
+        entities_to_keep: Sequence[Entity],
+        partial: bool,
+    ):
+        remote, remote_config = self._get_remote(config)
+        remote.update(
+            remote_config,
+            tables_to_delete,
+            tables_to_keep,
+            entities_to_delete,
+            entities_to_keep,
+            partial,
+        )
+        hot_tier = self._get_hot_tier(config)
+        for table in tables_to_delete:
+            hot_tier.invalidate(table.name)
+
+    def teardown(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Union[FeatureTable, FeatureView]],
+        entities: Sequence[Entity],
+    ):
+        remote, remote_config = self._get_remote(config)
+        remote.teardown(remote_config, tables, entities)
+        self._get_hot_tier(config).clear()
+
+    def close(self) -> None:
+        with self._lock:
+            remote = self._remote
+            self._remote = None
+            self._remote_config = None
+            self._config = None
+            self._hot_tier = None
+        if remote is not None:
+            remote.close()
+        with self._stats_lock:
+            self._counters = {HOT_TIER: _TierCounters(), REMOTE_TIER: _TierCounters()}
@@ -1,5 +1,7 @@
 import abc
+import asyncio
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
@@ -17,6 +19,7 @@ from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.registry import Registry
 from feast.repo_config import RepoConfig
 from feast.type_map import python_value_to_proto_value
+from feast.value_type import ValueType
 
 
 class Provider(abc.ABC):
@@ -141,8 +144,61 @@ class Provider(abc.ABC):
         """
         ...
 
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: List[Tuple[Union[FeatureTable, FeatureView], Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Read feature values of several tables which share the same entities, given an Entity Key. This is a low
+        level interface, not expected to be used by the users directly.
+
+        Returns:
+            One list per table, holding the same data as online_read would return for that table. By default,
+            each table is read with online_read, providers backed by an online store should delegate to its
+            online_read_many method.
+        """
+        return [
+            self.online_read(config, table, entity_keys, requested_features)
+            for table, requested_features in tables
+        ]
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: Union[FeatureTable, FeatureView],
+        entity_keys: List[EntityKeyProto],
+        requested_features: List[str] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Asynchronous version of online_read. By default, online_read is run in the default executor of the
+        running event loop, providers backed by an online store should delegate to its online_read_async method.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(self.online_read, config, table, entity_keys, requested_features),
+        )
+
+    def close(self) -> None:
+        """
+        Releases any connections held by this provider, e.g. the clients of its online store. The provider
+        can still be used after it has been closed, connections are reopened lazily.
+        """
+        pass
+
 
 def get_provider(config: RepoConfig, repo_path: Path) -> Provider:
+    provider = _get_provider(config)
+    if config.online_serving.cache is not None:
+        from feast.infra.caching_provider import CachingProvider
+
+        return CachingProvider(config, provider)
+    return provider
+
+
+def _get_provider(config: RepoConfig) -> Provider:
     if "." not in config.provider:
         if config.provider == "gcp":
             from feast.infra.gcp import GcpProvider
@@ -274,50 +330,105 @@ def _run_field_mapping(
 def _convert_arrow_to_proto(
     table: pyarrow.Table, feature_view: FeatureView, join_keys: List[str],
 ) -> List[Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]]:
-    rows_to_write = []
+    # Each column is converted as a whole, so that its index and value type are only resolved once
+    def _column(name: str) -> pyarrow.ChunkedArray:
+        return table.column(table.column_names.index(name))
 
-    def _coerce_datetime(ts):
-        """
-        Depending on underlying time resolution, arrow to_pydict() sometimes returns pandas
-        timestamp type (for nanosecond resolution), and sometimes you get standard python datetime
-        (for microsecond resolution).
-
-        While pandas timestamp class is a subclass of python datetime, it doesn't always behave the
-        same way. We convert it to normal datetime so that consumers downstream don't have to deal
-        with these quirks.
-        """
+    entity_values = _zip_columns(
+        [_convert_arrow_column_to_proto(_column(join_key)) for join_key in join_keys],
+        table.num_rows,
+    )
+    entity_keys = [
+        EntityKeyProto(join_keys=join_keys, entity_values=values)
+        for values in entity_values
+    ]
 
-        if isinstance(ts, pandas.Timestamp):
-            return ts.to_pydatetime()
-        else:
-            return ts
-
-    for row in zip(*table.to_pydict().values()):
-        entity_key = EntityKeyProto()
-        for join_key in join_keys:
-            entity_key.join_keys.append(join_key)
-            idx = table.column_names.index(join_key)
-            value = python_value_to_proto_value(row[idx])
-            entity_key.entity_values.append(value)
-        feature_dict = {}
-        for feature in feature_view.features:
-            idx = table.column_names.index(feature.name)
-            value = python_value_to_proto_value(row[idx], feature.dtype)
-            feature_dict[feature.name] = value
-        event_timestamp_idx = table.column_names.index(
-            feature_view.batch_source.event_timestamp_column
-        )
-        event_timestamp = _coerce_datetime(row[event_timestamp_idx])
+    feature_names = [feature.name for feature in feature_view.features]
+    feature_values = _zip_columns(
+        [
+            _convert_arrow_column_to_proto(_column(feature.name), feature.dtype)
+            for feature in feature_view.features
+        ],
+        table.num_rows,
+    )
+    feature_dicts = [dict(zip(feature_names, values)) for values in feature_values]
 
-        if feature_view.batch_source.created_timestamp_column:
-            created_timestamp_idx = table.column_names.index(
+    event_timestamps = [
+        _coerce_datetime(ts)
+        for ts in _column(feature_view.batch_source.event_timestamp_column).to_pylist()
+    ]
+    if feature_view.batch_source.created_timestamp_column:
+        created_timestamps = [
+            _coerce_datetime(ts)
+            for ts in _column(
                 feature_view.batch_source.created_timestamp_column
-            )
-            created_timestamp = _coerce_datetime(row[created_timestamp_idx])
-        else:
-            created_timestamp = None
+            ).to_pylist()
+        ]
+    else:
+        created_timestamps = [None] * table.num_rows
 
-        rows_to_write.append(
-            (entity_key, feature_dict, event_timestamp, created_timestamp)
-        )
-    return rows_to_write
+    return list(zip(entity_keys, feature_dicts, event_timestamps, created_timestamps))
+
+
+def _coerce_datetime(ts):
+    """
+    Depending on underlying time resolution, arrow to_pydict() sometimes returns pandas
+    timestamp type (for nanosecond resolution), and sometimes you get standard python datetime
+    (for microsecond resolution).
+
+    While pandas timestamp class is a subclass of python datetime, it doesn't always behave the
+    same way. We convert it to normal datetime so that consumers downstream don't have to deal
+    with these quirks.
+    """
+
+    if isinstance(ts, pandas.Timestamp):
+        return ts.to_pydatetime()
+    else:
+        return ts
+
+
+def _zip_columns(columns: List[List[ValueProto]], num_rows: int) -> List[Tuple]:
+    if not columns:
+        return [()] * num_rows
+    return list(zip(*columns))
+
+
+def _convert_arrow_column_to_proto(
+    column: pyarrow.ChunkedArray, value_type: Optional[ValueType] = None
+) -> List[ValueProto]:
+    """
+    Converts the values of an arrow column to Value protos. The value type of a value is inferred from its
+    Python type like python_value_to_proto_value does, and value_type is only used for null values. The value
+    type of columns of primitive types is inferred once for the whole column.
+    """
+    values = column.to_pylist()
+    field_name = _ARROW_TYPE_TO_PROTO_FIELD.get(column.type)
+    if field_name is None:
+        return [python_value_to_proto_value(value, value_type) for value in values]
+
+    # Nulls and NaNs are converted to empty Value protos, or raise the same errors as with other columns
+    return [
+        ValueProto(**{field_name: value})
+        if value is not None and value == value
+        else python_value_to_proto_value(value, value_type)
+        for value in values
+    ]
+
+
+# Field of the Value proto which holds the values of an arrow type, when they are inferred to the same value type
+_ARROW_TYPE_TO_PROTO_FIELD = {
+    pyarrow.int8(): "int64_val",
+    pyarrow.int16(): "int64_val",
+    pyarrow.int32(): "int64_val",
+    pyarrow.int64(): "int64_val",
+    pyarrow.uint8(): "int64_val",
+    pyarrow.uint16(): "int64_val",
+    pyarrow.uint32(): "int64_val",
+    pyarrow.float32(): "double_val",
+    pyarrow.float64(): "double_val",
+    pyarrow.string(): "string_val",
+    pyarrow.large_string(): "string_val",
+    pyarrow.binary(): "bytes_val",
+    pyarrow.large_binary(): "bytes_val",
+    pyarrow.bool_(): "bool_val",
+}
@@ -14,7 +14,9 @@
 
 from typing import Any, Dict, List, cast
 
+import numpy as np
 import pandas as pd
+import pyarrow
 
 from feast.protos.feast.serving.ServingService_pb2 import (
     GetOnlineFeaturesRequestV2,
@@ -71,6 +73,40 @@ class OnlineResponse:
         return pd.DataFrame(self.to_dict())
 
 
+class ColumnarOnlineResponse:
+    """
+    Defines a columnar online response in feast, as returned by FeatureStore.get_online_features_columnar.
+
+    Attributes:
+        columns: The entity and feature values, as one Arrow array per entity join key or feature.
+        statuses: One array of GetOnlineFeaturesResponse.FieldStatus values per feature.
+    """
+
+    def __init__(
+        self, columns: Dict[str, pyarrow.Array], statuses: Dict[str, np.ndarray]
+    ):
+        self.columns = columns
+        self.statuses = statuses
+
+    def to_arrow(self) -> pyarrow.Table:
+        """
+        Converts the feature data into an Arrow table. Missing values are nulls.
+        """
+        return pyarrow.Table.from_arrays(
+            list(self.columns.values()), names=list(self.columns.keys())
+        )
+
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """
+        Converts the feature data into a dictionary of NumPy arrays. Missing values are converted the same
+        way as pyarrow does, e.g. NaN for numeric features, so the statuses should be used to tell them apart.
+        """
+        return {
+            name: column.to_numpy(zero_copy_only=False)
+            for name, column in self.columns.items()
+        }
+
+
 def _infer_online_entity_rows(
     entity_rows: List[Dict[str, Any]]
 ) -> List[GetOnlineFeaturesRequestV2.EntityRow]:
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: feast/core/CoreService.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from tensorflow_metadata.proto.v0 import statistics_pb2 as tensorflow__metadata_dot_proto_dot_v0_dot_statistics__pb2
+from feast.protos.feast.core import Entity_pb2 as feast_dot_core_dot_Entity__pb2
+from feast.protos.feast.core import Feature_pb2 as feast_dot_core_dot_Feature__pb2
+from feast.protos.feast.core import FeatureTable_pb2 as feast_dot_core_dot_FeatureTable__pb2
+from feast.protos.feast.core import Store_pb2 as feast_dot_core_dot_Store__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1c\x66\x65\x61st/core/CoreService.proto\x12\nfeast.core\x1a\x1fgoogle/protobuf/timestamp.proto\x1a-tensorflow_metadata/proto/v0/statistics.proto\x1a\x17\x66\x65\x61st/core/Entity.proto\x1a\x18\x66\x65\x61st/core/Feature.proto\x1a\x1d\x66\x65\x61st/core/FeatureTable.proto\x1a\x16\x66\x65\x61st/core/Store.proto\"1\n\x10GetEntityRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\"7\n\x11GetEntityResponse\x12\"\n\x06\x65ntity\x18\x01 \x01(\x0b\x32\x12.feast.core.Entity\"\xdc\x01\n\x13ListEntitiesRequest\x12\x36\n\x06\x66ilter\x18\x01 \x01(\x0b\x32&.feast.core.ListEntitiesRequest.Filter\x1a\x8c\x01\n\x06\x46ilter\x12\x0f\n\x07project\x18\x03 \x01(\t\x12\x42\n\x06labels\x18\x04 \x03(\x0b\x32\x32.feast.core.ListEntitiesRequest.Filter.LabelsEntry\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"<\n\x14ListEntitiesResponse\x12$\n\x08\x65ntities\x18\x01 \x03(\x0b\x32\x12.feast.core.Entity\"\xee\x01\n\x13ListFeaturesRequest\x12\x36\n\x06\x66ilter\x18\x01 \x01(\x0b\x32&.feast.core.ListFeaturesRequest.Filter\x1a\x9e\x01\n\x06\x46ilter\x12\x42\n\x06labels\x18\x01 \x03(\x0b\x32\x32.feast.core.ListFeaturesRequest.Filter.LabelsEntry\x12\x10\n\x08\x65ntities\x18\x02 \x03(\t\x12\x0f\n\x07project\x18\x03 \x01(\t\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xaa\x01\n\x14ListFeaturesResponse\x12@\n\x08\x66\x65\x61tures\x18\x02 \x03(\x0b\x32..feast.core.ListFeaturesResponse.FeaturesEntry\x1aJ\n\rFeaturesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.feast.core.FeatureSpecV2:\x02\x38\x01J\x04\x08\x01\x10\x02\"a\n\x11ListStoresRequest\x12\x34\n\x06\x66ilter\x18\x01 \x01(\x0b\x32$.feast.core.ListStoresRequest.Filter\x1a\x16\n\x06\x46ilter\x12\x0c\n\x04name\x18\x01 \x01(\t\"6\n\x12ListStoresResponse\x12 \n\x05store\x18\x01 \x03(\x0b\x32\x11.feast.core.Store\"M\n\x12\x41pplyEntityRequest\x12&\n\x04spec\x18\x01 \x01(\x0b\x32\x18.feast.core.EntitySpecV2\x12\x0f\n\x07project\x18\x02 \x01(\t\"9\n\x13\x41pplyEntityResponse\x12\"\n\x06\x65ntity\x18\x01 \x01(\x0b\x32\x12.feast.core.Entity\"\x1c\n\x1aGetFeastCoreVersionRequest\".\n\x1bGetFeastCoreVersionResponse\x12\x0f\n\x07version\x18\x01 \x01(\t\"6\n\x12UpdateStoreRequest\x12 \n\x05store\x18\x01 \x01(\x0b\x32\x11.feast.core.Store\"\x95\x01\n\x13UpdateStoreResponse\x12 \n\x05store\x18\x01 \x01(\x0b\x32\x11.feast.core.Store\x12\x36\n\x06status\x18\x02 \x01(\x0e\x32&.feast.core.UpdateStoreResponse.Status\"$\n\x06Status\x12\r\n\tNO_CHANGE\x10\x00\x12\x0b\n\x07UPDATED\x10\x01\"$\n\x14\x43reateProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x17\n\x15\x43reateProjectResponse\"%\n\x15\x41rchiveProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x18\n\x16\x41rchiveProjectResponse\"\x15\n\x13ListProjectsRequest\"(\n\x14ListProjectsResponse\x12\x10\n\x08projects\x18\x01 \x03(\t\" \n\x1eUpdateFeatureSetStatusResponse\"]\n\x18\x41pplyFeatureTableRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x30\n\ntable_spec\x18\x02 \x01(\x0b\x32\x1c.feast.core.FeatureTableSpec\"D\n\x19\x41pplyFeatureTableResponse\x12\'\n\x05table\x18\x01 \x01(\x0b\x32\x18.feast.core.FeatureTable\"7\n\x16GetFeatureTableRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"B\n\x17GetFeatureTableResponse\x12\'\n\x05table\x18\x01 \x01(\x0b\x32\x18.feast.core.FeatureTable\"\xeb\x01\n\x18ListFeatureTablesRequest\x12;\n\x06\x66ilter\x18\x01 \x01(\x0b\x32+.feast.core.ListFeatureTablesRequest.Filter\x1a\x91\x01\n\x06\x46ilter\x12\x0f\n\x07project\x18\x01 \x01(\t\x12G\n\x06labels\x18\x03 \x03(\x0b\x32\x37.feast.core.ListFeatureTablesRequest.Filter.LabelsEntry\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"E\n\x19ListFeatureTablesResponse\x12(\n\x06tables\x18\x01 \x03(\x0b\x32\x18.feast.core.FeatureTable\":\n\x19\x44\x65leteFeatureTableRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x1c\n\x1a\x44\x65leteFeatureTableResponse2\xd9\t\n\x0b\x43oreService\x12\x66\n\x13GetFeastCoreVersion\x12&.feast.core.GetFeastCoreVersionRequest\x1a\'.feast.core.GetFeastCoreVersionResponse\x12H\n\tGetEntity\x12\x1c.feast.core.GetEntityRequest\x1a\x1d.feast.core.GetEntityResponse\x12Q\n\x0cListFeatures\x12\x1f.feast.core.ListFeaturesRequest\x1a .feast.core.ListFeaturesResponse\x12K\n\nListStores\x12\x1d.feast.core.ListStoresRequest\x1a\x1e.feast.core.ListStoresResponse\x12N\n\x0b\x41pplyEntity\x12\x1e.feast.core.ApplyEntityRequest\x1a\x1f.feast.core.ApplyEntityResponse\x12Q\n\x0cListEntities\x12\x1f.feast.core.ListEntitiesRequest\x1a .feast.core.ListEntitiesResponse\x12N\n\x0bUpdateStore\x12\x1e.feast.core.UpdateStoreRequest\x1a\x1f.feast.core.UpdateStoreResponse\x12T\n\rCreateProject\x12 .feast.core.CreateProjectRequest\x1a!.feast.core.CreateProjectResponse\x12W\n\x0e\x41rchiveProject\x12!.feast.core.ArchiveProjectRequest\x1a\".feast.core.ArchiveProjectResponse\x12Q\n\x0cListProjects\x12\x1f.feast.core.ListProjectsRequest\x1a .feast.core.ListProjectsResponse\x12`\n\x11\x41pplyFeatureTable\x12$.feast.core.ApplyFeatureTableRequest\x1a%.feast.core.ApplyFeatureTableResponse\x12`\n\x11ListFeatureTables\x12$.feast.core.ListFeatureTablesRequest\x1a%.feast.core.ListFeatureTablesResponse\x12Z\n\x0fGetFeatureTable\x12\".feast.core.GetFeatureTableRequest\x1a#.feast.core.GetFeatureTableResponse\x12\x63\n\x12\x44\x65leteFeatureTable\x12%.feast.core.DeleteFeatureTableRequest\x1a&.feast.core.DeleteFeatureTableResponseBY\n\x10\x66\x65\x61st.proto.coreB\x10\x43oreServiceProtoZ3github.com/feast-dev/feast/sdk/go/protos/feast/coreb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'feast.core.CoreService_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\020feast.proto.coreB\020CoreServiceProtoZ3github.com/feast-dev/feast/sdk/go/protos/feast/core'
+  _LISTENTITIESREQUEST_FILTER_LABELSENTRY._options = None
+  _LISTENTITIESREQUEST_FILTER_LABELSENTRY._serialized_options = b'8\001'
+  _LISTFEATURESREQUEST_FILTER_LABELSENTRY._options = None
+  _LISTFEATURESREQUEST_FILTER_LABELSENTRY._serialized_options = b'8\001'
+  _LISTFEATURESRESPONSE_FEATURESENTRY._options = None
+  _LISTFEATURESRESPONSE_FEATURESENTRY._serialized_options = b'8\001'
+  _LISTFEATURETABLESREQUEST_FILTER_LABELSENTRY._options = None
+  _LISTFEATURETABLESREQUEST_FILTER_LABELSENTRY._serialized_options = b'8\001'
+  _GETENTITYREQUEST._serialized_start=230
+  _GETENTITYREQUEST._serialized_end=279
+  _GETENTITYRESPONSE._serialized_start=281
+  _GETENTITYRESPONSE._serialized_end=336
+  _LISTENTITIESREQUEST._serialized_start=339
+  _LISTENTITIESREQUEST._serialized_end=559
+  _LISTENTITIESREQUEST_FILTER._serialized_start=419
+  _LISTENTITIESREQUEST_FILTER._serialized_end=559
+  _LISTENTITIESREQUEST_FILTER_LABELSENTRY._serialized_start=514
+  _LISTENTITIESREQUEST_FILTER_LABELSENTRY._serialized_end=559
+  _LISTENTITIESRESPONSE._serialized_start=561
+  _LISTENTITIESRESPONSE._serialized_end=621
+  _LISTFEATURESREQUEST._serialized_start=624
+  _LISTFEATURESREQUEST._serialized_end=862
+  _LISTFEATURESREQUEST_FILTER._serialized_start=704
+  _LISTFEATURESREQUEST_FILTER._serialized_end=862
+  _LISTFEATURESREQUEST_FILTER_LABELSENTRY._serialized_start=514
+  _LISTFEATURESREQUEST_FILTER_LABELSENTRY._serialized_end=559
+  _LISTFEATURESRESPONSE._serialized_start=865
+  _LISTFEATURESRESPONSE._serialized_end=1035
+  _LISTFEATURESRESPONSE_FEATURESENTRY._serialized_start=955
+  _LISTFEATURESRESPONSE_FEATURESENTRY._serialized_end=1029
+  _LISTSTORESREQUEST._serialized_start=1037
+  _LISTSTORESREQUEST._serialized_end=1134
+  _LISTSTORESREQUEST_FILTER._serialized_start=1112
+  _LISTSTORESREQUEST_FILTER._serialized_end=1134
+  _LISTSTORESRESPONSE._serialized_start=1136
+  _LISTSTORESRESPONSE._serialized_end=1190
+  _APPLYENTITYREQUEST._serialized_start=1192
+  _APPLYENTITYREQUEST._serialized_end=1269
+  _APPLYENTITYRESPONSE._serialized_start=1271
+  _APPLYENTITYRESPONSE._serialized_end=1328
+  _GETFEASTCOREVERSIONREQUEST._serialized_start=1330
+  _GETFEASTCOREVERSIONREQUEST._serialized_end=1358
+  _GETFEASTCOREVERSIONRESPONSE._serialized_start=1360
+  _GETFEASTCOREVERSIONRESPONSE._serialized_end=1406
+  _UPDATESTOREREQUEST._serialized_start=1408
+  _UPDATESTOREREQUEST._serialized_end=1462
+  _UPDATESTORERESPONSE._serialized_start=1465
+  _UPDATESTORERESPONSE._serialized_end=1614
+  _UPDATESTORERESPONSE_STATUS._serialized_start=1578
+  _UPDATESTORERESPONSE_STATUS._serialized_end=1614
+  _CREATEPROJECTREQUEST._serialized_start=1616
+  _CREATEPROJECTREQUEST._serialized_end=1652
+  _CREATEPROJECTRESPONSE._serialized_start=1654
+  _CREATEPROJECTRESPONSE._serialized_end=1677
+  _ARCHIVEPROJECTREQUEST._serialized_start=1679
+  _ARCHIVEPROJECTREQUEST._serialized_end=1716
+  _ARCHIVEPROJECTRESPONSE._serialized_start=1718
+  _ARCHIVEPROJECTRESPONSE._serialized_end=1742
+  _LISTPROJECTSREQUEST._serialized_start=1744
+  _LISTPROJECTSREQUEST._serialized_end=1765
+  _LISTPROJECTSRESPONSE._serialized_start=1767
+  _LISTPROJECTSRESPONSE._serialized_end=1807
+  _UPDATEFEATURESETSTATUSRESPONSE._serialized_start=1809
+  _UPDATEFEATURESETSTATUSRESPONSE._serialized_end=1841
+  _APPLYFEATURETABLEREQUEST._serialized_start=1843
+  _APPLYFEATURETABLEREQUEST._serialized_end=1936
+  _APPLYFEATURETABLERESPONSE._serialized_start=1938
+  _APPLYFEATURETABLERESPONSE._serialized_end=2006
+  _GETFEATURETABLEREQUEST._serialized_start=2008
+  _GETFEATURETABLEREQUEST._serialized_end=2063
+  _GETFEATURETABLERESPONSE._serialized_start=2065
+  _GETFEATURETABLERESPONSE._serialized_end=2131
+  _LISTFEATURETABLESREQUEST._serialized_start=2134
+  _LISTFEATURETABLESREQUEST._serialized_end=2369
+  _LISTFEATURETABLESREQUEST_FILTER._serialized_start=2224
+  _LISTFEATURETABLESREQUEST_FILTER._serialized_end=2369
+  _LISTFEATURETABLESREQUEST_FILTER_LABELSENTRY._serialized_start=514
+  _LISTFEATURETABLESREQUEST_FILTER_LABELSENTRY._serialized_end=559
+  _LISTFEATURETABLESRESPONSE._serialized_start=2371
+  _LISTFEATURETABLESRESPONSE._serialized_end=2440
+  _DELETEFEATURETABLEREQUEST._serialized_start=2442
+  _DELETEFEATURETABLEREQUEST._serialized_end=2500
+  _DELETEFEATURETABLERESPONSE._serialized_start=2502
+  _DELETEFEATURETABLERESPONSE._serialized_end=2530
+  _CORESERVICE._serialized_start=2533
+  _CORESERVICE._serialized_end=3774
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,117 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+import builtins
+import collections.abc
+import feast.core.FeatureViewProjection_pb2
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import google.protobuf.timestamp_pb2
+import sys
+
+if sys.version_info >= (3, 8):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing_extensions.final
+class FeatureService(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SPEC_FIELD_NUMBER: builtins.int
+    META_FIELD_NUMBER: builtins.int
+    @property
+    def spec(self) -> global___FeatureServiceSpec:
+        """User-specified specifications of this feature service."""
+    @property
+    def meta(self) -> global___FeatureServiceMeta:
+        """System-populated metadata for this feature service."""
+    def __init__(
+        self,
+        *,
+        spec: global___FeatureServiceSpec | None = ...,
+        meta: global___FeatureServiceMeta | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["meta", b"meta", "spec", b"spec"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["meta", b"meta", "spec", b"spec"]) -> None: ...
+
+global___FeatureService = FeatureService
+
+@typing_extensions.final
+class FeatureServiceSpec(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing_extensions.final
+    class TagsEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        value: builtins.str
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: builtins.str = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    NAME_FIELD_NUMBER: builtins.int
+    PROJECT_FIELD_NUMBER: builtins.int
+    FEATURES_FIELD_NUMBER: builtins.int
+    TAGS_FIELD_NUMBER: builtins.int
+    DESCRIPTION_FIELD_NUMBER: builtins.int
+    name: builtins.str
+    """Name of the Feature Service. Must be unique. Not updated."""
+    project: builtins.str
+    """Name of Feast project that this Feature Service belongs to."""
+    @property
+    def features(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.FeatureViewProjection_pb2.FeatureViewProjection]:
+        """List of features that this feature service encapsulates.
+        Stored as a list of references to other features views and the features from those views.
+        """
+    @property
+    def tags(self) -> google.protobuf.internal.containers.ScalarMap[builtins.str, builtins.str]:
+        """User defined metadata"""
+    description: builtins.str
+    """Description of the feature service."""
+    def __init__(
+        self,
+        *,
+        name: builtins.str = ...,
+        project: builtins.str = ...,
+        features: collections.abc.Iterable[feast.core.FeatureViewProjection_pb2.FeatureViewProjection] | None = ...,
+        tags: collections.abc.Mapping[builtins.str, builtins.str] | None = ...,
+        description: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["description", b"description", "features", b"features", "name", b"name", "project", b"project", "tags", b"tags"]) -> None: ...
+
+global___FeatureServiceSpec = FeatureServiceSpec
+
+@typing_extensions.final
+class FeatureServiceMeta(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CREATED_TIMESTAMP_FIELD_NUMBER: builtins.int
+    LAST_UPDATED_TIMESTAMP_FIELD_NUMBER: builtins.int
+    @property
+    def created_timestamp(self) -> google.protobuf.timestamp_pb2.Timestamp:
+        """Time where this Feature Service is created"""
+    @property
+    def last_updated_timestamp(self) -> google.protobuf.timestamp_pb2.Timestamp:
+        """Time where this Feature Service is last updated"""
+    def __init__(
+        self,
+        *,
+        created_timestamp: google.protobuf.timestamp_pb2.Timestamp | None = ...,
+        last_updated_timestamp: google.protobuf.timestamp_pb2.Timestamp | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["created_timestamp", b"created_timestamp", "last_updated_timestamp", b"last_updated_timestamp"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["created_timestamp", b"created_timestamp", "last_updated_timestamp", b"last_updated_timestamp"]) -> None: ...
+
+global___FeatureServiceMeta = FeatureServiceMeta
@@ -0,0 +1,41 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+import builtins
+import collections.abc
+import feast.core.Feature_pb2
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import sys
+
+if sys.version_info >= (3, 8):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing_extensions.final
+class FeatureViewProjection(google.protobuf.message.Message):
+    """A reference to features in a feature view"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FEATURE_VIEW_NAME_FIELD_NUMBER: builtins.int
+    FEATURE_COLUMNS_FIELD_NUMBER: builtins.int
+    feature_view_name: builtins.str
+    """The feature view name"""
+    @property
+    def feature_columns(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.Feature_pb2.FeatureSpecV2]:
+        """The features of the feature view that are a part of the feature reference."""
+    def __init__(
+        self,
+        *,
+        feature_view_name: builtins.str = ...,
+        feature_columns: collections.abc.Iterable[feast.core.Feature_pb2.FeatureSpecV2] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["feature_columns", b"feature_columns", "feature_view_name", b"feature_view_name"]) -> None: ...
+
+global___FeatureViewProjection = FeatureViewProjection
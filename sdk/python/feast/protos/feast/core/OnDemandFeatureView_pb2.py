@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: feast/core/OnDemandFeatureView.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from feast.protos.feast.core import FeatureView_pb2 as feast_dot_core_dot_FeatureView__pb2
+from feast.protos.feast.core import Feature_pb2 as feast_dot_core_dot_Feature__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$feast/core/OnDemandFeatureView.proto\x12\nfeast.core\x1a\x1c\x66\x65\x61st/core/FeatureView.proto\x1a\x18\x66\x65\x61st/core/Feature.proto\"H\n\x13OnDemandFeatureView\x12\x31\n\x04spec\x18\x01 \x01(\x0b\x32#.feast.core.OnDemandFeatureViewSpec\"\xae\x02\n\x17OnDemandFeatureViewSpec\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12+\n\x08\x66\x65\x61tures\x18\x03 \x03(\x0b\x32\x19.feast.core.FeatureSpecV2\x12?\n\x06inputs\x18\x04 \x03(\x0b\x32/.feast.core.OnDemandFeatureViewSpec.InputsEntry\x12>\n\x15user_defined_function\x18\x05 \x01(\x0b\x32\x1f.feast.core.UserDefinedFunction\x1a\x46\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.feast.core.FeatureView:\x02\x38\x01\"1\n\x13UserDefinedFunction\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x62ody\x18\x02 \x01(\x0c\x42\x61\n\x10\x66\x65\x61st.proto.coreB\x18OnDemandFeatureViewProtoZ3github.com/feast-dev/feast/sdk/go/protos/feast/coreb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'feast.core.OnDemandFeatureView_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\020feast.proto.coreB\030OnDemandFeatureViewProtoZ3github.com/feast-dev/feast/sdk/go/protos/feast/core'
+  _ONDEMANDFEATUREVIEWSPEC_INPUTSENTRY._options = None
+  _ONDEMANDFEATUREVIEWSPEC_INPUTSENTRY._serialized_options = b'8\001'
+  _ONDEMANDFEATUREVIEW._serialized_start=108
+  _ONDEMANDFEATUREVIEW._serialized_end=180
+  _ONDEMANDFEATUREVIEWSPEC._serialized_start=183
+  _ONDEMANDFEATUREVIEWSPEC._serialized_end=485
+  _ONDEMANDFEATUREVIEWSPEC_INPUTSENTRY._serialized_start=415
+  _ONDEMANDFEATUREVIEWSPEC_INPUTSENTRY._serialized_end=485
+  _USERDEFINEDFUNCTION._serialized_start=487
+  _USERDEFINEDFUNCTION._serialized_end=536
+# @@protoc_insertion_point(module_scope)
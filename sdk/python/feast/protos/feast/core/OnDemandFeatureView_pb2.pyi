@@ -0,0 +1,128 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Copyright 2020 The Feast Authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import builtins
+import collections.abc
+import feast.core.FeatureView_pb2
+import feast.core.Feature_pb2
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import sys
+
+if sys.version_info >= (3, 8):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing_extensions.final
+class OnDemandFeatureView(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SPEC_FIELD_NUMBER: builtins.int
+    @property
+    def spec(self) -> global___OnDemandFeatureViewSpec:
+        """User-specified specifications of this feature view."""
+    def __init__(
+        self,
+        *,
+        spec: global___OnDemandFeatureViewSpec | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["spec", b"spec"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["spec", b"spec"]) -> None: ...
+
+global___OnDemandFeatureView = OnDemandFeatureView
+
+@typing_extensions.final
+class OnDemandFeatureViewSpec(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing_extensions.final
+    class InputsEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        @property
+        def value(self) -> feast.core.FeatureView_pb2.FeatureView: ...
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: feast.core.FeatureView_pb2.FeatureView | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["value", b"value"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    NAME_FIELD_NUMBER: builtins.int
+    PROJECT_FIELD_NUMBER: builtins.int
+    FEATURES_FIELD_NUMBER: builtins.int
+    INPUTS_FIELD_NUMBER: builtins.int
+    USER_DEFINED_FUNCTION_FIELD_NUMBER: builtins.int
+    name: builtins.str
+    """Name of the feature view. Must be unique. Not updated."""
+    project: builtins.str
+    """Name of Feast project that this feature view belongs to."""
+    @property
+    def features(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.Feature_pb2.FeatureSpecV2]:
+        """List of features specifications for each feature defined with this feature view."""
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.MessageMap[builtins.str, feast.core.FeatureView_pb2.FeatureView]:
+        """List of features specifications for each feature defined with this feature view.
+        TODO(adchia): add support for request data
+        """
+    @property
+    def user_defined_function(self) -> global___UserDefinedFunction: ...
+    def __init__(
+        self,
+        *,
+        name: builtins.str = ...,
+        project: builtins.str = ...,
+        features: collections.abc.Iterable[feast.core.Feature_pb2.FeatureSpecV2] | None = ...,
+        inputs: collections.abc.Mapping[builtins.str, feast.core.FeatureView_pb2.FeatureView] | None = ...,
+        user_defined_function: global___UserDefinedFunction | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["user_defined_function", b"user_defined_function"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["features", b"features", "inputs", b"inputs", "name", b"name", "project", b"project", "user_defined_function", b"user_defined_function"]) -> None: ...
+
+global___OnDemandFeatureViewSpec = OnDemandFeatureViewSpec
+
+@typing_extensions.final
+class UserDefinedFunction(google.protobuf.message.Message):
+    """Serialized representation of python function."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: builtins.int
+    BODY_FIELD_NUMBER: builtins.int
+    name: builtins.str
+    """The function name"""
+    body: builtins.bytes
+    """The python-syntax function body (serialized by dill)"""
+    def __init__(
+        self,
+        *,
+        name: builtins.str = ...,
+        body: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["body", b"body", "name", b"name"]) -> None: ...
+
+global___UserDefinedFunction = UserDefinedFunction
@@ -0,0 +1,82 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+* Copyright 2020 The Feast Authors
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+*     https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+import builtins
+import collections.abc
+import feast.core.Entity_pb2
+import feast.core.FeatureService_pb2
+import feast.core.FeatureTable_pb2
+import feast.core.FeatureView_pb2
+import feast.core.OnDemandFeatureView_pb2
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import google.protobuf.timestamp_pb2
+import sys
+
+if sys.version_info >= (3, 8):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing_extensions.final
+class Registry(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENTITIES_FIELD_NUMBER: builtins.int
+    FEATURE_TABLES_FIELD_NUMBER: builtins.int
+    FEATURE_VIEWS_FIELD_NUMBER: builtins.int
+    ON_DEMAND_FEATURE_VIEWS_FIELD_NUMBER: builtins.int
+    FEATURE_SERVICES_FIELD_NUMBER: builtins.int
+    REGISTRY_SCHEMA_VERSION_FIELD_NUMBER: builtins.int
+    VERSION_ID_FIELD_NUMBER: builtins.int
+    LAST_UPDATED_FIELD_NUMBER: builtins.int
+    @property
+    def entities(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.Entity_pb2.Entity]: ...
+    @property
+    def feature_tables(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.FeatureTable_pb2.FeatureTable]: ...
+    @property
+    def feature_views(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.FeatureView_pb2.FeatureView]: ...
+    @property
+    def on_demand_feature_views(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.OnDemandFeatureView_pb2.OnDemandFeatureView]: ...
+    @property
+    def feature_services(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[feast.core.FeatureService_pb2.FeatureService]: ...
+    registry_schema_version: builtins.str
+    """to support migrations; incremented when schema is changed"""
+    version_id: builtins.str
+    """version id, random string generated on each update of the data; now used only for debugging purposes"""
+    @property
+    def last_updated(self) -> google.protobuf.timestamp_pb2.Timestamp: ...
+    def __init__(
+        self,
+        *,
+        entities: collections.abc.Iterable[feast.core.Entity_pb2.Entity] | None = ...,
+        feature_tables: collections.abc.Iterable[feast.core.FeatureTable_pb2.FeatureTable] | None = ...,
+        feature_views: collections.abc.Iterable[feast.core.FeatureView_pb2.FeatureView] | None = ...,
+        on_demand_feature_views: collections.abc.Iterable[feast.core.OnDemandFeatureView_pb2.OnDemandFeatureView] | None = ...,
+        feature_services: collections.abc.Iterable[feast.core.FeatureService_pb2.FeatureService] | None = ...,
+        registry_schema_version: builtins.str = ...,
+        version_id: builtins.str = ...,
+        last_updated: google.protobuf.timestamp_pb2.Timestamp | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["last_updated", b"last_updated"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["entities", b"entities", "feature_services", b"feature_services", "feature_tables", b"feature_tables", "feature_views", b"feature_views", "last_updated", b"last_updated", "on_demand_feature_views", b"on_demand_feature_views", "registry_schema_version", b"registry_schema_version", "version_id", b"version_id"]) -> None: ...
+
+global___Registry = Registry
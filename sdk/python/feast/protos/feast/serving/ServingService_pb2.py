@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: feast/serving/ServingService.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from feast.protos.feast.types import Value_pb2 as feast_dot_types_dot_Value__pb2
+from tensorflow_metadata.proto.v0 import statistics_pb2 as tensorflow__metadata_dot_proto_dot_v0_dot_statistics__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"feast/serving/ServingService.proto\x12\rfeast.serving\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x17\x66\x65\x61st/types/Value.proto\x1a-tensorflow_metadata/proto/v0/statistics.proto\"\x1c\n\x1aGetFeastServingInfoRequest\"{\n\x1bGetFeastServingInfoResponse\x12\x0f\n\x07version\x18\x01 \x01(\t\x12-\n\x04type\x18\x02 \x01(\x0e\x32\x1f.feast.serving.FeastServingType\x12\x1c\n\x14job_staging_location\x18\n \x01(\t\"9\n\x12\x46\x65\x61tureReferenceV2\x12\x15\n\rfeature_table\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\xfd\x02\n\x1aGetOnlineFeaturesRequestV2\x12\x33\n\x08\x66\x65\x61tures\x18\x04 \x03(\x0b\x32!.feast.serving.FeatureReferenceV2\x12H\n\x0b\x65ntity_rows\x18\x02 \x03(\x0b\x32\x33.feast.serving.GetOnlineFeaturesRequestV2.EntityRow\x12\x0f\n\x07project\x18\x05 \x01(\t\x1a\xce\x01\n\tEntityRow\x12-\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12O\n\x06\x66ields\x18\x02 \x03(\x0b\x32?.feast.serving.GetOnlineFeaturesRequestV2.EntityRow.FieldsEntry\x1a\x41\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.feast.types.Value:\x02\x38\x01\"\x1a\n\x0b\x46\x65\x61tureList\x12\x0b\n\x03val\x18\x01 \x03(\t\"\x9f\x02\n\x18GetOnlineFeaturesRequest\x12\x19\n\x0f\x66\x65\x61ture_service\x18\x01 \x01(\tH\x00\x12.\n\x08\x66\x65\x61tures\x18\x02 \x01(\x0b\x32\x1a.feast.serving.FeatureListH\x00\x12G\n\x08\x65ntities\x18\x03 \x03(\x0b\x32\x35.feast.serving.GetOnlineFeaturesRequest.EntitiesEntry\x12\x1a\n\x12\x66ull_feature_names\x18\x04 \x01(\x08\x1aK\n\rEntitiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.feast.types.RepeatedValue:\x02\x38\x01\x42\x06\n\x04kind\"\xa6\x04\n\x19GetOnlineFeaturesResponse\x12J\n\x0c\x66ield_values\x18\x01 \x03(\x0b\x32\x34.feast.serving.GetOnlineFeaturesResponse.FieldValues\x1a\xdf\x02\n\x0b\x46ieldValues\x12P\n\x06\x66ields\x18\x01 \x03(\x0b\x32@.feast.serving.GetOnlineFeaturesResponse.FieldValues.FieldsEntry\x12T\n\x08statuses\x18\x02 \x03(\x0b\x32\x42.feast.serving.GetOnlineFeaturesResponse.FieldValues.StatusesEntry\x1a\x41\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.feast.types.Value:\x02\x38\x01\x1a\x65\n\rStatusesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x43\n\x05value\x18\x02 \x01(\x0e\x32\x34.feast.serving.GetOnlineFeaturesResponse.FieldStatus:\x02\x38\x01\"[\n\x0b\x46ieldStatus\x12\x0b\n\x07INVALID\x10\x00\x12\x0b\n\x07PRESENT\x10\x01\x12\x0e\n\nNULL_VALUE\x10\x02\x12\r\n\tNOT_FOUND\x10\x03\x12\x13\n\x0fOUTSIDE_MAX_AGE\x10\x04*o\n\x10\x46\x65\x61stServingType\x12\x1e\n\x1a\x46\x45\x41ST_SERVING_TYPE_INVALID\x10\x00\x12\x1d\n\x19\x46\x45\x41ST_SERVING_TYPE_ONLINE\x10\x01\x12\x1c\n\x18\x46\x45\x41ST_SERVING_TYPE_BATCH\x10\x02\x32\xea\x01\n\x0eServingService\x12l\n\x13GetFeastServingInfo\x12).feast.serving.GetFeastServingInfoRequest\x1a*.feast.serving.GetFeastServingInfoResponse\x12j\n\x13GetOnlineFeaturesV2\x12).feast.serving.GetOnlineFeaturesRequestV2\x1a(.feast.serving.GetOnlineFeaturesResponseB^\n\x13\x66\x65\x61st.proto.servingB\x0fServingAPIProtoZ6github.com/feast-dev/feast/sdk/go/protos/feast/servingb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'feast.serving.ServingService_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\023feast.proto.servingB\017ServingAPIProtoZ6github.com/feast-dev/feast/sdk/go/protos/feast/serving'
+  _GETONLINEFEATURESREQUESTV2_ENTITYROW_FIELDSENTRY._options = None
+  _GETONLINEFEATURESREQUESTV2_ENTITYROW_FIELDSENTRY._serialized_options = b'8\001'
+  _GETONLINEFEATURESREQUEST_ENTITIESENTRY._options = None
+  _GETONLINEFEATURESREQUEST_ENTITIESENTRY._serialized_options = b'8\001'
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES_FIELDSENTRY._options = None
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES_FIELDSENTRY._serialized_options = b'8\001'
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES_STATUSESENTRY._options = None
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES_STATUSESENTRY._serialized_options = b'8\001'
+  _FEASTSERVINGTYPE._serialized_start=1627
+  _FEASTSERVINGTYPE._serialized_end=1738
+  _GETFEASTSERVINGINFOREQUEST._serialized_start=158
+  _GETFEASTSERVINGINFOREQUEST._serialized_end=186
+  _GETFEASTSERVINGINFORESPONSE._serialized_start=188
+  _GETFEASTSERVINGINFORESPONSE._serialized_end=311
+  _FEATUREREFERENCEV2._serialized_start=313
+  _FEATUREREFERENCEV2._serialized_end=370
+  _GETONLINEFEATURESREQUESTV2._serialized_start=373
+  _GETONLINEFEATURESREQUESTV2._serialized_end=754
+  _GETONLINEFEATURESREQUESTV2_ENTITYROW._serialized_start=548
+  _GETONLINEFEATURESREQUESTV2_ENTITYROW._serialized_end=754
+  _GETONLINEFEATURESREQUESTV2_ENTITYROW_FIELDSENTRY._serialized_start=689
+  _GETONLINEFEATURESREQUESTV2_ENTITYROW_FIELDSENTRY._serialized_end=754
+  _FEATURELIST._serialized_start=756
+  _FEATURELIST._serialized_end=782
+  _GETONLINEFEATURESREQUEST._serialized_start=785
+  _GETONLINEFEATURESREQUEST._serialized_end=1072
+  _GETONLINEFEATURESREQUEST_ENTITIESENTRY._serialized_start=989
+  _GETONLINEFEATURESREQUEST_ENTITIESENTRY._serialized_end=1064
+  _GETONLINEFEATURESRESPONSE._serialized_start=1075
+  _GETONLINEFEATURESRESPONSE._serialized_end=1625
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES._serialized_start=1181
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES._serialized_end=1532
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES_FIELDSENTRY._serialized_start=689
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES_FIELDSENTRY._serialized_end=754
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES_STATUSESENTRY._serialized_start=1431
+  _GETONLINEFEATURESRESPONSE_FIELDVALUES_STATUSESENTRY._serialized_end=1532
+  _GETONLINEFEATURESRESPONSE_FIELDSTATUS._serialized_start=1534
+  _GETONLINEFEATURESRESPONSE_FIELDSTATUS._serialized_end=1625
+  _SERVINGSERVICE._serialized_start=1741
+  _SERVINGSERVICE._serialized_end=1975
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,378 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Copyright 2018 The Feast Authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import builtins
+import collections.abc
+import feast.types.Value_pb2
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.internal.enum_type_wrapper
+import google.protobuf.message
+import google.protobuf.timestamp_pb2
+import sys
+import typing
+
+if sys.version_info >= (3, 10):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+class _FeastServingType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _FeastServingTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_FeastServingType.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    FEAST_SERVING_TYPE_INVALID: _FeastServingType.ValueType  # 0
+    FEAST_SERVING_TYPE_ONLINE: _FeastServingType.ValueType  # 1
+    """Online serving receives entity data directly and synchronously and will
+    respond immediately.
+    """
+    FEAST_SERVING_TYPE_BATCH: _FeastServingType.ValueType  # 2
+    """Batch serving receives entity data asynchronously and orchestrates the
+    retrieval through a staging location.
+    """
+
+class FeastServingType(_FeastServingType, metaclass=_FeastServingTypeEnumTypeWrapper): ...
+
+FEAST_SERVING_TYPE_INVALID: FeastServingType.ValueType  # 0
+FEAST_SERVING_TYPE_ONLINE: FeastServingType.ValueType  # 1
+"""Online serving receives entity data directly and synchronously and will
+respond immediately.
+"""
+FEAST_SERVING_TYPE_BATCH: FeastServingType.ValueType  # 2
+"""Batch serving receives entity data asynchronously and orchestrates the
+retrieval through a staging location.
+"""
+global___FeastServingType = FeastServingType
+
+@typing_extensions.final
+class GetFeastServingInfoRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+
+global___GetFeastServingInfoRequest = GetFeastServingInfoRequest
+
+@typing_extensions.final
+class GetFeastServingInfoResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VERSION_FIELD_NUMBER: builtins.int
+    TYPE_FIELD_NUMBER: builtins.int
+    JOB_STAGING_LOCATION_FIELD_NUMBER: builtins.int
+    version: builtins.str
+    """Feast version of this serving deployment."""
+    type: global___FeastServingType.ValueType
+    """Type of serving deployment, either ONLINE or BATCH. Different store types support different
+    feature retrieval methods.
+    """
+    job_staging_location: builtins.str
+    """Note: Batch specific options start from 10.
+    Staging location for this serving store, if any.
+    """
+    def __init__(
+        self,
+        *,
+        version: builtins.str = ...,
+        type: global___FeastServingType.ValueType = ...,
+        job_staging_location: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["job_staging_location", b"job_staging_location", "type", b"type", "version", b"version"]) -> None: ...
+
+global___GetFeastServingInfoResponse = GetFeastServingInfoResponse
+
+@typing_extensions.final
+class FeatureReferenceV2(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FEATURE_TABLE_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    feature_table: builtins.str
+    """Name of the Feature Table to retrieve the feature from."""
+    name: builtins.str
+    """Name of the Feature to retrieve the feature from."""
+    def __init__(
+        self,
+        *,
+        feature_table: builtins.str = ...,
+        name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["feature_table", b"feature_table", "name", b"name"]) -> None: ...
+
+global___FeatureReferenceV2 = FeatureReferenceV2
+
+@typing_extensions.final
+class GetOnlineFeaturesRequestV2(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing_extensions.final
+    class EntityRow(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        @typing_extensions.final
+        class FieldsEntry(google.protobuf.message.Message):
+            DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+            KEY_FIELD_NUMBER: builtins.int
+            VALUE_FIELD_NUMBER: builtins.int
+            key: builtins.str
+            @property
+            def value(self) -> feast.types.Value_pb2.Value: ...
+            def __init__(
+                self,
+                *,
+                key: builtins.str = ...,
+                value: feast.types.Value_pb2.Value | None = ...,
+            ) -> None: ...
+            def HasField(self, field_name: typing_extensions.Literal["value", b"value"]) -> builtins.bool: ...
+            def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+        TIMESTAMP_FIELD_NUMBER: builtins.int
+        FIELDS_FIELD_NUMBER: builtins.int
+        @property
+        def timestamp(self) -> google.protobuf.timestamp_pb2.Timestamp:
+            """Request timestamp of this row. This value will be used,
+            together with maxAge, to determine feature staleness.
+            """
+        @property
+        def fields(self) -> google.protobuf.internal.containers.MessageMap[builtins.str, feast.types.Value_pb2.Value]:
+            """Map containing mapping of entity name to entity value."""
+        def __init__(
+            self,
+            *,
+            timestamp: google.protobuf.timestamp_pb2.Timestamp | None = ...,
+            fields: collections.abc.Mapping[builtins.str, feast.types.Value_pb2.Value] | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["timestamp", b"timestamp"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["fields", b"fields", "timestamp", b"timestamp"]) -> None: ...
+
+    FEATURES_FIELD_NUMBER: builtins.int
+    ENTITY_ROWS_FIELD_NUMBER: builtins.int
+    PROJECT_FIELD_NUMBER: builtins.int
+    @property
+    def features(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FeatureReferenceV2]:
+        """List of features that are being retrieved"""
+    @property
+    def entity_rows(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___GetOnlineFeaturesRequestV2.EntityRow]:
+        """List of entity rows, containing entity id and timestamp data.
+        Used during retrieval of feature rows and for joining feature
+        rows into a final dataset
+        """
+    project: builtins.str
+    """Optional field to specify project name override. If specified, uses the
+    given project for retrieval. Overrides the projects specified in
+    Feature References if both are specified.
+    """
+    def __init__(
+        self,
+        *,
+        features: collections.abc.Iterable[global___FeatureReferenceV2] | None = ...,
+        entity_rows: collections.abc.Iterable[global___GetOnlineFeaturesRequestV2.EntityRow] | None = ...,
+        project: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["entity_rows", b"entity_rows", "features", b"features", "project", b"project"]) -> None: ...
+
+global___GetOnlineFeaturesRequestV2 = GetOnlineFeaturesRequestV2
+
+@typing_extensions.final
+class FeatureList(google.protobuf.message.Message):
+    """In JSON "val" field can be omitted"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VAL_FIELD_NUMBER: builtins.int
+    @property
+    def val(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        val: collections.abc.Iterable[builtins.str] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["val", b"val"]) -> None: ...
+
+global___FeatureList = FeatureList
+
+@typing_extensions.final
+class GetOnlineFeaturesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing_extensions.final
+    class EntitiesEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        @property
+        def value(self) -> feast.types.Value_pb2.RepeatedValue: ...
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: feast.types.Value_pb2.RepeatedValue | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["value", b"value"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    FEATURE_SERVICE_FIELD_NUMBER: builtins.int
+    FEATURES_FIELD_NUMBER: builtins.int
+    ENTITIES_FIELD_NUMBER: builtins.int
+    FULL_FEATURE_NAMES_FIELD_NUMBER: builtins.int
+    feature_service: builtins.str
+    @property
+    def features(self) -> global___FeatureList: ...
+    @property
+    def entities(self) -> google.protobuf.internal.containers.MessageMap[builtins.str, feast.types.Value_pb2.RepeatedValue]:
+        """The entity data is specified in a columnar format
+        A map of entity name -> list of values
+        """
+    full_feature_names: builtins.bool
+    def __init__(
+        self,
+        *,
+        feature_service: builtins.str = ...,
+        features: global___FeatureList | None = ...,
+        entities: collections.abc.Mapping[builtins.str, feast.types.Value_pb2.RepeatedValue] | None = ...,
+        full_feature_names: builtins.bool = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["feature_service", b"feature_service", "features", b"features", "kind", b"kind"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["entities", b"entities", "feature_service", b"feature_service", "features", b"features", "full_feature_names", b"full_feature_names", "kind", b"kind"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["kind", b"kind"]) -> typing_extensions.Literal["feature_service", "features"] | None: ...
+
+global___GetOnlineFeaturesRequest = GetOnlineFeaturesRequest
+
+@typing_extensions.final
+class GetOnlineFeaturesResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class _FieldStatus:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _FieldStatusEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[GetOnlineFeaturesResponse._FieldStatus.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        INVALID: GetOnlineFeaturesResponse._FieldStatus.ValueType  # 0
+        """Status is unset for this field."""
+        PRESENT: GetOnlineFeaturesResponse._FieldStatus.ValueType  # 1
+        """Field value is present for this field and age is within max age."""
+        NULL_VALUE: GetOnlineFeaturesResponse._FieldStatus.ValueType  # 2
+        """Values could be found for entity key and age is within max age, but
+        this field value is assigned a value on ingestion into feast.
+        """
+        NOT_FOUND: GetOnlineFeaturesResponse._FieldStatus.ValueType  # 3
+        """Entity key did not return any values as they do not exist in Feast.
+        This could suggest that the feature values have not yet been ingested
+        into feast or the ingestion failed.
+        """
+        OUTSIDE_MAX_AGE: GetOnlineFeaturesResponse._FieldStatus.ValueType  # 4
+        """Values could be found for entity key, but field values are outside the maximum 
+        allowable range.
+        """
+
+    class FieldStatus(_FieldStatus, metaclass=_FieldStatusEnumTypeWrapper): ...
+    INVALID: GetOnlineFeaturesResponse.FieldStatus.ValueType  # 0
+    """Status is unset for this field."""
+    PRESENT: GetOnlineFeaturesResponse.FieldStatus.ValueType  # 1
+    """Field value is present for this field and age is within max age."""
+    NULL_VALUE: GetOnlineFeaturesResponse.FieldStatus.ValueType  # 2
+    """Values could be found for entity key and age is within max age, but
+    this field value is assigned a value on ingestion into feast.
+    """
+    NOT_FOUND: GetOnlineFeaturesResponse.FieldStatus.ValueType  # 3
+    """Entity key did not return any values as they do not exist in Feast.
+    This could suggest that the feature values have not yet been ingested
+    into feast or the ingestion failed.
+    """
+    OUTSIDE_MAX_AGE: GetOnlineFeaturesResponse.FieldStatus.ValueType  # 4
+    """Values could be found for entity key, but field values are outside the maximum 
+    allowable range.
+    """
+
+    @typing_extensions.final
+    class FieldValues(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        @typing_extensions.final
+        class FieldsEntry(google.protobuf.message.Message):
+            DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+            KEY_FIELD_NUMBER: builtins.int
+            VALUE_FIELD_NUMBER: builtins.int
+            key: builtins.str
+            @property
+            def value(self) -> feast.types.Value_pb2.Value: ...
+            def __init__(
+                self,
+                *,
+                key: builtins.str = ...,
+                value: feast.types.Value_pb2.Value | None = ...,
+            ) -> None: ...
+            def HasField(self, field_name: typing_extensions.Literal["value", b"value"]) -> builtins.bool: ...
+            def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+        @typing_extensions.final
+        class StatusesEntry(google.protobuf.message.Message):
+            DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+            KEY_FIELD_NUMBER: builtins.int
+            VALUE_FIELD_NUMBER: builtins.int
+            key: builtins.str
+            value: global___GetOnlineFeaturesResponse.FieldStatus.ValueType
+            def __init__(
+                self,
+                *,
+                key: builtins.str = ...,
+                value: global___GetOnlineFeaturesResponse.FieldStatus.ValueType = ...,
+            ) -> None: ...
+            def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+        FIELDS_FIELD_NUMBER: builtins.int
+        STATUSES_FIELD_NUMBER: builtins.int
+        @property
+        def fields(self) -> google.protobuf.internal.containers.MessageMap[builtins.str, feast.types.Value_pb2.Value]:
+            """Map of feature or entity name to feature/entity values.
+            Timestamps are not returned in this response.
+            """
+        @property
+        def statuses(self) -> google.protobuf.internal.containers.ScalarMap[builtins.str, global___GetOnlineFeaturesResponse.FieldStatus.ValueType]:
+            """Map of feature or entity name to feature/entity statuses/metadata."""
+        def __init__(
+            self,
+            *,
+            fields: collections.abc.Mapping[builtins.str, feast.types.Value_pb2.Value] | None = ...,
+            statuses: collections.abc.Mapping[builtins.str, global___GetOnlineFeaturesResponse.FieldStatus.ValueType] | None = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["fields", b"fields", "statuses", b"statuses"]) -> None: ...
+
+    FIELD_VALUES_FIELD_NUMBER: builtins.int
+    @property
+    def field_values(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___GetOnlineFeaturesResponse.FieldValues]:
+        """Feature values retrieved from feast."""
+    def __init__(
+        self,
+        *,
+        field_values: collections.abc.Iterable[global___GetOnlineFeaturesResponse.FieldValues] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["field_values", b"field_values"]) -> None: ...
+
+global___GetOnlineFeaturesResponse = GetOnlineFeaturesResponse
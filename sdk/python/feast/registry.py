@@ -18,7 +18,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from pathlib import Path
 from tempfile import TemporaryFile
-from typing import List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 from urllib.parse import urlparse
 
 from feast.entity import Entity
@@ -41,6 +41,35 @@ from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 REGISTRY_SCHEMA_VERSION = "1"
 
 
+class _RegistryObjectCache:
+    """
+    Python objects deserialized from a registry proto, indexed by project and name. Each kind of object is only
+    deserialized the first time it is requested, and is then reused until the registry version changes.
+    """
+
+    def __init__(self, registry_proto: RegistryProto):
+        self.registry_proto = registry_proto
+        self.version_id = registry_proto.version_id
+        self._objects: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def get(self, kind: str, from_proto: Callable) -> Dict[str, Dict[str, Any]]:
+        """Returns the objects of the given kind, as a dict from project to a dict from name to object."""
+        objects = self._objects.get(kind)
+        if objects is None:
+            objects = _index_by_project(getattr(self.registry_proto, kind), from_proto)
+            self._objects[kind] = objects
+        return objects
+
+
+def _index_by_project(
+    protos: Iterable[Any], from_proto: Callable
+) -> Dict[str, Dict[str, Any]]:
+    index: Dict[str, Dict[str, Any]] = {}
+    for proto in protos:
+        index.setdefault(proto.spec.project, {})[proto.spec.name] = from_proto(proto)
+    return index
+
+
 class Registry:
     """
     Registry: A registry allows for the management and persistence of feature definitions and related metadata.
@@ -54,6 +83,11 @@ class Registry:
     cached_registry_proto_ttl: timedelta
     cache_being_updated: bool = False
 
+    # Python objects built from the cached registry proto. They are shared between callers that allow the use of
+    # the registry cache, and are rebuilt only once the version_id of the registry changes or the registry is
+    # modified in memory.
+    _cached_objects: Optional[_RegistryObjectCache] = None
+
     def __init__(self, registry_path: str, repo_path: Path, cache_ttl: timedelta):
         """
         Create the Registry object.
@@ -129,6 +163,12 @@ class Registry:
         Returns:
             List of entities
         """
+        if allow_cache:
+            return list(
+                self._get_cached_objects("entities", Entity.from_proto)
+                .get(project, {})
+                .values()
+            )
         registry_proto = self._get_registry_proto(allow_cache=allow_cache)
         entities = []
         for entity_proto in registry_proto.entities:
@@ -175,6 +215,12 @@ class Registry:
         Returns:
             List of feature services
         """
+        if allow_cache:
+            return list(
+                self._get_cached_objects("feature_services", FeatureService.from_proto)
+                .get(project, {})
+                .values()
+            )
 
         registry = self._get_registry_proto(allow_cache=allow_cache)
         feature_services = []
@@ -199,6 +245,16 @@ class Registry:
             Returns either the specified feature service, or raises an exception if
             none is found
         """
+        if allow_cache:
+            feature_service = (
+                self._get_cached_objects("feature_services", FeatureService.from_proto)
+                .get(project, {})
+                .get(name)
+            )
+            if feature_service is None:
+                raise FeatureServiceNotFoundException(name, project=project)
+            return feature_service
+
         registry = self._get_registry_proto(allow_cache=allow_cache)
 
         for feature_service_proto in registry.feature_services:
@@ -221,6 +277,16 @@ class Registry:
             Returns either the specified entity, or raises an exception if
             none is found
         """
+        if allow_cache:
+            entity = (
+                self._get_cached_objects("entities", Entity.from_proto)
+                .get(project, {})
+                .get(name)
+            )
+            if entity is None:
+                raise EntityNotFoundException(name, project=project)
+            return entity
+
         registry_proto = self._get_registry_proto(allow_cache=allow_cache)
         for entity_proto in registry_proto.entities:
             if entity_proto.spec.name == name and entity_proto.spec.project == project:
@@ -353,6 +419,14 @@ class Registry:
         Returns:
             List of on demand feature views
         """
+        if allow_cache:
+            return list(
+                self._get_cached_objects(
+                    "on_demand_feature_views", OnDemandFeatureView.from_proto
+                )
+                .get(project, {})
+                .values()
+            )
 
         registry = self._get_registry_proto(allow_cache=allow_cache)
         on_demand_feature_views = []
@@ -377,6 +451,18 @@ class Registry:
             Returns either the specified on demand feature view, or raises an exception if
             none is found
         """
+        if allow_cache:
+            on_demand_feature_view = (
+                self._get_cached_objects(
+                    "on_demand_feature_views", OnDemandFeatureView.from_proto
+                )
+                .get(project, {})
+                .get(name)
+            )
+            if on_demand_feature_view is None:
+                raise OnDemandFeatureViewNotFoundException(name, project=project)
+            return on_demand_feature_view
+
         registry = self._get_registry_proto(allow_cache=allow_cache)
 
         for on_demand_feature_view in registry.on_demand_feature_views:
@@ -461,6 +547,12 @@ class Registry:
         Returns:
             List of feature views
         """
+        if allow_cache:
+            return list(
+                self._get_cached_objects("feature_views", FeatureView.from_proto)
+                .get(project, {})
+                .values()
+            )
         registry_proto = self._get_registry_proto(allow_cache=allow_cache)
         feature_views = []
         for feature_view_proto in registry_proto.feature_views:
@@ -489,18 +581,31 @@ class Registry:
                 return FeatureTable.from_proto(feature_table_proto)
         raise FeatureTableNotFoundException(name, project)
 
-    def get_feature_view(self, name: str, project: str) -> FeatureView:
+    def get_feature_view(
+        self, name: str, project: str, allow_cache: bool = False
+    ) -> FeatureView:
         """
         Retrieves a feature view.
 
         Args:
             name: Name of feature view
             project: Feast project that this feature view belongs to
+            allow_cache: Allow returning feature view from the cached registry
 
         Returns:
             Returns either the specified feature view, or raises an exception if
             none is found
         """
+        if allow_cache:
+            feature_view = (
+                self._get_cached_objects("feature_views", FeatureView.from_proto)
+                .get(project, {})
+                .get(name)
+            )
+            if feature_view is None:
+                raise FeatureViewNotFoundException(name, project)
+            return feature_view
+
         registry_proto = self._get_registry_proto()
         for feature_view_proto in registry_proto.feature_views:
             if (
@@ -602,6 +707,8 @@ class Registry:
 
     def _prepare_registry_for_changes(self):
         """Prepares the Registry for changes by refreshing the cache if necessary."""
+        # The cached registry proto is about to be modified in memory, without its version_id changing
+        self._cached_objects = None
         try:
             self._get_registry_proto(allow_cache=True)
         except FileNotFoundError:
@@ -644,6 +751,37 @@ class Registry:
             self.cache_being_updated = False
         return registry_proto
 
+    def _get_cached_objects(
+        self, kind: str, from_proto: Callable
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the Python objects of the given kind from the cached registry, indexed by project and name.
+
+        Args:
+            kind: Name of the RegistryProto field holding the objects, e.g. "feature_views"
+            from_proto: Function used to build an object from its proto
+
+        Returns: A dict from project to a dict from object name to object. Objects are shared with other
+            callers, and should not be modified.
+        """
+        return self._get_object_cache().get(kind, from_proto)
+
+    def _get_object_cache(self) -> _RegistryObjectCache:
+        """
+        Returns the cache of Python objects built from the cached registry, rebuilding it if the registry
+        changed. A new cache object is returned whenever the registry changes, so callers can use its identity
+        to invalidate anything they derived from the registry objects.
+        """
+        registry_proto = self._get_registry_proto(allow_cache=True)
+        cached_objects = self._cached_objects
+        if (
+            cached_objects is None
+            or cached_objects.version_id != registry_proto.version_id
+        ):
+            cached_objects = _RegistryObjectCache(registry_proto)
+            self._cached_objects = cached_objects
+        return cached_objects
+
     def _get_existing_feature_view_names(self) -> Set[str]:
         assert self.cached_registry_proto
         return set([fv.spec.name for fv in self.cached_registry_proto.feature_views])
@@ -11,7 +11,7 @@ from pydantic import (
     validator,
 )
 from pydantic.error_wrappers import ErrorWrapper
-from pydantic.typing import Dict, Optional, Union
+from pydantic.typing import Dict, Literal, Optional, Union
 
 from feast.importer import get_class_from_type
 from feast.usage import log_exceptions
@@ -24,6 +24,11 @@ ONLINE_STORE_CLASS_FOR_TYPE = {
     "datastore": "feast.infra.online_stores.datastore.DatastoreOnlineStore",
     "redis": "feast.infra.online_stores.redis.RedisOnlineStore",
     "dynamodb": "feast.infra.online_stores.dynamodb.DynamoDBOnlineStore",
+    "in_memory": "feast.infra.online_stores.in_memory.InMemoryOnlineStore",
+    "snapshot": "feast.infra.online_stores.snapshot.SnapshotOnlineStore",
+    "lmdb": "feast.infra.online_stores.lmdb.LmdbOnlineStore",
+    "postgres": "feast.infra.online_stores.postgres.PostgresOnlineStore",
+    "tiered": "feast.infra.online_stores.tiered.TieredOnlineStore",
 }
 
 OFFLINE_STORE_CLASS_FOR_TYPE = {
@@ -62,6 +67,76 @@ class RegistryConfig(FeastBaseModel):
      expire. Users can manually refresh the cache by calling feature_store.refresh_registry() """
 
 
+class OnlineCacheConfig(FeastConfigBaseModel):
+    """ Online feature cache configuration. Feature rows read from the online store are kept in memory, so that
+     frequently requested entities are served without reading the online store. """
+
+    max_entries: StrictInt = 100000
+    """ int: Maximum number of cached feature rows, i.e. of (feature view, entity) pairs. The least recently used
+     rows are evicted first. """
+
+    ttl_seconds: StrictInt = 60
+    """ int: How long a feature row is cached. The ttl of a feature view, if set, caps how long its rows are
+     cached. """
+
+    negative_ttl_seconds: StrictInt = 5
+    """ int: How long entities which are missing from a feature view are cached. 0 disables the caching of
+     missing entities. """
+
+    feature_view_ttl_seconds: Dict[StrictStr, StrictInt] = {}
+    """ Dict[str, int]: How long the feature rows of specific feature views are cached, by feature view name,
+     instead of ttl_seconds. 0 keeps a feature view out of the cache. """
+
+    admission: Literal["always", "tinylfu"] = "always"
+    """ str: Admission policy of the cache once it is full. "always" evicts the least recently used row. "tinylfu"
+     only admits a feature row if it is requested more often than the least recently used row, so that rows which
+     are rarely requested don't evict the frequently requested ones. """
+
+    @validator("max_entries")
+    def _validate_max_entries(cls, v):
+        if v < 1:
+            raise ValueError("max_entries must be at least 1")
+        return v
+
+    @validator("ttl_seconds", "negative_ttl_seconds")
+    def _validate_ttl_seconds(cls, v, field):
+        if v < 0:
+            raise ValueError(f"{field.name} must not be negative")
+        return v
+
+    @validator("feature_view_ttl_seconds")
+    def _validate_feature_view_ttl_seconds(cls, v):
+        for feature_view_name, ttl_seconds in v.items():
+            if ttl_seconds < 0:
+                raise ValueError(
+                    f"The ttl of feature view {feature_view_name} must not be negative"
+                )
+        return v
+
+
+class OnlineServingConfig(FeastConfigBaseModel):
+    """ Online serving configuration. Configuration that relates to retrieving features from the online store."""
+
+    read_mode: Literal["sequential", "concurrent"] = "sequential"
+    """ str: How the feature views requested together are read from the online store. In "sequential" mode they are
+     read one after the other, in "concurrent" mode they are read in parallel by a pool of threads, so that the
+     latency of a request is close to that of the slowest feature view instead of the sum of all of them. """
+
+    max_concurrent_reads: StrictInt = 8
+    """ int: Size of the thread pool used in "concurrent" read mode, i.e. the maximum number of feature views read
+     in parallel across all requests served by a feature store. """
+
+    cache: Optional[OnlineCacheConfig] = None
+    """ OnlineCacheConfig: In-process cache of the feature rows read from the online store (optional). Feature rows
+     are not cached unless this is set. """
+
+    @validator("max_concurrent_reads")
+    def _validate_max_concurrent_reads(cls, v):
+        if v < 1:
+            raise ValueError("max_concurrent_reads must be at least 1")
+        return v
+
+
 class RepoConfig(FeastBaseModel):
     """ Repo config. Typically loaded from `feature_store.yaml` """
 
@@ -83,6 +158,9 @@ class RepoConfig(FeastBaseModel):
     offline_store: Any
     """ OfflineStoreConfig: Offline store configuration (optional depending on provider) """
 
+    online_serving: OnlineServingConfig = OnlineServingConfig()
+    """ OnlineServingConfig: Online serving configuration (optional) """
+
     repo_path: Optional[Path] = None
 
     def __init__(self, **data: Any):
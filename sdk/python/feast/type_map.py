@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow
 from google.protobuf.json_format import MessageToDict
 from google.protobuf.timestamp_pb2 import Timestamp
 
@@ -72,6 +73,21 @@ def feast_value_type_to_python_type(field_value_proto: ProtoValue) -> Any:
             )
 
 
+def _proto_value_to_python_value(value: ProtoValue) -> Any:
+    """
+    Returns the Python native representation of a Value proto, or None if no value is set. Unlike
+    feast_value_type_to_python_type, this reads the proto fields directly instead of going through a dict,
+    which makes it suitable for converting large numbers of values.
+    """
+    field = value.WhichOneof("val")
+    if field is None:
+        return None
+    field_value = getattr(value, field)
+    if field.endswith("_list_val"):
+        return list(field_value.val)
+    return field_value
+
+
 def python_type_to_feast_value_type(
     name: str, value, recurse: bool = True
 ) -> ValueType:
@@ -318,6 +334,28 @@ def pa_to_feast_value_type(pa_type_as_str: str) -> ValueType:
     return type_map[pa_type_as_str]
 
 
+def feast_value_type_to_pa(feast_type: ValueType) -> pyarrow.DataType:
+    type_map = {
+        ValueType.INT32: pyarrow.int32(),
+        ValueType.INT64: pyarrow.int64(),
+        ValueType.DOUBLE: pyarrow.float64(),
+        ValueType.FLOAT: pyarrow.float32(),
+        ValueType.STRING: pyarrow.string(),
+        ValueType.BYTES: pyarrow.binary(),
+        ValueType.BOOL: pyarrow.bool_(),
+        ValueType.UNIX_TIMESTAMP: pyarrow.int64(),
+        ValueType.INT32_LIST: pyarrow.list_(pyarrow.int32()),
+        ValueType.INT64_LIST: pyarrow.list_(pyarrow.int64()),
+        ValueType.DOUBLE_LIST: pyarrow.list_(pyarrow.float64()),
+        ValueType.FLOAT_LIST: pyarrow.list_(pyarrow.float32()),
+        ValueType.STRING_LIST: pyarrow.list_(pyarrow.string()),
+        ValueType.BYTES_LIST: pyarrow.list_(pyarrow.binary()),
+        ValueType.BOOL_LIST: pyarrow.list_(pyarrow.bool_()),
+        ValueType.UNIX_TIMESTAMP_LIST: pyarrow.list_(pyarrow.int64()),
+    }
+    return type_map[feast_type]
+
+
 def bq_to_feast_value_type(bq_type_as_str):
     type_map: Dict[ValueType, Union[str, Dict[str, Any]]] = {
         "DATETIME": ValueType.STRING,  # Update to ValueType.UNIX_TIMESTAMP once #1520 lands.
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import logging
 import os
 import sys
@@ -28,6 +29,13 @@ from feast.version import get_version
 USAGE_ENDPOINT = "https://usage.feast.dev"
 _logger = logging.getLogger(__name__)
 
+# Functions called on the serving path, whose usage is only logged once every 10000 calls
+_SAMPLED_FUNCTIONS = (
+    "get_online_features",
+    "get_online_features_async",
+    "get_online_features_columnar",
+)
+
 
 class Usage:
     def __init__(self):
@@ -50,7 +58,9 @@ class Usage:
                     usage_filepath = join(feast_home_dir, "usage")
 
                     self._is_test = os.getenv("FEAST_IS_USAGE_TEST", "False") == "True"
-                    self._usage_counter = {"get_online_features": 0}
+                    self._usage_counter = {
+                        function_name: 0 for function_name in _SAMPLED_FUNCTIONS
+                    }
 
                     if os.path.exists(usage_filepath):
                         with open(usage_filepath, "r") as f:
@@ -76,11 +86,11 @@ class Usage:
     def log(self, function_name: str):
         self.check_env_and_configure()
         if self._usage_enabled and self.usage_id:
-            if function_name == "get_online_features":
-                self._usage_counter["get_online_features"] += 1
-                if self._usage_counter["get_online_features"] % 10000 != 2:
+            if function_name in _SAMPLED_FUNCTIONS:
+                self._usage_counter[function_name] += 1
+                if self._usage_counter[function_name] % 10000 != 2:
                     return
-                self._usage_counter["get_online_features"] = 2  # avoid overflow
+                self._usage_counter[function_name] = 2  # avoid overflow
             json = {
                 "function_name": function_name,
                 "usage_id": self.usage_id,
@@ -125,19 +135,7 @@ def log_exceptions(func):
         try:
             result = func(*args, **kwargs)
         except Exception as e:
-            error_type = type(e).__name__
-            trace_to_log = []
-            tb = e.__traceback__
-            while tb is not None:
-                trace_to_log.append(
-                    (
-                        _trim_filename(tb.tb_frame.f_code.co_filename),
-                        tb.tb_lineno,
-                        tb.tb_frame.f_code.co_name,
-                    )
-                )
-                tb = tb.tb_next
-            usage.log_exception(error_type, trace_to_log)
+            _log_exception(e)
             raise
         return result
 
@@ -145,31 +143,49 @@ def log_exceptions(func):
 
 
 def log_exceptions_and_usage(func):
+    if asyncio.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_exception_logging_wrapper(*args, **kwargs):
+            try:
+                result = await func(*args, **kwargs)
+                usage.log(func.__name__)
+            except Exception as e:
+                _log_exception(e)
+                raise
+            return result
+
+        return async_exception_logging_wrapper
+
     @wraps(func)
     def exception_logging_wrapper(*args, **kwargs):
         try:
             result = func(*args, **kwargs)
             usage.log(func.__name__)
         except Exception as e:
-            error_type = type(e).__name__
-            trace_to_log = []
-            tb = e.__traceback__
-            while tb is not None:
-                trace_to_log.append(
-                    (
-                        _trim_filename(tb.tb_frame.f_code.co_filename),
-                        tb.tb_lineno,
-                        tb.tb_frame.f_code.co_name,
-                    )
-                )
-                tb = tb.tb_next
-            usage.log_exception(error_type, trace_to_log)
+            _log_exception(e)
             raise
         return result
 
     return exception_logging_wrapper
 
 
+def _log_exception(e: Exception):
+    error_type = type(e).__name__
+    trace_to_log = []
+    tb = e.__traceback__
+    while tb is not None:
+        trace_to_log.append(
+            (
+                _trim_filename(tb.tb_frame.f_code.co_filename),
+                tb.tb_lineno,
+                tb.tb_frame.f_code.co_name,
+            )
+        )
+        tb = tb.tb_next
+    usage.log_exception(error_type, trace_to_log)
+
+
 def _trim_filename(filename: str) -> str:
     return filename.split("/")[-1]
 
@@ -77,6 +77,14 @@ AWS_REQUIRED = [
     "boto3==1.17.*",
 ]
 
+LMDB_REQUIRED = [
+    "lmdb>=1.1.0",
+]
+
+POSTGRES_REQUIRED = [
+    "psycopg2-binary>=2.8.3",
+]
+
 CI_REQUIRED = [
     "cryptography==3.3.2",
     "flake8",
@@ -86,7 +94,7 @@ CI_REQUIRED = [
     "grpcio-testing==1.34.0",
     "minio==7.1.0",
     "mock==2.0.0",
-    "moto",
+    "moto>=3.1,<5",
     "mypy==0.790",
     "mypy-protobuf==1.24",
     "avro==1.10.0",
@@ -113,6 +121,8 @@ CI_REQUIRED = [
     "google-cloud-core==1.4.*",
     "redis-py-cluster==2.1.2",
     "boto3==1.17.*",
+    "lmdb>=1.1.0",
+    "psycopg2-binary>=2.8.3",
     "dill==0.3.0"
 ]
 
@@ -211,6 +221,8 @@ setup(
         "gcp": GCP_REQUIRED,
         "aws": AWS_REQUIRED,
         "redis": REDIS_REQUIRED,
+        "lmdb": LMDB_REQUIRED,
+        "postgres": POSTGRES_REQUIRED,
     },
     include_package_data=True,
     license="Apache",
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import multiprocessing
+import time
 from datetime import datetime, timedelta
 from sys import platform
 
@@ -132,3 +133,41 @@ def e2e_data_sources(environment: Environment):
     yield df, data_source
 
     environment.data_source_creator.teardown()
+
+
+@pytest.fixture(scope="session")
+def postgres_online_store_config():
+    psycopg2 = pytest.importorskip("psycopg2")
+    from testcontainers.core.generic import DockerContainer
+
+    from feast.infra.online_stores.postgres import PostgresOnlineStoreConfig
+
+    container = (
+        DockerContainer("postgres:13")
+        .with_exposed_ports(5432)
+        .with_env("POSTGRES_PASSWORD", "feast")
+    )
+    container.start()
+    config = PostgresOnlineStoreConfig(
+        host=container.get_container_host_ip(),
+        port=int(container.get_exposed_port(5432)),
+        user="postgres",
+        password="feast",
+    )
+    # The server restarts once after initializing the database, so connections are retried until it is ready
+    deadline = time.time() + 30
+    while True:
+        try:
+            psycopg2.connect(
+                host=config.host,
+                port=config.port,
+                user=config.user,
+                password=config.password,
+            ).close()
+            break
+        except psycopg2.OperationalError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.5)
+    yield config
+    container.stop()
@@ -5,6 +5,7 @@ import sys
 import unittest
 
 import feast
+from feast.errors import FeastExtrasDependencyImportError
 
 
 def setup_feature_store():
@@ -71,8 +72,9 @@ def test_docstrings():
                     temp_module = importlib.import_module(full_name)
                     if is_pkg:
                         next_packages.append(temp_module)
-                except ModuleNotFoundError:
-                    pass
+                except (ModuleNotFoundError, FeastExtrasDependencyImportError):
+                    # Modules whose optional dependencies are not installed have no docstring tests to run
+                    continue
 
                 # Retrieve the setup and teardown functions defined in this file.
                 relative_path_from_feast = full_name.split(".", 1)[1]
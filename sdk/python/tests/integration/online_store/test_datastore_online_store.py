@@ -0,0 +1,82 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from feast import Feature, FeatureView, FileSource, ValueType
+from feast.infra.online_stores.datastore import (
+    DATASTORE_GET_MULTI_SIZE,
+    DatastoreOnlineStore,
+    DatastoreOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+# These tests run against the Datastore emulator, e.g. started with `gcloud beta emulators datastore start` after
+# setting DATASTORE_EMULATOR_HOST.
+pytestmark = pytest.mark.skipif(
+    "DATASTORE_EMULATOR_HOST" not in os.environ,
+    reason="The Datastore emulator is not available",
+)
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[Feature(name="trips", dtype=ValueType.INT64)],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("transactional_writes", [True, False])
+def test_online_read_and_write(transactional_writes):
+    config = RepoConfig(
+        registry="registry.db",
+        project="test",
+        provider="local",
+        online_store=DatastoreOnlineStoreConfig(
+            project_id="test", transactional_writes=transactional_writes
+        ),
+    )
+    store = DatastoreOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+
+    # Enough rows to need several concurrent lookups
+    num_drivers = DATASTORE_GET_MULTI_SIZE + 10
+    event_ts = datetime.utcnow()
+    progress = []
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {"trips": ValueProto(int64_val=driver)},
+                event_ts,
+                None,
+            )
+            for driver in range(num_drivers)
+        ],
+        progress.append,
+    )
+    assert sum(progress) == num_drivers
+
+    drivers = list(range(num_drivers + 5)) + [0]
+    result = store.online_read(
+        config, FEATURE_VIEW, [_entity_key(driver) for driver in drivers]
+    )
+    assert [features for _, features in result] == [
+        {"trips": ValueProto(int64_val=driver)} if driver < num_drivers else None
+        for driver in drivers
+    ]
+
+    store.teardown(config, [FEATURE_VIEW], [])
+    store.close()
@@ -0,0 +1,146 @@
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from feast import Feature, FeatureView, FileSource, ValueType
+from feast.infra.online_stores import in_memory
+from feast.infra.online_stores.in_memory import (
+    InMemoryOnlineStore,
+    InMemoryOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[
+        Feature(name="trips", dtype=ValueType.INT64),
+        Feature(name="rating", dtype=ValueType.DOUBLE),
+    ],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+@pytest.fixture
+def data_dir(monkeypatch):
+    # Each test starts without any feature in memory
+    monkeypatch.setattr(in_memory, "_databases", {})
+    with TemporaryDirectory() as data_dir:
+        yield data_dir
+
+
+def _repo_config(data_dir, **online_store_options):
+    return RepoConfig(
+        registry=str(Path(data_dir) / "registry.db"),
+        project="test",
+        provider="local",
+        online_store=InMemoryOnlineStoreConfig(**online_store_options),
+    )
+
+
+def test_snapshot_and_restore(data_dir, monkeypatch):
+    snapshot_path = str(Path(data_dir) / "snapshot.db")
+    config = _repo_config(data_dir, snapshot_path=snapshot_path)
+    store = InMemoryOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    event_ts = datetime(2021, 1, 1)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {"trips": ValueProto(int64_val=driver)},
+                event_ts,
+                None,
+            )
+            for driver in range(100)
+        ],
+        None,
+    )
+    store.close()
+    assert stat.S_IMODE(Path(snapshot_path).stat().st_mode) == 0o644
+
+    # Features are kept by the process, not by the store
+    assert InMemoryOnlineStore().online_read(
+        config, FEATURE_VIEW, [_entity_key(0)]
+    ) == [(event_ts, {"trips": ValueProto(int64_val=0)})]
+
+    # Another process restores the features from the snapshot
+    monkeypatch.setattr(in_memory, "_databases", {})
+    store = InMemoryOnlineStore()
+    assert store.online_read(
+        config, FEATURE_VIEW, [_entity_key(driver) for driver in [0, 99, 100]]
+    ) == [
+        (event_ts, {"trips": ValueProto(int64_val=0)}),
+        (event_ts, {"trips": ValueProto(int64_val=99)}),
+        (None, None),
+    ]
+    store.close()
+
+
+def test_teardown_stops_saving_snapshots(data_dir):
+    snapshot_path = str(Path(data_dir) / "snapshot.db")
+    config = _repo_config(
+        data_dir, snapshot_path=snapshot_path, snapshot_interval_seconds=3600
+    )
+    store = InMemoryOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=1)}, datetime.utcnow(), None)],
+        None,
+    )
+    database = in_memory._databases[snapshot_path]
+    thread = database._thread
+    assert thread.is_alive()
+
+    store.teardown(config, [FEATURE_VIEW], [])
+    assert not thread.is_alive()
+    assert snapshot_path not in in_memory._databases
+    assert Path(snapshot_path).exists()
+    assert list(Path(data_dir).glob("*.tmp")) == []
+
+
+def test_concurrent_snapshots(data_dir):
+    snapshot_path = str(Path(data_dir) / "snapshot.db")
+    event_ts = datetime(2021, 1, 1)
+    tables = {
+        "test_driver_stats": [
+            (
+                in_memory.serialize_entity_key(_entity_key(driver)),
+                (event_ts, {"trips": ValueProto(int64_val=driver)}),
+            )
+            for driver in range(100)
+        ]
+    }
+
+    # Writers of the same snapshot, e.g. in different processes, use their own temporary files
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda _: in_memory._write_snapshot(snapshot_path, tables), range(20)
+            )
+        )
+    assert list(Path(data_dir).glob("*.tmp")) == []
+
+    config = _repo_config(data_dir, snapshot_path=snapshot_path)
+    store = InMemoryOnlineStore()
+    assert store.online_read(config, FEATURE_VIEW, [_entity_key(99)]) == [
+        (event_ts, {"trips": ValueProto(int64_val=99)})
+    ]
+    store.close()
@@ -0,0 +1,121 @@
+import multiprocessing
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from feast import Feature, FeatureView, FileSource, ValueType
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+pytest.importorskip("lmdb")
+
+from feast.infra.online_stores import lmdb  # noqa: E402
+from feast.infra.online_stores.lmdb import (  # noqa: E402
+    LmdbOnlineStore,
+    LmdbOnlineStoreConfig,
+)
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[
+        Feature(name="trips", dtype=ValueType.INT64),
+        Feature(name="rating", dtype=ValueType.DOUBLE),
+    ],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+@pytest.fixture
+def data_dir(monkeypatch):
+    monkeypatch.setattr(lmdb, "_envs", {})
+    with TemporaryDirectory() as data_dir:
+        yield data_dir
+
+
+def _repo_config(data_dir, **online_store_options):
+    return RepoConfig(
+        registry=str(Path(data_dir) / "registry.db"),
+        project="test",
+        provider="local",
+        online_store=LmdbOnlineStoreConfig(
+            path=str(Path(data_dir) / "online_store.lmdb"), **online_store_options
+        ),
+    )
+
+
+def test_map_grows(data_dir):
+    # Writes which don't fit in the memory map grow it
+    config = _repo_config(data_dir, map_size=64 * 1024)
+    store = LmdbOnlineStore()
+    event_ts = datetime(2021, 1, 1)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {"trips": ValueProto(int64_val=driver)},
+                event_ts,
+                None,
+            )
+            for driver in range(10000)
+        ],
+        None,
+    )
+    assert store.online_read(config, FEATURE_VIEW, [_entity_key(9999)]) == [
+        (event_ts, {"trips": ValueProto(int64_val=9999)})
+    ]
+
+
+def _write_drivers(config, num_drivers, event_ts):
+    LmdbOnlineStore().online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {"trips": ValueProto(int64_val=driver)},
+                event_ts,
+                None,
+            )
+            for driver in range(num_drivers)
+        ],
+        None,
+    )
+
+
+def test_map_grown_by_another_process(data_dir):
+    config = _repo_config(data_dir, map_size=64 * 1024)
+    store = LmdbOnlineStore()
+    event_ts = datetime(2021, 1, 1)
+    _write_drivers(config, 1, event_ts)
+    assert store.online_read(config, FEATURE_VIEW, [_entity_key(0)]) == [
+        (event_ts, {"trips": ValueProto(int64_val=0)})
+    ]
+
+    # Another process grows the map past the size this process opened it with
+    writer = multiprocessing.get_context("spawn").Process(
+        target=_write_drivers, args=(config, 10000, event_ts)
+    )
+    writer.start()
+    writer.join()
+    assert writer.exitcode == 0
+
+    assert store.online_read(config, FEATURE_VIEW, [_entity_key(9999)]) == [
+        (event_ts, {"trips": ValueProto(int64_val=9999)})
+    ]
+    _write_drivers(config, 1, datetime(2021, 1, 2))
+    assert store.online_read(config, FEATURE_VIEW, [_entity_key(0)]) == [
+        (datetime(2021, 1, 2), {"trips": ValueProto(int64_val=0)})
+    ]
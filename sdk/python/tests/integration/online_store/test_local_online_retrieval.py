@@ -0,0 +1,497 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from feast import Entity, Feature, FeatureService, FeatureView, FileSource, ValueType
+from feast.feature_store import FeatureStore
+from feast.infra.caching_provider import OnlineCacheStats, _OnlineFeatureCache
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import OnlineCacheConfig, OnlineServingConfig, RepoConfig
+
+
+def _driver_locations_view(features):
+    return FeatureView(
+        name="driver_locations",
+        entities=["driver"],
+        ttl=timedelta(days=1),
+        features=features,
+        batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+    )
+
+
+@pytest.fixture
+def local_store():
+    """
+    A feature store using the local provider, with the same feature views as example_feature_repo_1.py
+    and some feature values already written to the online store.
+    """
+    with TemporaryDirectory() as data_dir:
+        store = FeatureStore(
+            config=RepoConfig(
+                registry=str(Path(data_dir) / "registry.db"),
+                project="default",
+                provider="local",
+                online_store=SqliteOnlineStoreConfig(
+                    path=str(Path(data_dir) / "online_store.db")
+                ),
+            )
+        )
+
+        driver_locations = _driver_locations_view(
+            [
+                Feature(name="lat", dtype=ValueType.FLOAT),
+                Feature(name="lon", dtype=ValueType.STRING),
+            ]
+        )
+        customer_profile = FeatureView(
+            name="customer_profile",
+            entities=["customer"],
+            ttl=timedelta(days=1),
+            features=[
+                Feature(name="avg_orders_day", dtype=ValueType.FLOAT),
+                Feature(name="name", dtype=ValueType.STRING),
+                Feature(name="age", dtype=ValueType.INT64),
+            ],
+            batch_source=FileSource(
+                path="customer.parquet", event_timestamp_column="ts"
+            ),
+        )
+        customer_driver_combined = FeatureView(
+            name="customer_driver_combined",
+            entities=["customer", "driver"],
+            ttl=timedelta(days=1),
+            features=[Feature(name="trips", dtype=ValueType.INT64)],
+            batch_source=FileSource(
+                path="customer_driver.parquet", event_timestamp_column="ts"
+            ),
+        )
+        store.apply(
+            [
+                Entity(name="driver", value_type=ValueType.INT64),
+                Entity(name="customer", value_type=ValueType.INT64),
+                driver_locations,
+                customer_profile,
+                customer_driver_combined,
+                FeatureService(
+                    name="driver_locations_service", features=[driver_locations]
+                ),
+            ]
+        )
+
+        provider = store._get_provider()
+        now = datetime.utcnow()
+        for driver, customer in [(1, 4), (2, 5), (3, 6)]:
+            driver_key = EntityKeyProto(
+                join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+            )
+            customer_key = EntityKeyProto(
+                join_keys=["customer"], entity_values=[ValueProto(int64_val=customer)]
+            )
+            combined_key = EntityKeyProto(
+                join_keys=["customer", "driver"],
+                entity_values=[
+                    ValueProto(int64_val=customer),
+                    ValueProto(int64_val=driver),
+                ],
+            )
+            provider.online_write_batch(
+                config=store.config,
+                table=driver_locations,
+                data=[
+                    (
+                        driver_key,
+                        {
+                            "lat": ValueProto(float_val=driver * 0.5),
+                            "lon": ValueProto(string_val=str(driver)),
+                        },
+                        now,
+                        now,
+                    )
+                ],
+                progress=None,
+            )
+            provider.online_write_batch(
+                config=store.config,
+                table=customer_profile,
+                data=[
+                    (
+                        customer_key,
+                        {
+                            "avg_orders_day": ValueProto(float_val=customer * 1.0),
+                            "name": ValueProto(string_val=f"foo{customer}"),
+                            "age": ValueProto(int64_val=customer * 10),
+                        },
+                        now,
+                        now,
+                    )
+                ],
+                progress=None,
+            )
+            provider.online_write_batch(
+                config=store.config,
+                table=customer_driver_combined,
+                data=[
+                    (
+                        combined_key,
+                        {"trips": ValueProto(int64_val=customer * driver)},
+                        now,
+                        now,
+                    )
+                ],
+                progress=None,
+            )
+
+        yield store
+
+        store.teardown()
+
+
+FEATURES = [
+    "driver_locations:lon",
+    "customer_profile:name",
+    "customer_profile:age",
+    "customer_driver_combined:trips",
+]
+
+
+def test_get_online_features(local_store):
+    result = local_store.get_online_features(
+        features=FEATURES,
+        entity_rows=[{"driver": 3, "customer": 6}, {"driver": 1, "customer": 5}],
+    ).to_dict()
+
+    assert result["driver"] == [3, 1]
+    assert result["customer"] == [6, 5]
+    assert result["lon"] == ["3", "1"]
+    assert result["name"] == ["foo6", "foo5"]
+    assert result["age"] == [60, 50]
+    # There is no row for customer 5 and driver 1
+    assert result["trips"] == [18, None]
+
+
+def test_online_retrieval_plan_is_cached_until_registry_changes(local_store):
+    plan = local_store._get_online_retrieval_plan(FEATURES, None, False)
+    assert local_store._get_online_retrieval_plan(FEATURES, None, False) is plan
+    assert local_store._get_online_retrieval_plan(FEATURES, None, True) is not plan
+    assert [
+        (view_plan.table.name, view_plan.output_names)
+        for view_plan in local_store._get_online_retrieval_plan(
+            FEATURES, None, True
+        ).view_plans
+    ] == [
+        ("driver_locations", [("lon", "driver_locations__lon")]),
+        (
+            "customer_profile",
+            [("name", "customer_profile__name"), ("age", "customer_profile__age")],
+        ),
+        ("customer_driver_combined", [("trips", "customer_driver_combined__trips")]),
+    ]
+
+    feature_service = local_store.get_feature_service("driver_locations_service")
+    plan = local_store._get_online_retrieval_plan(feature_service, None, False)
+    assert local_store._get_online_retrieval_plan(feature_service, None, False) is plan
+
+    # Changing the registry invalidates the plans built from it
+    features = ["driver_locations:lon", "driver_locations:speed"]
+    features_plan = local_store._get_online_retrieval_plan(features, None, False)
+    local_store.apply(
+        _driver_locations_view(
+            [
+                Feature(name="lat", dtype=ValueType.FLOAT),
+                Feature(name="lon", dtype=ValueType.STRING),
+                Feature(name="speed", dtype=ValueType.FLOAT),
+            ]
+        )
+    )
+    assert (
+        local_store._get_online_retrieval_plan(feature_service, None, False) is not plan
+    )
+    assert local_store._get_online_retrieval_plan(features, None, False) is not (
+        features_plan
+    )
+
+    result = local_store.get_online_features(
+        features=features, entity_rows=[{"driver": 2}]
+    ).to_dict()
+    assert result["lon"] == ["2"]
+
+
+def test_get_online_features_columnar(local_store):
+    entities = {
+        "driver": np.array([3, 1, 3, 2]),
+        "customer": pa.array([6, 5, 6, 4]),
+    }
+    response = local_store.get_online_features_columnar(
+        features=FEATURES, entities=entities
+    )
+    expected = local_store.get_online_features(
+        features=FEATURES,
+        entity_rows=[
+            {"driver": driver, "customer": customer}
+            for driver, customer in zip([3, 1, 3, 2], [6, 5, 6, 4])
+        ],
+    ).to_dict()
+
+    table = response.to_arrow()
+    assert table.column_names == ["driver", "customer", "lon", "name", "age", "trips"]
+    assert table.schema.field("age").type == pa.int64()
+    assert table.to_pydict() == expected
+
+    arrays = response.to_numpy()
+    assert arrays["lon"].tolist() == ["3", "1", "3", "2"]
+    assert np.isnan(arrays["trips"][1])
+
+    present = GetOnlineFeaturesResponse.FieldStatus.PRESENT
+    not_found = GetOnlineFeaturesResponse.FieldStatus.NOT_FOUND
+    assert response.statuses["age"].tolist() == [present] * 4
+    assert response.statuses["trips"].tolist() == [
+        present,
+        not_found,
+        present,
+        not_found,
+    ]
+
+    full_names = local_store.get_online_features_columnar(
+        features=["driver_locations:lon"],
+        entities={"driver": [1, 2]},
+        full_feature_names=True,
+    )
+    assert full_names.to_arrow().to_pydict() == {
+        "driver": [1, 2],
+        "driver_locations__lon": ["1", "2"],
+    }
+
+    with pytest.raises(ValueError):
+        local_store.get_online_features_columnar(
+            features=FEATURES, entities={"driver": [1, 2], "customer": [4]}
+        )
+    with pytest.raises(ValueError):
+        local_store.get_online_features_columnar(
+            features=FEATURES, entities={"driver": [1, 2]}
+        )
+
+
+def test_get_online_features_with_concurrent_reads(local_store):
+    expected = local_store.get_online_features(
+        features=FEATURES,
+        entity_rows=[{"driver": 3, "customer": 6}, {"driver": 1, "customer": 5}],
+    ).to_dict()
+
+    local_store.config = local_store.config.copy(
+        update={
+            "online_serving": OnlineServingConfig(
+                read_mode="concurrent", max_concurrent_reads=2
+            )
+        }
+    )
+    assert (
+        local_store.get_online_features(
+            features=FEATURES,
+            entity_rows=[{"driver": 3, "customer": 6}, {"driver": 1, "customer": 5}],
+        ).to_dict()
+        == expected
+    )
+    executor = local_store._online_read_executor
+    assert executor is not None
+
+    response = local_store.get_online_features_columnar(
+        features=FEATURES, entities={"driver": [3, 1], "customer": [6, 5]}
+    )
+    assert response.to_arrow().to_pydict() == expected
+    # The thread pool is reused across calls
+    assert local_store._online_read_executor is executor
+
+    local_store.close()
+    assert local_store._online_read_executor is None
+
+
+def test_get_online_features_async(local_store):
+    entity_rows = [{"driver": 3, "customer": 6}, {"driver": 1, "customer": 5}]
+    expected = local_store.get_online_features(
+        features=FEATURES, entity_rows=entity_rows
+    ).to_dict()
+
+    async def get_online_features():
+        return await asyncio.gather(
+            *[
+                local_store.get_online_features_async(
+                    features=FEATURES, entity_rows=entity_rows
+                )
+                for _ in range(3)
+            ]
+        )
+
+    responses = asyncio.run(get_online_features())
+    assert [response.to_dict() for response in responses] == [expected] * 3
+
+    # The SQLite store reads on dedicated threads and connections, which are released by close()
+    online_store = local_store._get_provider().online_store
+    assert online_store._async_read_executor is not None
+    local_store.close()
+    assert online_store._conns == []
+    assert online_store._async_read_executor is None
+
+
+def test_feature_views_with_the_same_entities_are_read_together(local_store):
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=["driver"],
+        ttl=timedelta(days=1),
+        features=[Feature(name="rating", dtype=ValueType.DOUBLE)],
+        batch_source=FileSource(
+            path="driver_stats.parquet", event_timestamp_column="ts"
+        ),
+    )
+    local_store.apply(driver_stats)
+    provider = local_store._get_provider()
+    now = datetime.utcnow()
+    provider.online_write_batch(
+        config=local_store.config,
+        table=driver_stats,
+        data=[
+            (
+                EntityKeyProto(
+                    join_keys=["driver"], entity_values=[ValueProto(int64_val=1)]
+                ),
+                {"rating": ValueProto(double_val=4.5)},
+                now,
+                now,
+            )
+        ],
+        progress=None,
+    )
+
+    online_read_many_calls = []
+    online_read_many = provider.online_read_many
+
+    def spy(config, tables, entity_keys):
+        online_read_many_calls.append([table.name for table, _ in tables])
+        return online_read_many(config, tables, entity_keys)
+
+    provider.online_read_many = spy
+
+    result = local_store.get_online_features(
+        features=FEATURES + ["driver_stats:rating"],
+        entity_rows=[{"driver": 1, "customer": 4}, {"driver": 2, "customer": 5}],
+    ).to_dict()
+    assert online_read_many_calls == [["driver_locations", "driver_stats"]]
+    assert result["lon"] == ["1", "2"]
+    assert result["rating"] == [4.5, None]
+    assert result["trips"] == [4, 10]
+
+
+def test_online_read_requested_features(local_store):
+    customer_profile = local_store.get_feature_view("customer_profile")
+    entity_keys = [
+        EntityKeyProto(join_keys=["customer"], entity_values=[ValueProto(int64_val=4)])
+    ]
+    provider = local_store._get_provider()
+    _, features = provider.online_read(
+        local_store.config, customer_profile, entity_keys, ["name", "age"]
+    )[0]
+    assert features == {
+        "name": ValueProto(string_val="foo4"),
+        "age": ValueProto(int64_val=40),
+    }
+    _, features = provider.online_read(
+        local_store.config, customer_profile, entity_keys
+    )[0]
+    assert set(features) == {"avg_orders_day", "name", "age"}
+
+
+def test_online_features_cache(local_store):
+    entity_rows = [{"driver": 3, "customer": 6}, {"driver": 1, "customer": 5}]
+    expected = local_store.get_online_features(
+        features=FEATURES, entity_rows=entity_rows
+    ).to_dict()
+    assert local_store.get_online_cache_stats() is None
+
+    local_store.config = local_store.config.copy(
+        update={
+            "online_serving": OnlineServingConfig(
+                cache=OnlineCacheConfig(max_entries=8)
+            )
+        }
+    )
+    for _ in range(2):
+        assert (
+            local_store.get_online_features(
+                features=FEATURES, entity_rows=entity_rows
+            ).to_dict()
+            == expected
+        )
+    # 3 feature views are read for 2 entity rows, the missing (driver 1, customer 5) row is cached too
+    assert local_store.get_online_cache_stats() == OnlineCacheStats(
+        hits=6, misses=6, evictions=0, size=6
+    )
+    assert (
+        asyncio.run(
+            local_store.get_online_features_async(
+                features=FEATURES, entity_rows=entity_rows
+            )
+        ).to_dict()
+        == expected
+    )
+    assert local_store.get_online_cache_stats().hits == 12
+
+    # Writes invalidate the cached rows of the feature view
+    customer_profile = local_store.get_feature_view("customer_profile")
+    local_store._get_provider().online_write_batch(
+        config=local_store.config,
+        table=customer_profile,
+        data=[
+            (
+                EntityKeyProto(
+                    join_keys=["customer"], entity_values=[ValueProto(int64_val=6)]
+                ),
+                {"age": ValueProto(int64_val=61)},
+                datetime.utcnow(),
+                None,
+            )
+        ],
+        progress=None,
+    )
+    result = local_store.get_online_features(
+        features=FEATURES, entity_rows=entity_rows
+    ).to_dict()
+    assert result["age"] == [61, 50]
+    assert local_store.get_online_cache_stats().misses == 8
+
+    # The least recently used rows are evicted, the invalidated rows having been replaced when they were read again
+    local_store.get_online_features(
+        features=["driver_locations:lon"],
+        entity_rows=[{"driver": driver} for driver in range(10, 15)],
+    )
+    stats = local_store.get_online_cache_stats()
+    assert stats.size == 8
+    assert stats.evictions == 3
+
+
+def test_online_features_cache_expiry(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("feast.infra.caching_provider.time.monotonic", lambda: now[0])
+    cache = _OnlineFeatureCache(max_entries=10)
+    row = (datetime.utcnow(), {"age": ValueProto(int64_val=1)})
+    key = ("customer_profile", None, b"key")
+
+    cache.put(key, row, ttl_seconds=10, generation=0)
+    now[0] = 9.0
+    assert cache.get(key, generation=0) == row
+    now[0] = 10.0
+    assert cache.get(key, generation=0) is None
+
+    # Rows read before the feature view was written are not cached
+    cache.invalidate("customer_profile")
+    cache.put(key, row, ttl_seconds=10, generation=0)
+    assert cache.get(key, generation=1) is None
+    cache.put(key, row, ttl_seconds=10, generation=1)
+    assert cache.get(key, generation=1) == row
+    assert cache.stats() == OnlineCacheStats(hits=2, misses=2, evictions=0, size=1)
@@ -0,0 +1,190 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from feast import Entity, Feature, FeatureView, FileSource, ValueType
+from feast.feature_store import FeatureStore
+from feast.infra.online_stores import in_memory
+from feast.infra.online_stores.helpers import get_online_store_from_config
+from feast.infra.online_stores.in_memory import InMemoryOnlineStoreConfig
+from feast.infra.online_stores.snapshot import SnapshotOnlineStoreConfig
+from feast.infra.online_stores.tiered import TieredOnlineStoreConfig
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[
+        Feature(name="trips", dtype=ValueType.INT64),
+        Feature(name="rating", dtype=ValueType.DOUBLE),
+    ],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+OTHER_FEATURE_VIEW = FeatureView(
+    name="driver_stats_v2",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[Feature(name="trips", dtype=ValueType.INT64)],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+@pytest.fixture(
+    params=[
+        "in_memory",
+        "snapshot",
+        "lmdb",
+        pytest.param("postgres", marks=pytest.mark.integration),
+        "tiered",
+    ]
+)
+def repo_config(request, tmp_path, monkeypatch):
+    if request.param == "in_memory":
+        # Each test starts without any feature in memory
+        monkeypatch.setattr(in_memory, "_databases", {})
+        online_store = InMemoryOnlineStoreConfig()
+    elif request.param == "snapshot":
+        online_store = SnapshotOnlineStoreConfig(
+            path=str(tmp_path / "online_snapshots")
+        )
+    elif request.param == "lmdb":
+        pytest.importorskip("lmdb")
+        from feast.infra.online_stores import lmdb
+
+        monkeypatch.setattr(lmdb, "_envs", {})
+        online_store = lmdb.LmdbOnlineStoreConfig(
+            path=str(tmp_path / "online_store.lmdb")
+        )
+    elif request.param == "postgres":
+        online_store = request.getfixturevalue("postgres_online_store_config")
+    elif request.param == "tiered":
+        online_store = TieredOnlineStoreConfig(
+            remote={"type": "sqlite", "path": str(tmp_path / "online.db")}
+        )
+    else:
+        raise ValueError(f"Unknown online store {request.param}")
+    return RepoConfig(
+        registry=str(tmp_path / "registry.db"),
+        project="test",
+        provider="local",
+        online_store=online_store,
+    )
+
+
+def test_online_read_and_write(repo_config):
+    store = get_online_store_from_config(repo_config.online_store)
+    store.update(
+        repo_config, [], [FEATURE_VIEW, OTHER_FEATURE_VIEW], [], [], partial=False
+    )
+    entity_keys = [_entity_key(driver) for driver in [0, 1, 2, 3, 0]]
+    assert store.online_read(repo_config, FEATURE_VIEW, entity_keys) == [
+        (None, None)
+    ] * len(entity_keys)
+
+    first_write = datetime(2021, 1, 1)
+    second_write = datetime(2021, 1, 2)
+    progress = []
+    store.online_write_batch(
+        repo_config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {
+                    "trips": ValueProto(int64_val=driver),
+                    "rating": ValueProto(double_val=1.0),
+                },
+                first_write,
+                None,
+            )
+            for driver in range(3)
+        ]
+        # The last write of an entity wins
+        + [(_entity_key(2), {"trips": ValueProto(int64_val=20)}, first_write, None)],
+        progress.append,
+    )
+    # Features which are not written keep their current values
+    store.online_write_batch(
+        repo_config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=10)}, second_write, None)],
+        progress.append,
+    )
+    store.online_write_batch(
+        repo_config,
+        OTHER_FEATURE_VIEW,
+        [(_entity_key(0), {"trips": ValueProto(int64_val=30)}, second_write, None)],
+        progress.append,
+    )
+    assert progress == [4, 1, 1]
+
+    first_row = (
+        first_write,
+        {"trips": ValueProto(int64_val=0), "rating": ValueProto(double_val=1.0)},
+    )
+    rows = store.online_read(repo_config, FEATURE_VIEW, entity_keys)
+    assert rows[0] == first_row
+    # Stores which keep an event timestamp per feature return the timestamp of any of them
+    assert rows[1][0] in (first_write, second_write)
+    assert rows[1][1] == {
+        "trips": ValueProto(int64_val=10),
+        "rating": ValueProto(double_val=1.0),
+    }
+    assert rows[2] == (
+        first_write,
+        {"trips": ValueProto(int64_val=20), "rating": ValueProto(double_val=1.0)},
+    )
+    assert rows[3:] == [(None, None), first_row]
+    assert store.online_read(
+        repo_config, FEATURE_VIEW, entity_keys[:1], ["rating"]
+    ) == [(first_write, {"rating": ValueProto(double_val=1.0)})]
+
+    # Deleting a feature view keeps the features of the others
+    store.update(
+        repo_config, [FEATURE_VIEW], [OTHER_FEATURE_VIEW], [], [], partial=False
+    )
+    assert store.online_read(repo_config, OTHER_FEATURE_VIEW, entity_keys[:1]) == [
+        (second_write, {"trips": ValueProto(int64_val=30)})
+    ]
+
+    store.teardown(repo_config, [OTHER_FEATURE_VIEW], [])
+    store.update(repo_config, [], [OTHER_FEATURE_VIEW], [], [], partial=False)
+    assert store.online_read(repo_config, OTHER_FEATURE_VIEW, entity_keys[:1]) == [
+        (None, None)
+    ]
+    store.teardown(repo_config, [OTHER_FEATURE_VIEW], [])
+    store.close()
+
+
+def test_get_online_features(repo_config):
+    store = FeatureStore(config=repo_config)
+    store.apply([Entity(name="driver", value_type=ValueType.INT64), FEATURE_VIEW])
+    store._get_provider().online_write_batch(
+        config=store.config,
+        table=FEATURE_VIEW,
+        data=[
+            (
+                _entity_key(1),
+                {"trips": ValueProto(int64_val=7)},
+                datetime.utcnow(),
+                None,
+            )
+        ],
+        progress=None,
+    )
+
+    result = store.get_online_features(
+        features=["driver_stats:trips"], entity_rows=[{"driver": 1}, {"driver": 2}]
+    ).to_dict()
+    assert result == {"driver": [1, 2], "trips": [7, None]}
+    store.teardown()
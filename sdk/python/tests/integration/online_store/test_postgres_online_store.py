@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from feast import Feature, FeatureView, FileSource, ValueType
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+pytest.importorskip("psycopg2")
+
+from feast.infra.online_stores.postgres import PostgresOnlineStore  # noqa: E402
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[
+        Feature(name="trips", dtype=ValueType.INT64),
+        Feature(name="rating", dtype=ValueType.DOUBLE),
+    ],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+def _repo_config(tmp_path, online_store):
+    return RepoConfig(
+        registry=str(tmp_path / "registry.db"),
+        project="test",
+        provider="local",
+        online_store=online_store,
+    )
+
+
+@pytest.mark.integration
+def test_more_threads_than_connections(tmp_path, postgres_online_store_config):
+    # Threads wait for a connection instead of failing when the pool is exhausted
+    config = _repo_config(
+        tmp_path, postgres_online_store_config.copy(update={"max_connections": 2})
+    )
+    store = PostgresOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    event_ts = datetime(2021, 1, 1)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=1)}, event_ts, None)],
+        None,
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: store.online_read(config, FEATURE_VIEW, [_entity_key(1)]),
+                range(64),
+            )
+        )
+    assert results == [[(event_ts, {"trips": ValueProto(int64_val=1)})]] * 64
+
+    store.teardown(config, [FEATURE_VIEW], [])
+    store.close()
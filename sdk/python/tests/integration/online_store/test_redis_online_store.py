@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from feast import Feature, FeatureView, FileSource, ValueType
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+pytest.importorskip("redis")
+
+from testcontainers.core.generic import DockerContainer  # noqa: E402
+
+from feast.infra.online_stores.helpers import _redis_key  # noqa: E402
+from feast.infra.online_stores.redis import (  # noqa: E402
+    RedisOnlineStore,
+    RedisOnlineStoreConfig,
+)
+
+
+def _feature_view(name, feature_name, ttl):
+    return FeatureView(
+        name=name,
+        entities=["driver"],
+        ttl=ttl,
+        features=[Feature(name=feature_name, dtype=ValueType.INT64)],
+        batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+    )
+
+
+DAILY_VIEW = _feature_view("driver_daily_stats", "trips", timedelta(days=1))
+HOURLY_VIEW = _feature_view("driver_hourly_stats", "rides", timedelta(hours=1))
+STATIC_VIEW = _feature_view("driver_profile", "age", None)
+
+ENTITY_KEY = EntityKeyProto(
+    join_keys=["driver"], entity_values=[ValueProto(int64_val=1)]
+)
+
+
+@pytest.fixture(scope="module")
+def redis_connection_string():
+    container = DockerContainer("redis:6").with_exposed_ports(6379)
+    container.start()
+    yield f"{container.get_container_host_ip()}:{container.get_exposed_port(6379)}"
+    container.stop()
+
+
+def _write(store, config, table, feature_name, event_ts):
+    store.online_write_batch(
+        config,
+        table,
+        [(ENTITY_KEY, {feature_name: ValueProto(int64_val=1)}, event_ts, None)],
+        None,
+    )
+
+
+@pytest.mark.integration
+def test_key_expiry_is_only_extended(tmp_path, redis_connection_string):
+    config = RepoConfig(
+        registry=str(tmp_path / "registry.db"),
+        project="test",
+        provider="local",
+        online_store=RedisOnlineStoreConfig(
+            connection_string=redis_connection_string, key_expiry=True
+        ),
+    )
+    store = RedisOnlineStore()
+    client = store._get_client(config.online_store)
+    key = _redis_key(config.project, ENTITY_KEY)
+    client.delete(key)
+    now = datetime.utcnow()
+
+    # A row which is already stale doesn't set an expiry, which would delete the key at once
+    _write(store, config, HOURLY_VIEW, "rides", now - timedelta(days=2))
+    assert client.pttl(key) == -1
+    client.delete(key)
+
+    _write(store, config, DAILY_VIEW, "trips", now)
+    assert 23 * 3600 * 1000 < client.pttl(key) <= 24 * 3600 * 1000
+
+    # An old row of another feature view neither deletes the features of the first one, nor shortens the expiry
+    _write(store, config, HOURLY_VIEW, "rides", now - timedelta(days=2))
+    _write(store, config, HOURLY_VIEW, "rides", now)
+    assert 23 * 3600 * 1000 < client.pttl(key) <= 24 * 3600 * 1000
+    assert store.online_read(config, DAILY_VIEW, [ENTITY_KEY])[0][1] == {
+        "trips": ValueProto(int64_val=1)
+    }
+
+    # Rows of feature views without ttl keep the key until they are deleted
+    _write(store, config, STATIC_VIEW, "age", now)
+    assert client.pttl(key) == -1
+    _write(store, config, DAILY_VIEW, "trips", now)
+    assert client.pttl(key) == -1
+
+    client.delete(key)
+    store.close()
@@ -0,0 +1,178 @@
+import stat
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from feast import Feature, FeatureView, FileSource, ValueType
+from feast.infra.online_stores import snapshot
+from feast.infra.online_stores.snapshot import (
+    SnapshotOnlineStore,
+    SnapshotOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[
+        Feature(name="trips", dtype=ValueType.INT64),
+        Feature(name="rating", dtype=ValueType.DOUBLE),
+    ],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+@pytest.fixture
+def data_dir():
+    with TemporaryDirectory() as data_dir:
+        yield data_dir
+
+
+def _repo_config(data_dir, **online_store_options):
+    return RepoConfig(
+        registry=str(Path(data_dir) / "registry.db"),
+        project="test",
+        provider="local",
+        online_store=SnapshotOnlineStoreConfig(
+            path=str(Path(data_dir) / "online_snapshots"), **online_store_options
+        ),
+    )
+
+
+def test_readers_see_replaced_snapshots(data_dir):
+    config = _repo_config(data_dir)
+    store = SnapshotOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    event_ts = datetime(2021, 1, 1)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=1)}, event_ts, None)],
+        None,
+    )
+
+    # Another reader keeps the snapshot mapped while it is replaced
+    reader = SnapshotOnlineStore()
+    assert reader.online_read(config, FEATURE_VIEW, [_entity_key(1)]) == [
+        (event_ts, {"trips": ValueProto(int64_val=1)})
+    ]
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=10)}, event_ts, None)],
+        None,
+    )
+    assert reader.online_read(config, FEATURE_VIEW, [_entity_key(1)]) == [
+        (event_ts, {"trips": ValueProto(int64_val=10)})
+    ]
+    snapshot_path = Path(config.online_store.path) / "test_driver_stats.snapshot"
+    assert list(Path(config.online_store.path).iterdir()) == [snapshot_path]
+    # Snapshots can be read by other users, e.g. those of serving processes
+    assert stat.S_IMODE(snapshot_path.stat().st_mode) == 0o644
+
+    store.teardown(config, [FEATURE_VIEW], [])
+    assert reader.online_read(config, FEATURE_VIEW, [_entity_key(1)]) == [(None, None)]
+    store.close()
+    reader.close()
+
+
+def test_hash_collisions(data_dir, monkeypatch):
+    # Entities whose hashes collide are told apart by their entity keys
+    monkeypatch.setattr(snapshot, "_hash", lambda entity_key_bin: len(entity_key_bin))
+    config = _repo_config(data_dir)
+    store = SnapshotOnlineStore()
+    event_ts = datetime(2021, 1, 1)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {"trips": ValueProto(int64_val=driver)},
+                event_ts,
+                None,
+            )
+            for driver in range(0, 100, 2)
+        ],
+        None,
+    )
+    assert store.online_read(
+        config, FEATURE_VIEW, [_entity_key(driver) for driver in range(100)]
+    ) == [
+        (event_ts, {"trips": ValueProto(int64_val=driver)})
+        if driver % 2 == 0
+        else (None, None)
+        for driver in range(100)
+    ]
+
+
+def test_write_batch_copies_rows_which_are_not_written(data_dir, monkeypatch):
+    config = _repo_config(data_dir)
+    store = SnapshotOnlineStore()
+    event_ts = datetime(2021, 1, 1)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {
+                    "trips": ValueProto(int64_val=driver),
+                    "rating": ValueProto(double_val=driver / 10),
+                },
+                event_ts,
+                None,
+            )
+            for driver in range(1000)
+        ],
+        None,
+    )
+
+    # Every write rewrites the snapshot once, without parsing the values of the rows it copies
+    written_rows = []
+    write_snapshot = snapshot._write_snapshot
+    monkeypatch.setattr(
+        snapshot,
+        "_write_snapshot",
+        lambda path, rows: written_rows.append(len(rows)) or write_snapshot(path, rows),
+    )
+    parsed_values = []
+    monkeypatch.setattr(
+        snapshot, "ValueProto", lambda: parsed_values.append(1) or ValueProto()
+    )
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=-1)}, event_ts, None)],
+        None,
+    )
+    assert written_rows == [1000]
+    assert parsed_values == []
+
+    monkeypatch.undo()
+    assert store.online_read(
+        config, FEATURE_VIEW, [_entity_key(driver) for driver in [1, 999]]
+    ) == [
+        (
+            event_ts,
+            {"trips": ValueProto(int64_val=-1), "rating": ValueProto(double_val=0.1)},
+        ),
+        (
+            event_ts,
+            {
+                "trips": ValueProto(int64_val=999),
+                "rating": ValueProto(double_val=99.9),
+            },
+        ),
+    ]
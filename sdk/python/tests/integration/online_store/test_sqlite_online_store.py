@@ -0,0 +1,378 @@
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from feast import Feature, FeatureView, FileSource, ValueType
+from feast.errors import ReservedFeatureNameError
+from feast.infra.online_stores.sqlite import (
+    SQLITE_MAX_VARIABLES,
+    SqliteOnlineStore,
+    SqliteOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[
+        Feature(name="trips", dtype=ValueType.INT64),
+        Feature(name="rating", dtype=ValueType.DOUBLE),
+    ],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+def _repo_config(data_dir, **online_store_options):
+    return RepoConfig(
+        registry=str(Path(data_dir) / "registry.db"),
+        project="test",
+        provider="local",
+        online_store=SqliteOnlineStoreConfig(
+            path=str(Path(data_dir) / "online_store.db"), **online_store_options
+        ),
+    )
+
+
+@pytest.fixture
+def data_dir():
+    with TemporaryDirectory() as data_dir:
+        yield data_dir
+
+
+@pytest.mark.parametrize("table_layout", ["narrow", "wide"])
+def test_online_write_batch_upserts_rows(data_dir, table_layout):
+    config = _repo_config(data_dir, table_layout=table_layout)
+    store = SqliteOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+
+    first_write = datetime(2021, 1, 1)
+    second_write = datetime(2021, 1, 2)
+    progress = []
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {
+                    "trips": ValueProto(int64_val=driver),
+                    "rating": ValueProto(double_val=1.0),
+                },
+                first_write,
+                None,
+            )
+            for driver in range(3)
+        ],
+        progress.append,
+    )
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(1),
+                {"trips": ValueProto(int64_val=10)},
+                second_write,
+                second_write,
+            )
+        ],
+        progress.append,
+    )
+    assert progress == [3, 1]
+
+    result = store.online_read(
+        config, FEATURE_VIEW, [_entity_key(driver) for driver in range(4)]
+    )
+    assert result[0] == (
+        first_write,
+        {"trips": ValueProto(int64_val=0), "rating": ValueProto(double_val=1.0)},
+    )
+    assert result[1][1] == {
+        "trips": ValueProto(int64_val=10),
+        "rating": ValueProto(double_val=1.0),
+    }
+    assert result[3] == (None, None)
+
+    store.teardown(config, [FEATURE_VIEW], [])
+
+
+def test_pragmas(data_dir):
+    config = _repo_config(
+        data_dir,
+        journal_mode="wal",
+        synchronous="normal",
+        page_size=8192,
+        cache_size=-4096,
+        mmap_size=1 << 20,
+    )
+    store = SqliteOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+
+    conn = store._get_conn(config)
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert conn.execute("PRAGMA synchronous").fetchone() == (1,)
+    assert conn.execute("PRAGMA page_size").fetchone() == (8192,)
+    assert conn.execute("PRAGMA cache_size").fetchone() == (-4096,)
+    store.close()
+
+    # The journal mode is persisted in the database file
+    conn = sqlite3.connect(config.online_store.path)
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    conn.close()
+
+
+@pytest.mark.parametrize("table_layout", ["narrow", "wide"])
+def test_online_read_chunks_entity_keys(data_dir, table_layout):
+    config = _repo_config(data_dir, table_layout=table_layout)
+    store = SqliteOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+
+    event_ts = datetime(2021, 1, 1)
+    num_drivers = 2 * SQLITE_MAX_VARIABLES + 1
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(driver),
+                {
+                    "trips": ValueProto(int64_val=driver),
+                    "rating": ValueProto(double_val=driver / 2),
+                },
+                event_ts,
+                None,
+            )
+            for driver in range(num_drivers)
+        ],
+        None,
+    )
+
+    # Keys are read in reverse order, with duplicates and missing keys
+    drivers = list(reversed(range(num_drivers + 5))) + [0, 1]
+    result = store.online_read(
+        config,
+        FEATURE_VIEW,
+        [_entity_key(driver) for driver in drivers],
+        requested_features=["trips"],
+    )
+    assert len(result) == len(drivers)
+    for driver, row in zip(drivers, result):
+        if driver < num_drivers:
+            assert row == (event_ts, {"trips": ValueProto(int64_val=driver)})
+        else:
+            assert row == (None, None)
+
+    store.teardown(config, [FEATURE_VIEW], [])
+
+
+def test_wide_layout_adds_feature_columns(data_dir):
+    config = _repo_config(data_dir, table_layout="wide")
+    store = SqliteOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+
+    event_ts = datetime(2021, 1, 1)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=1)}, event_ts, None)],
+        None,
+    )
+
+    updated_feature_view = FeatureView(
+        name=FEATURE_VIEW.name,
+        entities=FEATURE_VIEW.entities,
+        ttl=FEATURE_VIEW.ttl,
+        features=FEATURE_VIEW.features
+        + [Feature(name="vehicle type", dtype=ValueType.STRING)],
+        batch_source=FEATURE_VIEW.batch_source,
+    )
+    store.update(config, [], [updated_feature_view], [], [], partial=False)
+    store.online_write_batch(
+        config,
+        updated_feature_view,
+        [
+            (
+                _entity_key(1),
+                {"vehicle type": ValueProto(string_val="car")},
+                event_ts,
+                None,
+            )
+        ],
+        None,
+    )
+
+    assert store.online_read(config, updated_feature_view, [_entity_key(1)]) == [
+        (
+            event_ts,
+            {
+                "trips": ValueProto(int64_val=1),
+                "vehicle type": ValueProto(string_val="car"),
+            },
+        )
+    ]
+    assert store.online_read(
+        config, updated_feature_view, [_entity_key(1)], requested_features=["rating"]
+    ) == [(None, None)]
+
+    store.teardown(config, [updated_feature_view], [])
+
+
+def test_wide_layout_rejects_reserved_feature_names(data_dir):
+    feature_view = FeatureView(
+        name="driver_events",
+        entities=["driver"],
+        ttl=timedelta(days=1),
+        features=[
+            Feature(name="trips", dtype=ValueType.INT64),
+            Feature(name="Event_TS", dtype=ValueType.UNIX_TIMESTAMP),
+        ],
+        batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+    )
+    store = SqliteOnlineStore()
+    with pytest.raises(ReservedFeatureNameError, match="Event_TS"):
+        store.update(
+            _repo_config(data_dir, table_layout="wide"),
+            [],
+            [feature_view],
+            [],
+            [],
+            partial=False,
+        )
+    # The narrow layout stores feature names as values
+    store.update(_repo_config(data_dir), [], [feature_view], [], [], partial=False)
+
+
+def test_connections_are_per_thread(data_dir):
+    config = _repo_config(data_dir)
+    store = SqliteOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+
+    event_ts = datetime(2021, 1, 1)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=1)}, event_ts, None)],
+        None,
+    )
+
+    def read(_):
+        return store.online_read(config, FEATURE_VIEW, [_entity_key(1)])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(read, range(100)))
+        assert 1 < len(store._conns) <= 5
+    assert results == [[(event_ts, {"trips": ValueProto(int64_val=1)})]] * 100
+
+    store.close()
+    assert store._conns == []
+    assert read(None) == results[0]
+
+    store.teardown(config, [FEATURE_VIEW], [])
+
+
+def test_connections_of_exited_threads_are_closed(data_dir):
+    config = _repo_config(data_dir)
+    store = SqliteOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    conns = list(store._conns)
+
+    def read():
+        conns.append(store._get_conn(config))
+        store.online_read(config, FEATURE_VIEW, [_entity_key(1)])
+
+    for _ in range(20):
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+    # Only the connection of this thread is left
+    assert store._conns == conns[:1]
+    with pytest.raises(sqlite3.ProgrammingError):
+        conns[-1].execute("SELECT 1")
+
+    store.teardown(config, [FEATURE_VIEW], [])
+
+
+def test_async_reads_share_one_executor(data_dir):
+    config = _repo_config(data_dir)
+    store = SqliteOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+
+    def read(_):
+        # Each thread runs its own event loop
+        return asyncio.run(
+            store.online_read_async(config, FEATURE_VIEW, [_entity_key(1)])
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(read, range(32)))
+    assert results == [[(None, None)]] * 32
+    executor = store._async_read_executor
+    assert executor is not None
+    assert store._get_async_read_executor(config) is executor
+
+    store.close()
+    assert store._async_read_executor is None
+
+    store.teardown(config, [FEATURE_VIEW], [])
+
+
+@pytest.mark.parametrize("connection_mode", ["read_only", "immutable"])
+def test_read_only_connection_modes(data_dir, connection_mode):
+    config = _repo_config(data_dir, journal_mode="wal")
+    writer = SqliteOnlineStore()
+    writer.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    event_ts = datetime(2021, 1, 1)
+    writer.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [(_entity_key(1), {"trips": ValueProto(int64_val=1)}, event_ts, None)],
+        None,
+    )
+    if connection_mode == "immutable":
+        # Immutable connections ignore the write-ahead log, which is checkpointed when the writer is closed
+        writer.close()
+
+    reader_config = _repo_config(
+        data_dir, journal_mode="wal", connection_mode=connection_mode
+    )
+    reader = SqliteOnlineStore()
+    assert reader.online_read(reader_config, FEATURE_VIEW, [_entity_key(1)]) == [
+        (event_ts, {"trips": ValueProto(int64_val=1)})
+    ]
+    with pytest.raises(sqlite3.OperationalError):
+        reader.online_write_batch(
+            reader_config,
+            FEATURE_VIEW,
+            [(_entity_key(2), {"trips": ValueProto(int64_val=2)}, event_ts, None)],
+            None,
+        )
+
+    if connection_mode == "read_only":
+        # Read-only connections see features written after they were opened
+        writer.online_write_batch(
+            config,
+            FEATURE_VIEW,
+            [(_entity_key(2), {"trips": ValueProto(int64_val=2)}, event_ts, None)],
+            None,
+        )
+        assert reader.online_read(reader_config, FEATURE_VIEW, [_entity_key(2)]) == [
+            (event_ts, {"trips": ValueProto(int64_val=2)})
+        ]
+
+    reader.close()
+    writer.teardown(config, [FEATURE_VIEW], [])
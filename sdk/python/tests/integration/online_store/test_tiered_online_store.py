@@ -0,0 +1,273 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from feast import Entity, Feature, FeatureView, FileSource, ValueType
+from feast.feature_store import FeatureStore
+from feast.infra.caching_provider import _TinyLfu
+from feast.infra.online_stores.tiered import (
+    HotTierConfig,
+    TieredOnlineStore,
+    TieredOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver"],
+    ttl=timedelta(days=1),
+    features=[
+        Feature(name="trips", dtype=ValueType.INT64),
+        Feature(name="rating", dtype=ValueType.DOUBLE),
+    ],
+    batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+)
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+def _row(driver):
+    return (
+        _entity_key(driver),
+        {"trips": ValueProto(int64_val=driver), "rating": ValueProto(double_val=1.0)},
+        datetime(2021, 1, 1),
+        None,
+    )
+
+
+@pytest.fixture
+def data_dir():
+    with TemporaryDirectory() as data_dir:
+        yield data_dir
+
+
+def _repo_config(data_dir, **hot_tier_options):
+    return RepoConfig(
+        registry=str(Path(data_dir) / "registry.db"),
+        project="test",
+        provider="local",
+        online_store=TieredOnlineStoreConfig(
+            remote={"type": "sqlite", "path": str(Path(data_dir) / "online.db")},
+            hot_tier=HotTierConfig(**hot_tier_options),
+        ),
+    )
+
+
+def test_online_read_and_write(data_dir):
+    config = _repo_config(data_dir)
+    store = TieredOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    store.online_write_batch(
+        config, FEATURE_VIEW, [_row(driver) for driver in range(3)], None
+    )
+    remote, remote_config = store._get_remote(config)
+
+    # Rows written through the store are served by the hot tier
+    entity_keys = [_entity_key(driver) for driver in range(4)]
+    expected = [_row(driver)[2:0:-1] for driver in range(3)] + [(None, None)]
+    assert store.online_read(config, FEATURE_VIEW, entity_keys[:3]) == expected[:3]
+    stats = store.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (3, 0, 3)
+    assert store.tier_stats()["remote"].reads == 0
+
+    # Missing rows are read from the remote tier, and the rows it holds are put into the hot tier, where they also
+    # serve requests of some of their features
+    remote.online_write_batch(remote_config, FEATURE_VIEW, [_row(3)], None)
+    assert store.online_read(config, FEATURE_VIEW, entity_keys) == expected[:3] + [
+        _row(3)[2:0:-1]
+    ]
+    assert store.online_read(config, FEATURE_VIEW, entity_keys[3:], ["rating"]) == [
+        (datetime(2021, 1, 1), {"rating": ValueProto(double_val=1.0)})
+    ]
+    stats = store.cache_stats()
+    assert (stats.hits, stats.misses) == (7, 1)
+    tier_stats = store.tier_stats()
+    assert (tier_stats["hot"].reads, tier_stats["hot"].rows) == (3, 8)
+    assert (tier_stats["remote"].reads, tier_stats["remote"].rows) == (1, 1)
+    assert tier_stats["remote"].max_latency_seconds > 0
+
+    # Writing some of the features of a row invalidates the hot tier rather than writing through
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                _entity_key(0),
+                {"trips": ValueProto(int64_val=10)},
+                datetime(2021, 1, 1),
+                None,
+            )
+        ],
+        None,
+    )
+    assert store.online_read(config, FEATURE_VIEW, entity_keys[:1]) == [
+        (
+            datetime(2021, 1, 1),
+            {"trips": ValueProto(int64_val=10), "rating": ValueProto(double_val=1.0)},
+        )
+    ]
+    assert store.cache_stats().misses == 2
+
+    # The remote tier remains the source of truth
+    store.close()
+    assert store.cache_stats().size == 0
+    assert store.online_read(config, FEATURE_VIEW, entity_keys[1:]) == expected[1:3] + [
+        _row(3)[2:0:-1]
+    ]
+    assert store.tier_stats()["remote"].rows == 3
+
+    store.teardown(config, [FEATURE_VIEW], [])
+    assert store.cache_stats().size == 0
+    store.close()
+
+
+def test_online_read_many(data_dir):
+    config = _repo_config(data_dir)
+    other_view = FeatureView(
+        name="driver_ratings",
+        entities=["driver"],
+        ttl=timedelta(days=1),
+        features=[Feature(name="rating", dtype=ValueType.DOUBLE)],
+        batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+    )
+    store = TieredOnlineStore()
+    store.update(config, [], [FEATURE_VIEW, other_view], [], [], partial=False)
+    store.online_write_batch(config, FEATURE_VIEW, [_row(0)], None)
+    remote, remote_config = store._get_remote(config)
+    remote.online_write_batch(
+        remote_config,
+        other_view,
+        [
+            (
+                _entity_key(driver),
+                {"rating": ValueProto(double_val=2.0)},
+                datetime(2021, 1, 1),
+                None,
+            )
+            for driver in range(2)
+        ],
+        None,
+    )
+
+    # Rows missing from the hot tier are read from the remote tier in a single read, for the entities missing
+    # from any of the feature views
+    entity_keys = [_entity_key(driver) for driver in range(2)]
+    rating = (datetime(2021, 1, 1), {"rating": ValueProto(double_val=2.0)})
+    assert store.online_read_many(
+        config, [(FEATURE_VIEW, None), (other_view, ["rating"])], entity_keys
+    ) == [[_row(0)[2:0:-1], (None, None)], [rating, rating]]
+    stats = store.cache_stats()
+    assert (stats.hits, stats.misses) == (1, 3)
+    assert store.tier_stats()["remote"].reads == 1
+
+    assert store.online_read_many(
+        config, [(FEATURE_VIEW, None), (other_view, ["rating"])], entity_keys
+    ) == [[_row(0)[2:0:-1], (None, None)], [rating, rating]]
+    assert store.cache_stats().hits == 5
+    assert store.tier_stats()["remote"].reads == 1
+    store.close()
+
+
+def test_remote_is_shared_by_threads(data_dir):
+    config = _repo_config(data_dir)
+    store = TieredOnlineStore()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        remotes = list(executor.map(lambda _: store._get_remote(config)[0], range(64)))
+    assert all(remote is remotes[0] for remote in remotes)
+    store.close()
+
+
+def test_feature_view_ttl(data_dir):
+    config = _repo_config(data_dir, feature_view_ttl_seconds={"driver_stats": 0})
+    store = TieredOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    store.online_write_batch(config, FEATURE_VIEW, [_row(1)], None)
+    store.online_read(config, FEATURE_VIEW, [_entity_key(1)])
+    assert store.cache_stats().size == 0
+    assert store.tier_stats()["remote"].rows == 1
+    store.close()
+
+
+def test_tinylfu_admission(data_dir):
+    config = _repo_config(data_dir, max_entries=2)
+    store = TieredOnlineStore()
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    store.online_write_batch(
+        config, FEATURE_VIEW, [_row(driver) for driver in range(10)], None
+    )
+    store.close()
+
+    # Frequently requested rows are not evicted by rows requested once
+    for _ in range(3):
+        store.online_read(config, FEATURE_VIEW, [_entity_key(0), _entity_key(1)])
+    store.online_read(
+        config, FEATURE_VIEW, [_entity_key(driver) for driver in range(2, 10)]
+    )
+    store.online_read(config, FEATURE_VIEW, [_entity_key(0), _entity_key(1)])
+    stats = store.cache_stats()
+    assert (stats.size, stats.evictions, stats.rejections, stats.hits) == (2, 0, 8, 6)
+
+    # Without admission policy, the least recently used rows are evicted
+    config = _repo_config(data_dir, max_entries=2, admission="always")
+    store = TieredOnlineStore()
+    for _ in range(3):
+        store.online_read(config, FEATURE_VIEW, [_entity_key(0), _entity_key(1)])
+    store.online_read(
+        config, FEATURE_VIEW, [_entity_key(driver) for driver in range(2, 10)]
+    )
+    store.online_read(config, FEATURE_VIEW, [_entity_key(0), _entity_key(1)])
+    stats = store.cache_stats()
+    assert (stats.evictions, stats.rejections, stats.hits) == (10, 0, 4)
+    store.close()
+
+
+def test_tinylfu_aging():
+    admission = _TinyLfu(max_entries=16)
+    for _ in range(20):
+        admission.record(b"hot")
+    assert admission.estimate(b"hot") == 15
+    assert admission.estimate(b"cold") == 0
+
+    # Counters are halved after 10 times max_entries recorded requests
+    for key in range(200):
+        admission.record(str(key).encode())
+    assert admission.estimate(b"hot") < 15
+
+
+def test_get_online_cache_and_tier_stats(data_dir):
+    store = FeatureStore(config=_repo_config(data_dir))
+    store.apply([Entity(name="driver", value_type=ValueType.INT64), FEATURE_VIEW])
+    store._get_provider().online_write_batch(
+        config=store.config,
+        table=FEATURE_VIEW,
+        data=[
+            (
+                _entity_key(1),
+                {"trips": ValueProto(int64_val=7)},
+                datetime.utcnow(),
+                None,
+            )
+        ],
+        progress=None,
+    )
+
+    result = store.get_online_features(
+        features=["driver_stats:trips"], entity_rows=[{"driver": 1}, {"driver": 2}]
+    ).to_dict()
+    assert result == {"driver": [1, 2], "trips": [7, None]}
+    store.get_online_features(
+        features=["driver_stats:trips"], entity_rows=[{"driver": 1}, {"driver": 2}]
+    )
+    stats = store.get_online_cache_stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert store.get_online_tier_stats()["remote"].rows == 2
+    store.teardown()
@@ -514,3 +514,26 @@ def test_apply_conflicting_featureview_names(feature_store_with_local_registry):
     )
 
     feature_store_with_local_registry.teardown()
+
+
+def test_provider_is_reused_until_config_changes(feature_store_with_local_registry):
+    store = feature_store_with_local_registry
+
+    provider = store._get_provider()
+    assert store._get_provider() is provider
+
+    # Replacing the config closes the provider and rebuilds it from the new config
+    _, online_store_path = mkstemp()
+    store.config = RepoConfig(
+        registry=store.config.registry,
+        project="default",
+        provider="local",
+        online_store=SqliteOnlineStoreConfig(path=online_store_path),
+    )
+    assert store._get_provider() is not provider
+
+    with store:
+        provider = store._get_provider()
+        provider.online_store._get_conn(store.config)
+    assert provider.online_store._conns == []
+    assert store._get_provider() is not provider
@@ -21,6 +21,7 @@ from pytest_lazyfixture import lazy_fixture
 from feast import FileSource
 from feast.data_format import ParquetFormat
 from feast.entity import Entity
+from feast.errors import FeatureViewNotFoundException
 from feast.feature import Feature
 from feast.feature_view import FeatureView
 from feast.protos.feast.types import Value_pb2 as ValueProto
@@ -375,3 +376,54 @@ def test_commit():
     # Will try to reload registry, which will fail because the file has been deleted
     with pytest.raises(FileNotFoundError):
         test_registry._get_registry_proto()
+
+
+def test_cached_objects_are_reused_until_registry_changes():
+    fd, registry_path = mkstemp()
+    test_registry = Registry(registry_path, None, timedelta(600))
+    project = "project"
+
+    fv1 = FeatureView(
+        name="my_feature_view_1",
+        features=[Feature(name="fs1_my_feature_1", dtype=ValueType.INT64)],
+        entities=["fs1_my_entity_1"],
+        batch_source=FileSource(path="file://feast/*", event_timestamp_column="ts"),
+        ttl=timedelta(minutes=5),
+    )
+    test_registry.apply_feature_view(fv1, project)
+
+    feature_views = test_registry.list_feature_views(project, allow_cache=True)
+    assert [fv.name for fv in feature_views] == ["my_feature_view_1"]
+    assert (
+        test_registry.get_feature_view("my_feature_view_1", project, allow_cache=True)
+        is feature_views[0]
+    )
+
+    # Refreshing the registry without changing it keeps the deserialized objects
+    test_registry.refresh()
+    assert (
+        test_registry.list_feature_views(project, allow_cache=True)[0]
+        is feature_views[0]
+    )
+    assert test_registry.list_feature_views("other_project", allow_cache=True) == []
+
+    # Modifying the registry in memory invalidates them, even before committing
+    fv2 = FeatureView(
+        name="my_feature_view_2",
+        features=[Feature(name="fs1_my_feature_1", dtype=ValueType.INT64)],
+        entities=["fs1_my_entity_1"],
+        batch_source=FileSource(path="file://feast/*", event_timestamp_column="ts"),
+        ttl=timedelta(minutes=5),
+    )
+    test_registry.apply_feature_view(fv2, project, commit=False)
+    feature_views = test_registry.list_feature_views(project, allow_cache=True)
+    assert [fv.name for fv in feature_views] == [
+        "my_feature_view_1",
+        "my_feature_view_2",
+    ]
+
+    test_registry.delete_feature_view("my_feature_view_1", project)
+    with pytest.raises(FeatureViewNotFoundException):
+        test_registry.get_feature_view("my_feature_view_1", project, allow_cache=True)
+
+    test_registry.teardown()
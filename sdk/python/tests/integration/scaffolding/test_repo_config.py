@@ -177,3 +177,123 @@ def test_invalid_project_name():
         ),
         expect_error="alphanumerical values ",
     )
+
+
+def test_online_serving_config():
+    c = _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        """
+        ),
+        expect_error=None,
+    )
+    assert c.online_serving.read_mode == "sequential"
+
+    c = _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_serving:
+            read_mode: concurrent
+            max_concurrent_reads: 4
+        """
+        ),
+        expect_error=None,
+    )
+    assert c.online_serving.read_mode == "concurrent"
+    assert c.online_serving.max_concurrent_reads == 4
+
+    _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_serving:
+            read_mode: parallel
+        """
+        ),
+        expect_error="read_mode",
+    )
+
+
+def test_online_cache_config():
+    c = _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_serving:
+            cache:
+                max_entries: 1000
+                ttl_seconds: 30
+        """
+        ),
+        expect_error=None,
+    )
+    assert c.online_serving.cache.max_entries == 1000
+    assert c.online_serving.cache.ttl_seconds == 30
+    assert c.online_serving.cache.negative_ttl_seconds == 5
+
+    _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_serving:
+            cache:
+                negative_ttl_seconds: -1
+        """
+        ),
+        expect_error="negative_ttl_seconds must not be negative",
+    )
+
+
+def test_tiered_online_store_config():
+    c = _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_store:
+            type: tiered
+            remote:
+                type: sqlite
+                path: "online_store.db"
+            hot_tier:
+                max_entries: 1000
+                feature_view_ttl_seconds:
+                    driver_stats: 10
+        """
+        ),
+        expect_error=None,
+    )
+    assert isinstance(c.online_store.remote, SqliteOnlineStoreConfig)
+    assert c.online_store.remote.path == "online_store.db"
+    assert c.online_store.hot_tier.max_entries == 1000
+    assert c.online_store.hot_tier.ttl_seconds == 60
+    assert c.online_store.hot_tier.feature_view_ttl_seconds == {"driver_stats": 10}
+    assert c.online_store.hot_tier.admission == "tinylfu"
+
+    _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_store:
+            type: tiered
+            remote:
+                path: "online_store.db"
+        """
+        ),
+        expect_error="The type of the remote online store must be set",
+    )
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pyarrow as pa
+
+from feast import FileSource
+from feast.feature import Feature
+from feast.feature_view import FeatureView
+from feast.infra.provider import _convert_arrow_to_proto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.value_type import ValueType
+from tests.utils.arrow_conversion_benchmark import convert_arrow_to_proto_row_by_row
+
+FEATURES = [
+    Feature(name="int32", dtype=ValueType.INT32),
+    Feature(name="int64", dtype=ValueType.INT64),
+    Feature(name="float", dtype=ValueType.FLOAT),
+    Feature(name="double", dtype=ValueType.DOUBLE),
+    Feature(name="string", dtype=ValueType.STRING),
+    Feature(name="bytes", dtype=ValueType.BYTES),
+    Feature(name="bool", dtype=ValueType.BOOL),
+    Feature(name="timestamp", dtype=ValueType.UNIX_TIMESTAMP),
+    Feature(name="int64_list", dtype=ValueType.INT64_LIST),
+    Feature(name="string_list", dtype=ValueType.STRING_LIST),
+]
+
+
+def _feature_view(features, created_timestamp_column="created"):
+    return FeatureView(
+        name="stats",
+        entities=["driver", "customer"],
+        features=features,
+        batch_source=FileSource(
+            path="data.parquet",
+            event_timestamp_column="event_timestamp",
+            created_timestamp_column=created_timestamp_column,
+        ),
+        ttl=timedelta(hours=2),
+    )
+
+
+def _table():
+    now = datetime(2021, 1, 1)
+    return pa.Table.from_pydict(
+        {
+            "driver": pa.array([1, 2, 3], pa.int64()),
+            "customer": pa.array(["a", "b", "c"]),
+            "int32": pa.array([1, None, 3], pa.int32()),
+            "int64": pa.array([1, 2, 3], pa.int64()),
+            "float": pa.array([0.5, float("nan"), None], pa.float32()),
+            "double": pa.array([0.25, 1.0, float("nan")], pa.float64()),
+            "string": pa.array(["x", None, "z"]),
+            "bytes": pa.array([b"x", b"y", None]),
+            "bool": pa.array([True, False, None]),
+            "timestamp": pa.array(
+                [now, now + timedelta(seconds=1), None], pa.timestamp("us")
+            ),
+            "int64_list": pa.array([[1, 2], [3], [4, 5, 6]], pa.list_(pa.int64())),
+            "string_list": pa.array([["a"], ["b", "c"], ["d"]]),
+            "event_timestamp": pa.array(
+                pd.date_range(now, periods=3, freq="S", tz="UTC"),
+                pa.timestamp("ns", tz="UTC"),
+            ),
+            "created": pa.array([now] * 3, pa.timestamp("us")),
+        }
+    )
+
+
+def test_convert_arrow_to_proto():
+    table = _table()
+    feature_view = _feature_view(FEATURES)
+    rows = _convert_arrow_to_proto(table, feature_view, ["driver", "customer"])
+    assert rows == convert_arrow_to_proto_row_by_row(
+        table, feature_view, ["driver", "customer"]
+    )
+
+    entity_key, features, event_timestamp, created_timestamp = rows[1]
+    assert list(entity_key.join_keys) == ["driver", "customer"]
+    assert list(entity_key.entity_values) == [
+        ValueProto(int64_val=2),
+        ValueProto(string_val="b"),
+    ]
+    # Values are converted according to their arrow type, and nulls and NaNs to empty values
+    assert features["int32"] == ValueProto()
+    assert features["int64"] == ValueProto(int64_val=2)
+    assert features["float"] == ValueProto()
+    assert features["double"] == ValueProto(double_val=1.0)
+    assert features["string"] == ValueProto()
+    assert features["bytes"] == ValueProto(bytes_val=b"y")
+    assert features["bool"] == ValueProto(bool_val=False)
+    assert type(event_timestamp) is datetime
+    assert created_timestamp == datetime(2021, 1, 1)
+
+
+def test_convert_arrow_to_proto_without_features():
+    table = _table()
+    feature_view = _feature_view([], created_timestamp_column="")
+    rows = _convert_arrow_to_proto(table, feature_view, ["driver"])
+    assert rows == convert_arrow_to_proto_row_by_row(table, feature_view, ["driver"])
+    assert [(features, created_ts) for _, features, _, created_ts in rows] == [
+        ({}, None)
+    ] * 3
@@ -0,0 +1,378 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_dynamodb
+
+from feast import Feature, FeatureView, FileSource, ValueType
+from feast.errors import DynamoDBRetriesExhaustedError
+from feast.infra.online_stores.dynamodb import (
+    DYNAMODB_MAX_ATTEMPTS,
+    DynamoDBOnlineStore,
+    DynamoDBOnlineStoreConfig,
+    _AimdConcurrencyLimiter,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+REGION = "us-west-2"
+
+
+@pytest.fixture(params=["values_map", "attributes"])
+def repo_config(monkeypatch, request):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_dynamodb():
+        yield RepoConfig(
+            registry="registry.db",
+            project="test",
+            provider="local",
+            online_store=DynamoDBOnlineStoreConfig(
+                region=REGION, item_layout=request.param
+            ),
+        )
+
+
+def _feature_view(name):
+    return FeatureView(
+        name=name,
+        entities=["driver"],
+        ttl=timedelta(days=1),
+        features=[Feature(name="value", dtype=ValueType.INT64)],
+        batch_source=FileSource(path="driver.parquet", event_timestamp_column="ts"),
+    )
+
+
+def _entity_key(driver):
+    return EntityKeyProto(
+        join_keys=["driver"], entity_values=[ValueProto(int64_val=driver)]
+    )
+
+
+def test_online_read_many(repo_config):
+    store = DynamoDBOnlineStore()
+    tables = [_feature_view("a"), _feature_view("b")]
+    store.update(repo_config, [], tables, [], [], partial=False)
+
+    now = datetime.utcnow()
+    for table_idx, table in enumerate(tables):
+        store.online_write_batch(
+            repo_config,
+            table,
+            [
+                (
+                    _entity_key(driver),
+                    {"value": ValueProto(int64_val=driver * 10 + table_idx)},
+                    now,
+                    None,
+                )
+                # Only even drivers have values for the second table
+                for driver in range(150)
+                if table_idx == 0 or driver % 2 == 0
+            ],
+            None,
+        )
+
+    # More keys than a single BatchGetItem request can read, including duplicates and missing keys
+    entity_keys = [_entity_key(driver) for driver in [3, 3] + list(range(100, 200))]
+    result = store.online_read_many(
+        repo_config, [(table, None) for table in tables], entity_keys
+    )
+
+    assert len(result) == 2
+    assert result[0] == store.online_read(repo_config, tables[0], entity_keys)
+    for table_idx, table_result in enumerate(result):
+        assert len(table_result) == len(entity_keys)
+        for entity_key, (_, features) in zip(entity_keys, table_result):
+            driver = entity_key.entity_values[0].int64_val
+            if driver < 150 and (table_idx == 0 or driver % 2 == 0):
+                assert features == {
+                    "value": ValueProto(int64_val=driver * 10 + table_idx)
+                }
+            else:
+                assert features is None
+
+
+def test_online_read_requested_features(repo_config):
+    store = DynamoDBOnlineStore()
+    table = _feature_view("a")
+    store.update(repo_config, [], [table], [], [], partial=False)
+    store.online_write_batch(
+        repo_config,
+        table,
+        [
+            (
+                _entity_key(1),
+                {
+                    "value": ValueProto(int64_val=1),
+                    "values": ValueProto(string_val="reserved word"),
+                    "other": ValueProto(int64_val=2),
+                },
+                datetime.utcnow(),
+                None,
+            )
+        ],
+        None,
+    )
+
+    entity_keys = [_entity_key(1), _entity_key(2)]
+    assert [
+        features
+        for _, features in store.online_read(
+            repo_config, table, entity_keys, ["values", "value"]
+        )
+    ] == [
+        {
+            "value": ValueProto(int64_val=1),
+            "values": ValueProto(string_val="reserved word"),
+        },
+        None,
+    ]
+    (event_ts, features), _ = store.online_read(
+        repo_config, table, entity_keys, ["missing"]
+    )
+    assert event_ts is not None
+    assert features == {}
+
+
+def test_online_read_retries_unprocessed_keys(repo_config, monkeypatch):
+    store = DynamoDBOnlineStore()
+    table = _feature_view("a")
+    store.update(repo_config, [], [table], [], [], partial=False)
+    now = datetime.utcnow()
+    store.online_write_batch(
+        repo_config,
+        table,
+        [
+            (_entity_key(driver), {"value": ValueProto(int64_val=driver)}, now, None)
+            for driver in range(250)
+        ],
+        None,
+    )
+
+    # Every request initially leaves half of its keys unprocessed, as DynamoDB does when throughput is exceeded
+    client, _ = store._initialize_dynamodb(repo_config.online_store)
+    batch_get_item = client.batch_get_item
+    unprocessed_requests = []
+
+    def throttled_batch_get_item(RequestItems):
+        if any(RequestItems is request for request in unprocessed_requests):
+            return batch_get_item(RequestItems=RequestItems)
+        processed, unprocessed = {}, {}
+        for table_name, request in RequestItems.items():
+            half = len(request["Keys"]) // 2
+            processed[table_name] = {**request, "Keys": request["Keys"][:half]}
+            unprocessed[table_name] = {**request, "Keys": request["Keys"][half:]}
+        unprocessed_requests.append(unprocessed)
+        response = batch_get_item(RequestItems=processed)
+        return {**response, "UnprocessedKeys": unprocessed}
+
+    delays = []
+    monkeypatch.setattr(client, "batch_get_item", throttled_batch_get_item)
+    monkeypatch.setattr("feast.infra.online_stores.dynamodb.time.sleep", delays.append)
+
+    entity_keys = [_entity_key(driver) for driver in range(250)]
+    result = store.online_read(repo_config, table, entity_keys)
+    assert [features for _, features in result] == [
+        {"value": ValueProto(int64_val=driver)} for driver in range(250)
+    ]
+    assert len(unprocessed_requests) == 3
+    assert len(delays) == 3
+
+    store.close()
+
+
+@pytest.mark.parametrize("repo_config", ["values_map"], indirect=True)
+def test_online_read_gives_up_on_unprocessed_keys(repo_config, monkeypatch):
+    store = DynamoDBOnlineStore()
+    table = _feature_view("a")
+    store.update(repo_config, [], [table], [], [], partial=False)
+
+    # DynamoDB never processes any key
+    client, _ = store._initialize_dynamodb(repo_config.online_store)
+    requests = []
+
+    def throttled_batch_get_item(RequestItems):
+        requests.append(RequestItems)
+        return {"Responses": {}, "UnprocessedKeys": RequestItems}
+
+    monkeypatch.setattr(client, "batch_get_item", throttled_batch_get_item)
+    monkeypatch.setattr("feast.infra.online_stores.dynamodb.time.sleep", lambda _: None)
+
+    with pytest.raises(DynamoDBRetriesExhaustedError, match="test.a"):
+        store.online_read(repo_config, table, [_entity_key(1)])
+    assert len(requests) == DYNAMODB_MAX_ATTEMPTS
+
+    store.close()
+
+
+@pytest.mark.parametrize("repo_config", ["values_map"], indirect=True)
+def test_clients_are_shared_by_threads(repo_config):
+    store = DynamoDBOnlineStore()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(
+            executor.map(
+                lambda _: store._initialize_dynamodb(repo_config.online_store),
+                range(32),
+            )
+        )
+    assert len({id(client) for client, _ in clients}) == 1
+    assert len({id(resource) for _, resource in clients}) == 1
+
+    store.close()
+    assert store._initialize_dynamodb(repo_config.online_store) != clients[0]
+
+
+def test_online_write_batch_is_throttled(repo_config, monkeypatch):
+    store = DynamoDBOnlineStore()
+    table = _feature_view("a")
+    store.update(repo_config, [], [table], [], [], partial=False)
+
+    # Every other request is throttled, and the first item of the others is left unprocessed
+    client, _ = store._initialize_dynamodb(repo_config.online_store)
+    batch_write_item = client.batch_write_item
+    num_requests = [0]
+
+    def throttled_batch_write_item(RequestItems):
+        num_requests[0] += 1
+        if num_requests[0] % 2:
+            raise ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException"}},
+                "BatchWriteItem",
+            )
+        ((table_name, write_requests),) = RequestItems.items()
+        if len(write_requests) == 1:
+            return batch_write_item(RequestItems=RequestItems)
+        response = batch_write_item(RequestItems={table_name: write_requests[1:]})
+        return {**response, "UnprocessedItems": {table_name: write_requests[:1]}}
+
+    monkeypatch.setattr(client, "batch_write_item", throttled_batch_write_item)
+    monkeypatch.setattr("feast.infra.online_stores.dynamodb.time.sleep", lambda _: None)
+
+    now = datetime.utcnow()
+    progress = []
+    store.online_write_batch(
+        repo_config,
+        table,
+        [
+            (_entity_key(driver), {"value": ValueProto(int64_val=driver)}, now, None)
+            for driver in range(100)
+        ]
+        # Only the last row of an entity is written
+        + [(_entity_key(0), {"value": ValueProto(int64_val=-1)}, now, None)],
+        progress.append,
+    )
+    assert sum(progress) == 101
+
+    result = store.online_read(
+        repo_config, table, [_entity_key(driver) for driver in range(100)]
+    )
+    assert [features for _, features in result] == [
+        {"value": ValueProto(int64_val=-1 if driver == 0 else driver)}
+        for driver in range(100)
+    ]
+
+    store.close()
+
+
+@pytest.mark.parametrize("repo_config", ["values_map"], indirect=True)
+def test_online_write_batch_gives_up_when_throttled(repo_config, monkeypatch):
+    store = DynamoDBOnlineStore()
+    table = _feature_view("a")
+    store.update(repo_config, [], [table], [], [], partial=False)
+
+    # DynamoDB throttles every request
+    client, _ = store._initialize_dynamodb(repo_config.online_store)
+    batch_write_item = client.batch_write_item
+    num_requests = [0]
+
+    def throttled_batch_write_item(RequestItems):
+        num_requests[0] += 1
+        raise ClientError(
+            {"Error": {"Code": "ThrottlingException"}}, "BatchWriteItem",
+        )
+
+    monkeypatch.setattr(client, "batch_write_item", throttled_batch_write_item)
+    monkeypatch.setattr("feast.infra.online_stores.dynamodb.time.sleep", lambda _: None)
+
+    data = [
+        (_entity_key(1), {"value": ValueProto(int64_val=1)}, datetime.utcnow(), None)
+    ]
+    with pytest.raises(DynamoDBRetriesExhaustedError, match="test.a"):
+        store.online_write_batch(repo_config, table, data, None)
+    assert num_requests[0] == DYNAMODB_MAX_ATTEMPTS
+
+    # Writes reuse the executor of the store
+    executor = store._write_executor
+    assert executor is not None
+    monkeypatch.setattr(client, "batch_write_item", batch_write_item)
+    store.online_write_batch(repo_config, table, data, None)
+    assert store._write_executor is executor
+
+    store.close()
+    assert store._write_executor is None
+
+
+def test_aimd_concurrency_limiter():
+    limiter = _AimdConcurrencyLimiter(max_limit=8)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(throttled=True)
+    assert limiter.limit == 1
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 1
+
+    # The limit grows by about one per limit's worth of successful requests
+    for _ in range(1 + 2 + 3):
+        limiter.acquire()
+        limiter.release(throttled=False)
+    assert int(limiter.limit) == 3
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(throttled=False)
+    assert limiter.limit == 8
+
+
+@pytest.mark.parametrize("repo_config", ["attributes"], indirect=True)
+def test_attributes_item_layout(repo_config):
+    store = DynamoDBOnlineStore()
+    table = _feature_view("a")
+    store.update(repo_config, [], [table], [], [], partial=False)
+    store.online_write_batch(
+        repo_config,
+        table,
+        [
+            (
+                _entity_key(1),
+                {"value": ValueProto(int64_val=1), "other": ValueProto(int64_val=2)},
+                datetime.utcnow(),
+                None,
+            )
+        ],
+        None,
+    )
+
+    _, dynamodb_resource = store._initialize_dynamodb(repo_config.online_store)
+    (item,) = dynamodb_resource.Table("test.a").scan()["Items"]
+    assert set(item) == {"entity_id", "event_ts", "value", "other"}
+
+    with pytest.raises(ValueError):
+        store.update(
+            repo_config,
+            [],
+            [
+                FeatureView(
+                    name="b",
+                    entities=["driver"],
+                    ttl=timedelta(days=1),
+                    features=[Feature(name="event_ts", dtype=ValueType.INT64)],
+                    batch_source=table.batch_source,
+                )
+            ],
+            [],
+            [],
+            partial=False,
+        )
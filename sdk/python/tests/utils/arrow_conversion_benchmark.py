@@ -0,0 +1,116 @@
+import time
+from datetime import datetime, timedelta
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from feast import FileSource
+from feast.feature import Feature
+from feast.feature_view import FeatureView
+from feast.infra.provider import _coerce_datetime, _convert_arrow_to_proto
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.type_map import python_value_to_proto_value
+from feast.value_type import ValueType
+
+
+def convert_arrow_to_proto_row_by_row(table, feature_view, join_keys):
+    """
+    Row by row conversion of arrow tables, which _convert_arrow_to_proto replaced. It is the reference for the
+    output and the throughput of _convert_arrow_to_proto.
+    """
+    rows_to_write = []
+    for row in zip(*table.to_pydict().values()):
+        entity_key = EntityKeyProto()
+        for join_key in join_keys:
+            entity_key.join_keys.append(join_key)
+            idx = table.column_names.index(join_key)
+            value = python_value_to_proto_value(row[idx])
+            entity_key.entity_values.append(value)
+        feature_dict = {}
+        for feature in feature_view.features:
+            idx = table.column_names.index(feature.name)
+            value = python_value_to_proto_value(row[idx], feature.dtype)
+            feature_dict[feature.name] = value
+        event_timestamp_idx = table.column_names.index(
+            feature_view.batch_source.event_timestamp_column
+        )
+        event_timestamp = _coerce_datetime(row[event_timestamp_idx])
+
+        if feature_view.batch_source.created_timestamp_column:
+            created_timestamp_idx = table.column_names.index(
+                feature_view.batch_source.created_timestamp_column
+            )
+            created_timestamp = _coerce_datetime(row[created_timestamp_idx])
+        else:
+            created_timestamp = None
+
+        rows_to_write.append(
+            (entity_key, feature_dict, event_timestamp, created_timestamp)
+        )
+    return rows_to_write
+
+
+def create_driver_hourly_stats_feature_view():
+    return FeatureView(
+        name="driver_stats",
+        entities=["driver_id"],
+        features=[
+            Feature(name="conv_rate", dtype=ValueType.FLOAT),
+            Feature(name="acc_rate", dtype=ValueType.FLOAT),
+            Feature(name="avg_daily_trips", dtype=ValueType.INT32),
+        ],
+        batch_source=FileSource(
+            path="data.parquet",
+            event_timestamp_column="event_timestamp",
+            created_timestamp_column="created",
+        ),
+        ttl=timedelta(hours=2),
+    )
+
+
+def create_driver_hourly_stats_table(num_rows: int) -> pa.Table:
+    end_date = datetime.utcnow()
+    event_timestamps = pd.date_range(end=end_date, periods=num_rows, freq="S", tz="UTC")
+    return pa.Table.from_pandas(
+        pd.DataFrame(
+            {
+                "driver_id": np.arange(num_rows, dtype=np.int64),
+                "conv_rate": np.random.random(num_rows).astype(np.float32),
+                "acc_rate": np.random.random(num_rows).astype(np.float32),
+                "avg_daily_trips": np.random.randint(0, 1000, num_rows).astype(
+                    np.int32
+                ),
+                "event_timestamp": event_timestamps,
+                "created": pd.Timestamp(end_date, tz="UTC"),
+            }
+        ),
+        preserve_index=False,
+    )
+
+
+@click.command(name="run")
+@click.option("--rows", default=1_000_000, help="Number of rows to convert")
+def benchmark_arrow_conversion(rows: int):
+    feature_view = create_driver_hourly_stats_feature_view()
+    table = create_driver_hourly_stats_table(rows)
+    print(table.schema)
+
+    results = {}
+    for name, convert in [
+        ("row by row", convert_arrow_to_proto_row_by_row),
+        ("column by column", _convert_arrow_to_proto),
+    ]:
+        start = time.perf_counter()
+        results[name] = convert(table, feature_view, ["driver_id"])
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name}: {rows} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows per second)"
+        )
+
+    assert results["row by row"] == results["column by column"]
+
+
+if __name__ == "__main__":
+    benchmark_arrow_conversion()